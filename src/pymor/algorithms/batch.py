@@ -0,0 +1,227 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+"""Evaluation of affinely decomposed |Operators| for many |parameter values| at once.
+
+The functions in this module operate on the affine decomposition ::
+
+    op(μ) = θ_1(μ) A_1 + ... + θ_Q(μ) A_Q
+
+of a |LincombOperator| whose summands are non-parametric dense matrices, as
+is the case for most reduced |Operators| obtained by Galerkin projection.
+Instead of assembling and applying `op(μ)` for each |parameter value| separately,
+all coefficients are evaluated into a single |NumPy array| and the matrices
+are assembled, applied and inverted for all |parameter values| using stacked
+three-dimensional arrays.
+"""
+
+import numpy as np
+
+from pymor.core.defaults import defaults
+from pymor.core.exceptions import InversionError
+from pymor.operators.constructions import LincombOperator, VectorArrayOperator
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parameters.base import Parameters
+from pymor.vectorarrays.numpy import NumpyVectorArray
+
+
+def dense_affine_decomposition(op):
+    """Extract the affine decomposition of a linear combination of dense matrices.
+
+    Parameters
+    ----------
+    op
+        The |Operator| to decompose.
+
+    Returns
+    -------
+    `None` if `op` is neither a |LincombOperator| of non-parametric dense
+    |NumpyMatrixOperators| (or |VectorArrayOperators| of |NumpyVectorArrays|)
+    nor a single such operator. Otherwise, a tuple `(coefficients, matrices)`,
+    where `matrices` is a three-dimensional |NumPy array| containing the
+    stacked matrices of the summands.
+    """
+    if isinstance(op, LincombOperator):
+        operators, coefficients = op.operators, op.coefficients
+    else:
+        operators, coefficients = (op,), (1.,)
+
+    matrices = []
+    for o in operators:
+        if isinstance(o, NumpyMatrixOperator) and not o.sparse:
+            matrices.append(o.matrix)
+        elif isinstance(o, VectorArrayOperator) and isinstance(o.array, NumpyVectorArray):
+            array = o.array.to_numpy()
+            matrices.append(array.conj() if o.adjoint else array.T)
+        else:
+            return None
+
+    return coefficients, np.stack(matrices)
+
+
+def evaluate_coefficients_batch(coefficients, mus):
+    """Evaluate linear coefficients for multiple |parameter values|.
+
+    |ParameterFunctional| coefficients are evaluated using
+    :meth:`~pymor.parameters.functionals.ParameterFunctional.evaluate_many`,
+    stacking the |parameter values| only once for all coefficients.
+
+    Parameters
+    ----------
+    coefficients
+        List of linear coefficients, each either a number or a |ParameterFunctional|.
+    mus
+        List of |parameter values| for which to evaluate the coefficients or stacked
+        |parameter values| as accepted by
+        :meth:`~pymor.parameters.functionals.ParameterFunctional.evaluate_many`.
+
+    Returns
+    -------
+    |NumPy array| of shape `(len(mus), len(coefficients))`.
+    """
+    count = len(next(iter(mus.values()))) if isinstance(mus, dict) and mus else len(mus)
+    parameters = Parameters.of(*(c for c in coefficients if hasattr(c, 'evaluate')))
+    if parameters:
+        mus = parameters.stack(mus)
+    values = np.empty((count, len(coefficients)),
+                      dtype=np.result_type(*(c for c in coefficients if not hasattr(c, 'evaluate')), float))
+    for j, c in enumerate(coefficients):
+        if hasattr(c, 'evaluate'):
+            c_values = c.evaluate_many(mus)
+            if np.iscomplexobj(c_values) and not np.iscomplexobj(values):
+                values = values.astype(complex)
+            values[:, j] = c_values
+        else:
+            values[:, j] = c
+    return values
+
+
+def assemble_batch(decomposition, mus):
+    """Assemble the matrices of an affine decomposition for multiple |parameter values|.
+
+    Parameters
+    ----------
+    decomposition
+        Affine decomposition as returned by :func:`dense_affine_decomposition`.
+    mus
+        List of |parameter values| for which to assemble the matrices.
+
+    Returns
+    -------
+    |NumPy array| of shape `(len(mus),) + matrix_shape`.
+    """
+    coefficients, matrices = decomposition
+    values = evaluate_coefficients_batch(coefficients, mus)
+    return (values @ matrices.reshape((len(matrices), -1))).reshape((len(mus),) + matrices.shape[1:])
+
+
+def apply_batch(op, U, mus):
+    """Apply an |Operator| to each vector of a |VectorArray| for different |parameter values|.
+
+    Parameters
+    ----------
+    op
+        The |Operator| to apply.
+    U
+        |VectorArray| of vectors to which `op` is applied.
+    mus
+        List of |parameter values| of the same length as `U`. `op` is applied
+        to `U[i]` for |parameter values| `mus[i]`.
+
+    Returns
+    -------
+    |VectorArray| of the operator evaluations.
+    """
+    assert U in op.source
+    assert len(U) == len(mus)
+    if not op.parametric:
+        return op.apply(U)
+    decomposition = dense_affine_decomposition(op)
+    if decomposition is not None:
+        coefficients, matrices = decomposition
+        values = evaluate_coefficients_batch(coefficients, mus)
+        return op.range.make_array(np.einsum('mq,qij,mj->mi', values, matrices, U.to_numpy()))
+    V = op.range.empty(reserve=len(U))
+    for i, mu in enumerate(mus):
+        V.append(op.apply(U[i], mu=mu))
+    return V
+
+
+def as_range_array_batch(op, mus):
+    """Evaluate a vector-like |Operator| for multiple |parameter values|.
+
+    Parameters
+    ----------
+    op
+        The vector-like |Operator| to evaluate.
+    mus
+        List of |parameter values| for which to evaluate `op`.
+
+    Returns
+    -------
+    |VectorArray| containing `op.as_range_array(mu)` for all `mu` in `mus`.
+    """
+    assert op.source.dim == 1
+    if not op.parametric:
+        return op.as_range_array()[[0] * len(mus)]
+    decomposition = dense_affine_decomposition(op)
+    if decomposition is not None:
+        return op.range.make_array(assemble_batch(decomposition, mus)[..., 0])
+    V = op.range.empty(reserve=len(mus))
+    for mu in mus:
+        V.append(op.as_range_array(mu))
+    return V
+
+
+@defaults('max_chunk_size')
+def solve_batch(operator_decomposition, rhs_decomposition, mus, max_chunk_size=2**27):
+    """Solve affinely decomposed dense linear systems for multiple |parameter values|.
+
+    For each `mu` in `mus`, the system matrix and the right-hand side are assembled
+    from the given affine decompositions and the resulting linear system is solved.
+    All systems are solved with a single call of :func:`numpy.linalg.solve`. To limit
+    the memory footprint, the systems are assembled and solved in chunks.
+
+    Parameters
+    ----------
+    operator_decomposition
+        Affine decomposition of the system matrix as returned by
+        :func:`dense_affine_decomposition`.
+    rhs_decomposition
+        Affine decomposition of the vector-like right-hand side as returned by
+        :func:`dense_affine_decomposition`.
+    mus
+        List of |parameter values| for which to solve.
+    max_chunk_size
+        Maximum size in bytes of the stacked system matrices of a single chunk.
+
+    Returns
+    -------
+    |NumPy array| of shape `(len(mus), dim)` containing the solutions.
+
+    Raises
+    ------
+    InversionError
+        One of the systems could not be solved.
+    """
+    matrices = operator_decomposition[1]
+    dim = matrices.shape[2]
+    chunk_size = max(1, max_chunk_size // max(matrices[0].nbytes, 1))
+
+    solutions = []
+    for i in range(0, len(mus), chunk_size):
+        mus_chunk = mus[i:i+chunk_size]
+        A = assemble_batch(operator_decomposition, mus_chunk)
+        b = assemble_batch(rhs_decomposition, mus_chunk)
+        try:
+            solutions.append(np.linalg.solve(A, b)[..., 0])
+        except np.linalg.LinAlgError as e:
+            raise InversionError(f'{str(type(e))}: {str(e)}') from e
+
+    if not solutions:
+        return np.empty((0, dim))
+    U = np.concatenate(solutions)
+    if not np.isfinite(np.sum(U)):
+        raise InversionError('Result contains non-finite values')
+    return U
@@ -9,12 +9,22 @@ from pymor.core.exceptions import AccuracyError
 from pymor.core.logger import getLogger
 
 
-@defaults('atol', 'rtol', 'reiterate', 'reiteration_threshold', 'check', 'check_tol')
+@defaults('atol', 'rtol', 'reiterate', 'reiteration_threshold', 'check', 'check_tol', 'block_size')
 def gram_schmidt(A, product=None, return_R=False, atol=1e-13, rtol=1e-13, offset=0,
                  reiterate=True, reiteration_threshold=9e-1, check=True, check_tol=1e-3,
-                 copy=True):
+                 copy=True, block_size=None):
     """Orthonormalize a |VectorArray| using the modified Gram-Schmidt algorithm.
 
+    If `block_size` is specified, the block classical Gram-Schmidt algorithm with
+    reorthogonalization (BCGS2) is used instead: the vectors are processed in panels
+    of `block_size` vectors, which are orthogonalized twice against all previously
+    computed basis vectors using :meth:`~pymor.vectorarrays.interface.VectorArray.inner`
+    and :meth:`~pymor.vectorarrays.interface.VectorArray.lincomb`. Only the
+    orthonormalization within a panel is performed vector by vector. Thus, the
+    number of (possibly communicating) reductions no longer grows quadratically
+    with the number of vectors, and most of the work is done by matrix-matrix
+    operations.
+
     Parameters
     ----------
     A
@@ -44,6 +54,9 @@ def gram_schmidt(A, product=None, return_R=False, atol=1e-13, rtol=1e-13, offset
         Tolerance for the check.
     copy
         If `True`, create a copy of `A` instead of modifying `A` in-place.
+    block_size
+        If not `None`, use the block classical Gram-Schmidt algorithm with
+        reorthogonalization and panels of `block_size` vectors.
 
     Returns
     -------
@@ -53,6 +66,7 @@ def gram_schmidt(A, product=None, return_R=False, atol=1e-13, rtol=1e-13, offset
         The upper-triangular/trapezoidal matrix (if `compute_R` is `True`).
     """
     logger = getLogger('pymor.algorithms.gram_schmidt.gram_schmidt')
+    assert block_size is None or block_size > 0
 
     if copy:
         A = A.copy()
@@ -60,49 +74,53 @@ def gram_schmidt(A, product=None, return_R=False, atol=1e-13, rtol=1e-13, offset
     # main loop
     R = np.eye(len(A))
     remove = []  # indices of to be removed vectors
-    for i in range(offset, len(A)):
-        # first calculate norm
-        initial_norm = A[i].norm(product)[0]
-
-        if initial_norm <= atol:
-            logger.info(f'Removing vector {i} of norm {initial_norm}')
-            remove.append(i)
-            continue
-
-        if i == 0:
-            A[0].scal(1 / initial_norm)
-            R[i, i] = initial_norm
-        else:
-            norm = initial_norm
-            # If reiterate is True, reiterate as long as the norm of the vector changes
-            # strongly during orthogonalization (due to Andreas Buhr).
-            while True:
-                # orthogonalize to all vectors left
-                for j in range(i):
-                    if j in remove:
-                        continue
-                    p = A[j].pairwise_inner(A[i], product)[0]
-                    A[i].axpy(-p, A[j])
-                    common_dtype = np.promote_types(R.dtype, type(p))
-                    R = R.astype(common_dtype, copy=False)
-                    R[j, i] += p
-
-                # calculate new norm
-                old_norm, norm = norm, A[i].norm(product)[0]
-
-                # remove vector if it got too small
-                if norm <= rtol * initial_norm:
-                    logger.info(f'Removing linearly dependent vector {i}')
-                    remove.append(i)
-                    break
-
-                # check if reorthogonalization should be done
-                if reiterate and norm < reiteration_threshold * old_norm:
-                    logger.info(f'Orthonormalizing vector {i} again')
-                else:
-                    A[i].scal(1 / norm)
-                    R[i, i] = norm
-                    break
+    if block_size is not None:
+        R = _block_gram_schmidt(A, product, R, remove, atol, rtol, offset, reiterate,
+                                reiteration_threshold, block_size, logger)
+    else:
+        for i in range(offset, len(A)):
+            # first calculate norm
+            initial_norm = A[i].norm(product)[0]
+
+            if initial_norm <= atol:
+                logger.info(f'Removing vector {i} of norm {initial_norm}')
+                remove.append(i)
+                continue
+
+            if i == 0:
+                A[0].scal(1 / initial_norm)
+                R[i, i] = initial_norm
+            else:
+                norm = initial_norm
+                # If reiterate is True, reiterate as long as the norm of the vector changes
+                # strongly during orthogonalization (due to Andreas Buhr).
+                while True:
+                    # orthogonalize to all vectors left
+                    for j in range(i):
+                        if j in remove:
+                            continue
+                        p = A[j].pairwise_inner(A[i], product)[0]
+                        A[i].axpy(-p, A[j])
+                        common_dtype = np.promote_types(R.dtype, type(p))
+                        R = R.astype(common_dtype, copy=False)
+                        R[j, i] += p
+
+                    # calculate new norm
+                    old_norm, norm = norm, A[i].norm(product)[0]
+
+                    # remove vector if it got too small
+                    if norm <= rtol * initial_norm:
+                        logger.info(f'Removing linearly dependent vector {i}')
+                        remove.append(i)
+                        break
+
+                    # check if reorthogonalization should be done
+                    if reiterate and norm < reiteration_threshold * old_norm:
+                        logger.info(f'Orthonormalizing vector {i} again')
+                    else:
+                        A[i].scal(1 / norm)
+                        R[i, i] = norm
+                        break
 
     if remove:
         del A[remove]
@@ -122,6 +140,78 @@ def gram_schmidt(A, product=None, return_R=False, atol=1e-13, rtol=1e-13, offset
         return A
 
 
+def _block_gram_schmidt(A, product, R, remove, atol, rtol, offset, reiterate, reiteration_threshold,
+                        block_size, logger):
+    # views of A are always created anew as in-place operations on A may
+    # invalidate existing views (e.g., for BlockVectorArrays)
+    for start in range(offset, len(A), block_size):
+        stop = min(start + block_size, len(A))
+
+        initial_norms = A[start:stop].norm(product)
+        for i in np.nonzero(initial_norms <= atol)[0]:
+            logger.info(f'Removing vector {start + i} of norm {initial_norms[i]}')
+            remove.append(start + i)
+
+        # the original panel is given by basis.lincomb(C.T) + A[start:stop].lincomb(T.T)
+        kept = _kept(remove, 0, start)
+        C = np.zeros((len(kept), stop - start), dtype=R.dtype)
+        T = np.eye(stop - start, dtype=R.dtype)
+        # If reiterate is True, reiterate as long as the norm of some vector of the panel
+        # changes strongly during orthogonalization.
+        while True:
+            old_norms = A[start:stop].norm(product)
+
+            # orthogonalize the panel to all previous basis vectors
+            if kept:
+                basis = A[:start] if len(kept) == start else A[kept]
+                coeffs = basis.inner(A[start:stop], product)
+                A[start:stop].axpy(-1., basis.lincomb(coeffs.T))
+                C = C + coeffs @ T
+
+            # orthonormalize the vectors of the panel
+            S = np.eye(stop - start, dtype=C.dtype)
+            ratios = np.ones(stop - start)
+            for i in range(stop - start):
+                if start + i in remove:
+                    continue
+                panel_kept = _kept(remove, start, start + i)
+                if panel_kept:
+                    previous = A[start:start + i] if len(panel_kept) == i else A[panel_kept]
+                    coeffs = previous.inner(A[start + i], product)[:, 0]
+                    A[start + i].axpy(-1., previous.lincomb(coeffs))
+                    S = S.astype(np.promote_types(S.dtype, coeffs.dtype), copy=False)
+                    S[[j - start for j in panel_kept], i] = coeffs
+                norm = A[start + i].norm(product)[0] if kept or panel_kept else old_norms[i]
+
+                # remove vector if it got too small
+                if norm * abs(T[i, i]) <= rtol * initial_norms[i]:
+                    logger.info(f'Removing linearly dependent vector {start + i}')
+                    remove.append(start + i)
+                    continue
+
+                A[start + i].scal(1 / norm)
+                S[i, i] = norm
+                ratios[i] = norm / old_norms[i]
+            T = S @ T
+
+            # check if reorthogonalization should be done
+            if reiterate and np.any(ratios < reiteration_threshold):
+                logger.info(f'Orthonormalizing vectors {start} to {stop - 1} again')
+            else:
+                break
+
+        R = R.astype(np.promote_types(R.dtype, T.dtype), copy=False)
+        R[kept, start:stop] = C
+        R[start:stop, start:stop] = T
+        remove.sort()
+
+    return R
+
+
+def _kept(remove, start, stop):
+    return [j for j in range(start, stop) if j not in remove]
+
+
 def gram_schmidt_biorth(V, W, product=None,
                         reiterate=True, reiteration_threshold=1e-1, check=True, check_tol=1e-3,
                         copy=True):
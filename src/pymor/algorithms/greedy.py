@@ -13,7 +13,7 @@ from pymor.parallel.dummy import dummy_pool
 from pymor.parallel.interface import RemoteObject
 
 
-def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=None, pool=None):
+def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=None, pool=None, batch_size=1):
     """Weak greedy basis generation algorithm :cite:`BCDDPW11`.
 
     This algorithm generates an approximation basis for a given set of vectors
@@ -22,6 +22,11 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
     the training set and adding the worst approximated vector (according to
     the surrogate) to the basis.
 
+    If `batch_size` is larger than one, the surrogate is extended in each
+    iteration for the `batch_size` worst approximated parameters at once
+    using :meth:`WeakGreedySurrogate.extend_batch`. This allows to compute
+    the new vectors in parallel at the expense of a possibly larger basis.
+
     The constructed basis is extracted from the surrogate after termination
     of the algorithm.
 
@@ -44,6 +49,10 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
     pool
         If not `None`, a |WorkerPool| to use for parallelization. Parallelization
         needs to be supported by `surrogate`.
+    batch_size
+        Maximum number of parameters for which the surrogate is extended in
+        each iteration. Parameters whose estimated error is not larger than
+        `atol` are not selected.
 
     Returns
     -------
@@ -58,6 +67,7 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
     training_set = list(training_set)
     logger.info(f'Started greedy search on training set of size {len(training_set)}.')
 
+    assert batch_size >= 1
     tic = time.perf_counter()
     if not training_set:
         logger.info('There is nothing else to do for an empty training set.')
@@ -70,6 +80,7 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
         logger.info(f'Using pool of {len(pool)} workers for parallel greedy search.')
 
     # Distribute the training set evenly among the workers.
+    training_mus = training_set
     if pool:
         training_set = pool.scatter_list(training_set)
 
@@ -79,7 +90,13 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
 
     while True:
         with logger.block('Estimating errors ...'):
-            max_err, max_err_mu = surrogate.evaluate(training_set)
+            if batch_size == 1:
+                max_err, max_err_mu = surrogate.evaluate(training_set)
+            else:
+                errs = surrogate.evaluate(training_set, return_all_values=True)
+                worst = np.argsort(errs)[::-1][:batch_size]
+                max_err, max_err_mu = errs[worst[0]], training_mus[worst[0]]
+                batch_mus = [training_mus[i] for i in worst if i == worst[0] or atol is None or errs[i] > atol]
             max_errs.append(max_err)
             max_err_mus.append(max_err_mu)
 
@@ -93,9 +110,13 @@ def weak_greedy(surrogate, training_set, atol=None, rtol=None, max_extensions=No
             logger.info(f'Relative error tolerance ({rtol}) reached! Stopping extension loop.')
             break
 
-        with logger.block(f'Extending surrogate for mu = {max_err_mu} ...'):
+        with logger.block(f'Extending surrogate for mu = {max_err_mu} ...' if batch_size == 1 else
+                          f'Extending surrogate for {len(batch_mus)} parameters ...'):
             try:
-                surrogate.extend(max_err_mu)
+                if batch_size == 1:
+                    surrogate.extend(max_err_mu)
+                else:
+                    surrogate.extend_batch(batch_mus)
             except ExtensionError:
                 logger.info('Extension failed. Stopping now.')
                 break
@@ -140,9 +161,29 @@ class WeakGreedySurrogate(BasicObject):
     def extend(self, mu):
         pass
 
+    def extend_batch(self, mus):
+        """Extend the surrogate for multiple parameters at once.
+
+        The default implementation calls :meth:`extend` for each parameter.
+
+        Raises
+        ------
+        ExtensionError
+            The surrogate could not be extended for any of the parameters.
+        """
+        extended = False
+        for mu in mus:
+            try:
+                self.extend(mu)
+                extended = True
+            except ExtensionError:
+                self.logger.info(f'Extension for mu = {mu} failed.')
+        if not extended:
+            raise ExtensionError
+
 
 def rb_greedy(fom, reductor, training_set, use_error_estimator=True, error_norm=None,
-              atol=None, rtol=None, max_extensions=None, extension_params=None, pool=None):
+              atol=None, rtol=None, max_extensions=None, extension_params=None, pool=None, batch_size=1):
     """Weak Greedy basis generation using the RB approximation error as surrogate.
 
     This algorithm generates a reduced basis using the :func:`weak greedy <weak_greedy>`
@@ -182,9 +223,16 @@ def rb_greedy(fom, reductor, training_set, use_error_estimator=True, error_norm=
         If `None`, `'gram_schmidt'` basis extension will be used as a default
         for stationary problems (`fom.solve` returns `VectorArrays` of length 1)
         and `'pod'` basis extension (adding a single POD mode) for instationary
-        problems.
+        problems. If `batch_size` is larger than one, `'pod'` basis extension
+        adding at most one POD mode per selected parameter is used by default.
     pool
         See :func:`weak_greedy`.
+    batch_size
+        If larger than one, in each greedy iteration the solutions of `fom` for
+        the `batch_size` parameters with the largest estimated errors are
+        computed in parallel using `pool`. The reduced basis is extended with
+        the POD of the projection errors of all these solutions at once.
+        See also :func:`weak_greedy`.
 
     Returns
     -------
@@ -195,12 +243,27 @@ def rb_greedy(fom, reductor, training_set, use_error_estimator=True, error_norm=
         :max_errs:               Sequence of maximum errors during the greedy run.
         :max_err_mus:            The parameters corresponding to `max_errs`.
         :extensions:             Number of performed basis extensions.
+        :basis_sizes:            Sequence of dimensions of the reduced model after
+                                 each basis extension.
+        :snapshot_speedup:       Ratio of the sum of the solution times of all
+                                 computed snapshots and the wall time spent on
+                                 computing these snapshots.
         :time:                   Total runtime of the algorithm.
     """
     surrogate = RBSurrogate(fom, reductor, use_error_estimator, error_norm, extension_params, pool or dummy_pool)
 
-    result = weak_greedy(surrogate, training_set, atol=atol, rtol=rtol, max_extensions=max_extensions, pool=pool)
+    result = weak_greedy(surrogate, training_set, atol=atol, rtol=rtol, max_extensions=max_extensions, pool=pool,
+                         batch_size=batch_size)
     result['rom'] = surrogate.rom
+    result['basis_sizes'] = surrogate.basis_sizes
+    result['snapshot_speedup'] = (surrogate.snapshot_serial_time / surrogate.snapshot_time
+                                  if surrogate.snapshot_time else 1.)
+    if batch_size > 1 and result['extensions']:
+        getLogger('pymor.algorithms.greedy.rb_greedy').info(
+            f'Reduced basis of size {surrogate.basis_sizes[-1]} after {result["extensions"]} extensions '
+            f'({surrogate.basis_sizes[-1] / result["extensions"]:.1f} basis vectors per extension); '
+            f'snapshot computation speedup: {result["snapshot_speedup"]:.1f}'
+        )
 
     return result
 
@@ -218,7 +281,11 @@ class RBSurrogate(WeakGreedySurrogate):
         else:
             self.remote_fom, self.remote_error_norm, self.remote_reductor = \
                 pool.push(fom), pool.push(error_norm), pool.push(reductor)
+        # the fom is only pushed to the workers for computing snapshots when needed
+        self.remote_snapshot_fom = self.remote_fom
         self.rom = None
+        self.basis_sizes = []
+        self.snapshot_time = self.snapshot_serial_time = 0.
 
     def evaluate(self, mus, return_all_values=False):
         if self.rom is None:
@@ -244,7 +311,11 @@ class RBSurrogate(WeakGreedySurrogate):
 
     def extend(self, mu):
         with self.logger.block(f'Computing solution snapshot for mu = {mu} ...'):
+            tic = time.perf_counter()
             U = self.fom.solve(mu)
+            solve_time = time.perf_counter() - tic
+            self.snapshot_time += solve_time
+            self.snapshot_serial_time += solve_time
         with self.logger.block('Extending basis with solution snapshot ...'):
             extension_params = self.extension_params
             if len(U) > 1:
@@ -255,8 +326,41 @@ class RBSurrogate(WeakGreedySurrogate):
             self.reductor.extend_basis(U, copy_U=False, **(extension_params or {}))
             if not self.use_error_estimator:
                 self.remote_reductor = self.pool.push(self.reductor)
+        self._reduce()
+
+    def extend_batch(self, mus):
+        with self.logger.block(f'Computing {len(mus)} solution snapshots ...'):
+            if self.remote_snapshot_fom is None:
+                self.remote_snapshot_fom = self.pool.push(self.fom)
+            tic = time.perf_counter()
+            snapshots, solve_times = zip(*self.pool.map(_rb_surrogate_solve, mus, fom=self.remote_snapshot_fom,
+                                                        chunksize=1, schedule='dynamic'))
+            wall_time = time.perf_counter() - tic
+            self.snapshot_time += wall_time
+            self.snapshot_serial_time += sum(solve_times)
+            self.logger.info(f'Snapshot computation speedup: {sum(solve_times) / max(wall_time, 1e-16):.1f}')
+            U = snapshots[0].empty()
+            for V in snapshots:
+                U.append(V, remove_from_other=True)
+        with self.logger.block('Extending basis with solution snapshots ...'):
+            extension_params = dict(self.extension_params or {})
+            if 'method' not in extension_params:
+                extension_params.update(method='pod', pod_modes=len(mus))
+            self.reductor.extend_basis(U, copy_U=False, **extension_params)
+            if not self.use_error_estimator:
+                self.remote_reductor = self.pool.push(self.reductor)
+        self._reduce()
+
+    def _reduce(self):
         with self.logger.block('Reducing ...'):
             self.rom = self.reductor.reduce()
+        self.basis_sizes.append(self.rom.solution_space.dim)
+
+
+def _rb_surrogate_solve(mu, fom=None):
+    tic = time.perf_counter()
+    U = fom.solve(mu)
+    return U, time.perf_counter() - tic
 
 
 def _rb_surrogate_evaluate(rom=None, fom=None, reductor=None, mus=None, error_norm=None, return_all_values=False):
@@ -267,7 +371,7 @@ def _rb_surrogate_evaluate(rom=None, fom=None, reductor=None, mus=None, error_no
             return -1., None
 
     if fom is None:
-        errors = [rom.estimate_error(mu) for mu in mus]
+        errors = rom.estimate_error_batch(mus)
     elif error_norm is not None:
         errors = [error_norm(fom.solve(mu) - reductor.reconstruct(rom.solve(mu))) for mu in mus]
     else:
@@ -10,6 +10,7 @@ from threading import Thread
 import numpy as np
 
 from pymor.algorithms.pod import pod
+from pymor.algorithms.timestepping import TrajectorySink
 from pymor.core.logger import getLogger
 from pymor.tools.random import spawn_rng
 
@@ -159,7 +160,8 @@ def hapod(tree, snapshots, local_eps, product=None, pod_method=default_pod_metho
         `True` when the POD is computed at the root of the tree.
     executor
         If not `None`, a :class:`concurrent.futures.Executor` object to use
-        for parallelization.
+        for parallelization. To use a |WorkerPool|, wrap it with
+        :class:`~pymor.parallel.executor.WorkerPoolExecutor`.
     eval_snapshots_in_executor
         If `True` also parallelize the evaluation of the snapshot map.
 
@@ -330,11 +332,16 @@ def dist_hapod(num_slices, snapshots, eps, omega, arity=None,
                  eval_snapshots_in_executor=eval_snapshots_in_executor)
 
 
-def inc_vectorarray_hapod(steps, U, eps, omega, product=None):
+def inc_vectorarray_hapod(steps, U, eps, omega, product=None, svd=None):
     """Incremental Hierarchical Approximate POD.
 
     This computes the incremental HAPOD from :cite:`HLR18` for a given |VectorArray|.
 
+    If an :class:`~pymor.algorithms.incremental_svd.IncrementalSVD` is given as `svd`,
+    the POD updates are computed as rank-k updates of this SVD, which is modified
+    in-place. Snapshots already contained in `svd` are treated as the result of
+    previous incremental POD steps.
+
     Parameters
     ----------
     steps
@@ -348,6 +355,9 @@ def inc_vectorarray_hapod(steps, U, eps, omega, product=None):
         approximation quality.
     product
         Inner product |Operator| w.r.t. which to compute the POD.
+    svd
+        If not `None`, the :class:`~pymor.algorithms.incremental_svd.IncrementalSVD`
+        to update. Its `product` has to agree with `product`.
 
     Returns
     -------
@@ -361,6 +371,16 @@ def inc_vectorarray_hapod(steps, U, eps, omega, product=None):
     chunk_size = ceil(len(U) / steps)
     slices = range(0, len(U), chunk_size)
 
+    if svd is not None:
+        assert svd.product is product
+        local_eps = std_local_eps(inc_hapod_tree(len(slices)), eps, omega, False)
+        for i, slice in enumerate(slices):
+            is_root = i == len(slices) - 1
+            snap_count = svd.snap_count + min(chunk_size, len(U) - slice)
+            svd.update(U[slice: slice+chunk_size],
+                       l2_err=local_eps(_IncHAPODNode(is_root), snap_count, len(svd.modes) + chunk_size))
+        return svd.modes, svd.svals, svd.snap_count
+
     def snapshots():
         for slice in slices:
             yield U[slice: slice+chunk_size]
@@ -411,6 +431,85 @@ def dist_vectorarray_hapod(num_slices, U, eps, omega, arity=None, product=None,
                       eps, omega, arity=arity, product=product, executor=executor)
 
 
+class IncHAPODTrajectorySink(TrajectorySink):
+    """Incremental HAPOD of a trajectory computed by a |TimeStepper|.
+
+    Computes the same incremental HAPOD as :func:`inc_hapod`, but the snapshot
+    vectors are pushed into the sink by :meth:`TimeStepper.solve
+    <pymor.algorithms.timestepping.TimeStepper.solve>` instead of being obtained
+    from an iterable. Only the current POD modes and a block of at most
+    `block_size` snapshot vectors are kept in memory.
+
+    Parameters
+    ----------
+    block_size
+        The number of snapshot vectors used in each incremental POD update.
+    eps
+        Desired l2-mean approximation error.
+    omega
+        Tuning parameter (0 < omega < 1) to balance performance with
+        approximation quality.
+    product
+        Inner product |Operator| w.r.t. which to compute the POD.
+    """
+
+    def __init__(self, block_size, eps, omega, product=None):
+        assert block_size > 0
+        self.block_size, self.eps, self.omega, self.product = block_size, eps, omega, product
+
+    def start(self, space, num_values):
+        if num_values is None:
+            raise ValueError('IncHAPODTrajectorySink requires the number of trajectory vectors to be known')
+        self.steps = ceil(num_values / self.block_size)
+        self.local_eps = std_local_eps(inc_hapod_tree(self.steps), self.eps, self.omega, False)
+        self.step = 0
+        self.modes = self.svals = None
+        self.snap_count = 0
+        self.block = space.empty(reserve=self.block_size)
+
+    def append(self, U, t):
+        self.block.append(U)
+        if len(self.block) == self.block_size:
+            self._update()
+
+    def finish(self):
+        """Compute the final POD.
+
+        Returns
+        -------
+        modes
+            The computed POD modes.
+        svals
+            The associated singular values.
+        snap_count
+            The total number of input snapshot vectors.
+        """
+        if self.modes is None and len(self.block) == 0:
+            return self.block.copy(), np.array([]), 0
+        if len(self.block):
+            self._update(final=True)
+        return self.modes, self.svals, self.snap_count
+
+    def _update(self, final=False):
+        U, self.block = self.block, self.block.space.empty(reserve=self.block_size)
+        self.snap_count += len(U)
+        if self.modes is not None:
+            self.modes.scal(self.svals)
+            self.modes.append(U, remove_from_other=True)
+            U = self.modes
+        self.step += 1
+        is_root = final or self.step >= self.steps
+        eps = self.local_eps(_IncHAPODNode(is_root), self.snap_count, len(U))
+        self.logger.info(f'Computing intermediate POD (step {self.step}/{self.steps}) ...')
+        self.modes, self.svals = default_pod_method(U, eps, is_root, self.product)
+
+
+class _IncHAPODNode:
+
+    def __init__(self, is_root):
+        self.is_root, self.is_leaf = is_root, False
+
+
 def std_local_eps(tree, eps, omega, pod_on_leafs=True):
 
     L = tree.depth if pod_on_leafs else tree.depth - 1
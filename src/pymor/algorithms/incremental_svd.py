@@ -0,0 +1,151 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import scipy.linalg as spla
+
+from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.algorithms.svd_va import _select_modes
+from pymor.core.base import BasicObject
+from pymor.operators.interface import Operator
+from pymor.vectorarrays.interface import VectorArray, VectorSpace
+
+
+class IncrementalSVD(BasicObject):
+    """Incrementally updated truncated SVD of a growing set of snapshot vectors.
+
+    Given snapshot vectors which are added in chunks via :meth:`update`, this class
+    maintains a truncated singular value decomposition of the matrix of all snapshot
+    vectors seen so far, where the inner product on the state space is given by
+    `product` and the inner product on the snapshot index space is the Euclidean
+    inner product. Each update has the cost of a rank-`k` update in the sense of
+    :cite:`Bra06`, where `k` is the current number of modes, independent of the total
+    number of snapshot vectors. The right singular vectors are not stored.
+
+    After each update, the singular values and vectors are truncated according to
+    `max_modes`, `rtol`, `atol` and `l2_err` in the same way as in
+    :func:`~pymor.algorithms.pod.pod`, where `l2_err` only refers to the truncation
+    in the current update. The accumulated squared truncation error is available
+    as :attr:`discarded_energy`.
+
+    Parameters
+    ----------
+    space
+        The |VectorSpace| of the snapshot vectors.
+    product
+        Inner product |Operator| w.r.t. which the left singular vectors are computed.
+    max_modes
+        If not `None`, at most `max_modes` singular values and vectors are kept.
+    rtol
+        Singular values smaller than this value multiplied by the largest singular
+        value are discarded.
+    atol
+        Singular values smaller than this value are discarded.
+    l2_err
+        Default value for the l2-truncation error of a single update.
+    orth_tol
+        The left singular vectors are reorthonormalized if their orthogonality
+        error is above this value.
+
+    Attributes
+    ----------
+    modes
+        |VectorArray| of the current left singular vectors.
+    svals
+        One-dimensional |NumPy array| of the current singular values.
+    snap_count
+        The total number of snapshot vectors added so far.
+    discarded_energy
+        Sum of the squares of all discarded singular values.
+    """
+
+    def __init__(self, space, product=None, max_modes=None, rtol=0., atol=0., l2_err=0., orth_tol=1e-10):
+        assert isinstance(space, VectorSpace)
+        assert product is None or isinstance(product, Operator)
+        assert max_modes is None or max_modes >= 0
+        self.__auto_init(locals())
+        self.modes = space.empty()
+        self.svals = np.array([])
+        self.snap_count = 0
+        self.discarded_energy = 0.
+
+    def update(self, U, l2_err=None):
+        """Add the snapshot vectors `U` and update the truncated SVD.
+
+        Parameters
+        ----------
+        U
+            |VectorArray| of new snapshot vectors.
+        l2_err
+            If not `None`, the l2-truncation error for this update, overriding the
+            `l2_err` given on construction.
+        """
+        assert isinstance(U, VectorArray) and U in self.space
+        if len(U) == 0:
+            return
+        l2_err = self.l2_err if l2_err is None else l2_err
+        product, k = self.product, len(self.modes)
+
+        # project U onto the orthogonal complement of the current modes (twice for stability)
+        coeffs = self.modes.inner(U, product)
+        V = U - self.modes.lincomb(coeffs.T)
+        if k:
+            coeffs2 = self.modes.inner(V, product)
+            V.axpy(-1., self.modes.lincomb(coeffs2.T))
+            coeffs += coeffs2
+        Q, R = gram_schmidt(V, product=product, return_R=True, copy=False, check=False)
+
+        # SVD of the coefficients of [modes @ diag(svals), U] w.r.t. the basis [modes, Q]
+        K = np.zeros((k + len(Q), k + len(U)), dtype=np.promote_types(coeffs.dtype, R.dtype))
+        K[:k, :k] = np.diag(self.svals)
+        K[:k, k:] = coeffs
+        K[k:, k:] = R
+        U_K, s, _ = spla.svd(K, full_matrices=False, lapack_driver='gesvd')
+
+        selected_modes = _select_modes(s, np.sum(s**2), self.rtol, self.atol, l2_err)
+        if self.max_modes is not None:
+            selected_modes = min(selected_modes, self.max_modes)
+        self.discarded_energy += np.sum(s[selected_modes:]**2)
+        self.snap_count += len(U)
+
+        basis = self.modes.copy()
+        basis.append(Q, remove_from_other=True)
+        self._set_modes(basis.lincomb(U_K[:, :selected_modes].T), s[:selected_modes])
+        self.logger.info(f'Updated SVD with {len(U)} vectors: {selected_modes} modes')
+
+    def project_out(self, V):
+        """Remove the components in the span of `V` from the snapshot vectors.
+
+        Afterwards, the SVD approximates the matrix of the orthogonal projections of
+        all snapshot vectors onto the orthogonal complement of the span of `V`.
+        This is used by :func:`~pymor.reductors.basic.extend_basis` to keep the SVD
+        of the projection errors of all snapshots after the basis has been extended.
+
+        Parameters
+        ----------
+        V
+            |VectorArray| of orthonormal vectors w.r.t. `product`.
+        """
+        assert isinstance(V, VectorArray) and V in self.space
+        if len(V) == 0 or len(self.modes) == 0:
+            return
+        W = self.modes.copy()
+        W.scal(self.svals)
+        for _ in range(2):
+            W.axpy(-1., V.lincomb(V.inner(W, self.product).T))
+        Q, R = gram_schmidt(W, product=self.product, return_R=True, copy=False, check=False)
+        if len(Q) == 0:
+            self._set_modes(Q, np.array([]))
+            return
+        U_R, s, _ = spla.svd(R, full_matrices=False, lapack_driver='gesvd')
+        selected_modes = _select_modes(s, np.sum(s**2), self.rtol, self.atol, 0.)
+        self._set_modes(Q.lincomb(U_R[:, :selected_modes].T), s[:selected_modes])
+
+    def _set_modes(self, modes, svals):
+        if len(modes) and np.isfinite(self.orth_tol):
+            err = np.max(np.abs(modes.gramian(self.product) - np.eye(len(modes))))
+            if err >= self.orth_tol:
+                self.logger.info('Reorthonormalizing modes ...')
+                gram_schmidt(modes, product=self.product, atol=0., rtol=0., copy=False)
+        self.modes, self.svals = modes, svals
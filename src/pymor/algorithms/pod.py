@@ -5,7 +5,7 @@
 import numpy as np
 
 from pymor.algorithms.gram_schmidt import gram_schmidt
-from pymor.algorithms.svd_va import method_of_snapshots, qr_svd
+from pymor.algorithms.svd_va import method_of_snapshots, qr_svd, randomized_svd
 from pymor.core.defaults import defaults
 from pymor.core.logger import getLogger
 from pymor.operators.interface import Operator
@@ -27,7 +27,9 @@ def pod(A, product=None, modes=None, rtol=1e-7, atol=0., l2_err=0.,
     Parameters
     ----------
     A
-        The |VectorArray| for which the POD is to be computed.
+        The |VectorArray| for which the POD is to be computed. For `method='randomized'`,
+        `A` can also be an iterable of |VectorArrays| which is processed in a single pass
+        (see :func:`~pymor.algorithms.svd_va.randomized_svd`).
     product
         Inner product |Operator| w.r.t. which the POD is computed.
     modes
@@ -48,7 +50,9 @@ def pod(A, product=None, modes=None, rtol=1e-7, atol=0., l2_err=0.,
         where `s_n` denotes the n-th singular value.
     method
         Which SVD method from :mod:`~pymor.algorithms.svd_va` to use
-        (`'method_of_snapshots'` or `'qr_svd'`).
+        (`'method_of_snapshots'`, `'qr_svd'` or `'randomized'`). The QR decomposition
+        used by `'qr_svd'` is selected by the `qr_method` default of
+        :func:`~pymor.algorithms.svd_va.qr_svd`.
     orth_tol
         POD modes are reorthogonalized if the orthogonality error is
         above this value.
@@ -60,13 +64,15 @@ def pod(A, product=None, modes=None, rtol=1e-7, atol=0., l2_err=0.,
     SVALS
         One-dimensional |NumPy array| of singular values.
     """
-    assert isinstance(A, VectorArray)
+    assert isinstance(A, VectorArray) or method == 'randomized'
     assert product is None or isinstance(product, Operator)
-    assert method in ('method_of_snapshots', 'qr_svd')
+    assert method in ('method_of_snapshots', 'qr_svd', 'randomized')
 
     logger = getLogger('pymor.algorithms.pod.pod')
 
-    svd_va = method_of_snapshots if method == 'method_of_snapshots' else qr_svd
+    svd_va = {'method_of_snapshots': method_of_snapshots,
+              'qr_svd': qr_svd,
+              'randomized': randomized_svd}[method]
     with logger.block('Computing SVD ...'):
         POD, SVALS, _ = svd_va(A, product=product, modes=modes, rtol=rtol, atol=atol, l2_err=l2_err)
 
@@ -8,9 +8,13 @@ import numpy as np
 import scipy.linalg as spla
 
 from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.algorithms.rand_la import rrf
+from pymor.algorithms.tsqr import tsqr
 from pymor.core.defaults import defaults
 from pymor.core.logger import getLogger
+from pymor.operators.constructions import VectorArrayOperator
 from pymor.operators.interface import Operator
+from pymor.tools.random import get_rng
 from pymor.vectorarrays.interface import VectorArray
 
 
@@ -109,9 +113,9 @@ def method_of_snapshots(A, product=None, modes=None, rtol=1e-7, atol=0., l2_err=
     return U, s, Vh
 
 
-@defaults('rtol', 'atol', 'l2_err')
-def qr_svd(A, product=None, modes=None, rtol=4e-8, atol=0., l2_err=0.):
-    """SVD of a |VectorArray| using Gram-Schmidt orthogonalization.
+@defaults('rtol', 'atol', 'l2_err', 'qr_method')
+def qr_svd(A, product=None, modes=None, rtol=4e-8, atol=0., l2_err=0., qr_method='gram_schmidt'):
+    """SVD of a |VectorArray| using Gram-Schmidt orthogonalization or TSQR.
 
     Viewing the |VectorArray| `A` as a `A.dim` x `len(A)` matrix, the
     return value of this method is the singular value decomposition of
@@ -142,6 +146,10 @@ def qr_svd(A, product=None, modes=None, rtol=4e-8, atol=0., l2_err=0.):
             argmin_N { sum_{n=N+1}^{infty} s_n^2 <= l2_err^2 }
 
         where `s_n` denotes the n-th singular value.
+    qr_method
+        Method used to compute the QR decomposition of `A`. Either
+        `'gram_schmidt'` (:func:`~pymor.algorithms.gram_schmidt.gram_schmidt`)
+        or `'tsqr'` (:func:`~pymor.algorithms.tsqr.tsqr`).
 
     Returns
     -------
@@ -154,6 +162,7 @@ def qr_svd(A, product=None, modes=None, rtol=4e-8, atol=0., l2_err=0.):
     """
     assert isinstance(A, VectorArray)
     assert product is None or isinstance(product, Operator)
+    assert qr_method in ('gram_schmidt', 'tsqr')
 
     if A.dim == 0 or len(A) == 0:
         return A.space.empty(), np.array([]), np.zeros((0, len(A)))
@@ -161,7 +170,10 @@ def qr_svd(A, product=None, modes=None, rtol=4e-8, atol=0., l2_err=0.):
     logger = getLogger('pymor.algorithms.svd_va.qr_svd')
 
     with logger.block('Computing QR decomposition ...'):
-        Q, R = gram_schmidt(A, product=product, return_R=True, check=False)
+        if qr_method == 'tsqr':
+            Q, R = tsqr(A, product=product)
+        else:
+            Q, R = gram_schmidt(A, product=product, return_R=True, check=False)
 
     with logger.block('Computing SVD of R ...'):
         U2, s, Vh = spla.svd(R, lapack_driver='gesvd')
@@ -189,3 +201,151 @@ def qr_svd(A, product=None, modes=None, rtol=4e-8, atol=0., l2_err=0.):
         U = Q.lincomb(U2.T)
 
     return U, s, Vh
+
+
+@defaults('rtol', 'atol', 'l2_err', 'oversampling', 'power_iterations', 'initial_rank')
+def randomized_svd(A, product=None, modes=None, rtol=4e-8, atol=0., l2_err=0.,
+                   oversampling=10, power_iterations=2, initial_rank=20):
+    """Randomized SVD of a |VectorArray|.
+
+    Viewing the |VectorArray| `A` as a `A.dim` x `len(A)` matrix, the
+    return value of this method is an approximation of the singular value
+    decomposition of `A`, where the inner product on R^(`dim(A)`) is given by
+    `product` and the inner product on R^(`len(A)`) is the Euclidean inner
+    product.
+
+    The range of `A` is approximated using :func:`~pymor.algorithms.rand_la.rrf`
+    with `modes + oversampling` random samples and `power_iterations` power
+    iterations. If `modes` is `None`, the number of samples, starting at
+    `initial_rank + oversampling`, is doubled until the number of modes required
+    by `rtol`, `atol` and `l2_err` is known. The approximation errors are computed
+    from the Frobenius norm of `A`.
+
+    Instead of a |VectorArray|, `A` can also be an iterable of |VectorArrays|, each
+    containing the next snapshots of the matrix. In this case, the SVD is computed
+    in a single pass over the snapshots using the sketching method of :cite:`TYUC17`,
+    without keeping the snapshots in memory. `modes` has to be specified and
+    `power_iterations` is ignored.
+
+    Parameters
+    ----------
+    A
+        The |VectorArray| for which the SVD is to be computed or an iterable of
+        |VectorArrays|.
+    product
+        Inner product |Operator| w.r.t. which the left singular vectors
+        are computed.
+    modes
+        If not `None`, at most the first `modes` singular values and
+        vectors are returned.
+    rtol
+        Singular values smaller than this value multiplied by the
+        largest singular value are ignored.
+    atol
+        Singular values smaller than this value are ignored.
+    l2_err
+        Do not return more modes than needed to bound the
+        l2-approximation error by this value. I.e. the number of
+        returned modes is at most ::
+
+            argmin_N { sum_{n=N+1}^{infty} s_n^2 <= l2_err^2 }
+
+        where `s_n` denotes the n-th singular value.
+    oversampling
+        Number of additional random samples.
+    power_iterations
+        Number of power iterations.
+    initial_rank
+        Initial guess for the number of modes if `modes` is `None`.
+
+    Returns
+    -------
+    U
+        |VectorArray| of left singular vectors.
+    s
+        One-dimensional |NumPy array| of singular values.
+    Vh
+        |NumPy array| of right singular vectors.
+    """
+    assert product is None or isinstance(product, Operator)
+    assert modes is None or modes >= 0
+    assert oversampling >= 0 and power_iterations >= 0 and initial_rank > 0
+
+    logger = getLogger('pymor.algorithms.svd_va.randomized_svd')
+
+    if not isinstance(A, VectorArray):
+        assert modes is not None, 'modes has to be specified for single-pass SVD'
+        with logger.block('Sketching snapshots ...'):
+            Q, X, norm2 = _sketch(A, product, modes + oversampling)
+        if len(Q) == 0:
+            return Q, np.array([]), np.zeros((0, X.shape[1]))
+        with logger.block('Computing SVD of sketch ...'):
+            U2, s, Vh = spla.svd(X, full_matrices=False, lapack_driver='gesvd')
+    else:
+        if A.dim == 0 or len(A) == 0:
+            return A.space.empty(), np.array([]), np.zeros((0, len(A)))
+
+        op = VectorArrayOperator(A)
+        max_rank = min(A.dim, len(A))
+        norm2 = np.sum(A.norm2(product))
+        rank = modes + oversampling if modes is not None else initial_rank + oversampling
+        while True:
+            rank = min(rank, max_rank)
+            with logger.block(f'Approximating range of A ({rank} samples) ...'):
+                Q = rrf(op, range_product=product, q=power_iterations, l=rank)
+                X = Q.inner(A, product)
+            with logger.block('Computing SVD of projected snapshots ...'):
+                U2, s, Vh = spla.svd(X, full_matrices=False, lapack_driver='gesvd')
+            if modes is not None or rank == max_rank \
+                    or _select_modes(s, norm2, rtol, atol, l2_err) <= rank - oversampling:
+                break
+            rank *= 2
+
+    with logger.block('Choosing the number of modes ...'):
+        selected_modes = _select_modes(s, norm2, rtol, atol, l2_err)
+        if modes is not None:
+            selected_modes = min(selected_modes, modes)
+        U2 = U2[:, :selected_modes]
+        s = s[:selected_modes]
+        Vh = Vh[:selected_modes]
+
+    with logger.block(f'Computing left singular vectors ({selected_modes} modes) ...'):
+        U = Q.lincomb(U2.T)
+
+    return U, s, Vh
+
+
+def _select_modes(s, norm2, rtol, atol, l2_err):
+    if len(s) == 0:
+        return 0
+    tol = max(rtol * s[0], atol)
+    above_tol = np.where(s >= tol)[0]
+    if len(above_tol) == 0:
+        return 0
+    # the squared Frobenius norm of A minus the energy captured by the first modes
+    errs = np.maximum(norm2 - np.concatenate(([0.], np.cumsum(s ** 2))), 0.)
+    below_err = np.where(errs <= l2_err**2)[0]
+    first_below_err = below_err[0] if len(below_err) else len(s)
+    return min(first_below_err, above_tol[-1] + 1)
+
+
+def _sketch(chunks, product, rank):
+    rng = get_rng()
+    Y = Psi = None
+    W = []
+    norm2 = 0.
+    for chunk in chunks:
+        assert isinstance(chunk, VectorArray)
+        if Y is None:
+            Y = chunk.space.zeros(rank)
+            Psi = chunk.space.random(2 * rank + 1, distribution='normal')
+        Omega = rng.normal(size=(len(chunk), rank))
+        Y.axpy(1., chunk.lincomb(Omega.T))
+        W.append(Psi.inner(chunk))
+        norm2 += np.sum(chunk.norm2(product))
+    assert Y is not None, 'no snapshots given'
+    W = np.hstack(W)
+
+    Q = gram_schmidt(Y, product=product, copy=False, check=False)
+    X = np.linalg.lstsq(Psi.inner(Q), W, rcond=None)[0]
+    return Q, X, norm2
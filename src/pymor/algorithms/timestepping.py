@@ -13,7 +13,13 @@ The :class:`TimeStepper` defines a common interface that has to be fulfilled by
 the time-steppers used by |InstationaryModel|.
 """
 
-from pymor.core.base import ImmutableObject, abstractmethod
+from time import perf_counter
+
+import numpy as np
+import scipy.linalg as spla
+
+from pymor.core.base import BasicObject, ImmutableObject, abstractmethod
+from pymor.core.exceptions import InversionError
 from pymor.operators.interface import Operator
 from pymor.parameters.base import Mu
 from pymor.vectorarrays.interface import VectorArray
@@ -44,7 +50,8 @@ class TimeStepper(ImmutableObject):
         """
         raise NotImplementedError
 
-    def solve(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None, num_values=None):
+    def solve(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None, num_values=None,
+              sink=None):
         """Apply time-stepper to the equation.
 
         The equation is of the form ::
@@ -73,22 +80,76 @@ class TimeStepper(ImmutableObject):
         num_values
             The number of returned vectors of the solution trajectory. If `None`, each
             intermediate vector that is calculated is returned.
+        sink
+            If not `None`, a :class:`TrajectorySink` to which the vectors of the solution
+            trajectory are passed as soon as they have been computed, instead of
+            collecting them in a |VectorArray|. This keeps the memory footprint
+            independent of the number of time steps.
 
         Returns
         -------
-        |VectorArray| containing the solution trajectory.
+        |VectorArray| containing the solution trajectory or, if `sink` is given,
+        the return value of :meth:`TrajectorySink.finish`.
         """
         try:
             num_time_steps = self.estimate_time_step_count(initial_time, end_time)
         except NotImplementedError:
-            num_time_steps = 0
+            num_time_steps = None
         iterator = self.iterate(initial_time, end_time, initial_data, operator, rhs=rhs, mass=mass, mu=mu,
                                 num_values=num_values)
-        U = operator.source.empty(reserve=num_values if num_values else num_time_steps + 1)
+        if sink is not None:
+            sink.start(operator.source,
+                       num_values or (num_time_steps + 1 if num_time_steps is not None else None))
+            for U_n, t_n in iterator:
+                sink.append(U_n, t_n)
+            return sink.finish()
+        U = operator.source.empty(reserve=num_values or (num_time_steps or 0) + 1)
         for U_n, _ in iterator:
             U.append(U_n)
         return U
 
+    def solve_batch(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mus=None,
+                    num_values=None):
+        """Apply time-stepper to the equation for multiple |parameter values|.
+
+        The default implementation calls :meth:`solve` for each of the given
+        |parameter values|. Time-steppers may override this method to advance
+        all trajectories simultaneously.
+
+        Parameters
+        ----------
+        initial_time
+            The time at which to begin time-stepping.
+        end_time
+            The time until which to perform time-stepping.
+        initial_data
+            |VectorArray| of the same length as `mus` containing the solution vectors
+            at `initial_time`.
+        operator
+            The |Operator| A.
+        rhs
+            The right-hand side F (either |VectorArray| of length 1 or |Operator| with
+            `source.dim == 1`). If `None`, zero right-hand side is assumed.
+        mass
+            The |Operator| M. If `None`, the identity operator is assumed.
+        mus
+            List of |parameter values| for which `operator` and `rhs` are evaluated.
+        num_values
+            The number of returned vectors of each solution trajectory. If `None`, each
+            intermediate vector that is calculated is returned.
+
+        Returns
+        -------
+        |VectorArray| containing the concatenated solution trajectories in the order
+        of `mus`.
+        """
+        assert len(initial_data) == len(mus)
+        U = operator.source.empty()
+        for i, mu in enumerate(mus):
+            U.append(self.solve(initial_time, end_time, initial_data[i], operator, rhs=rhs, mass=mass, mu=mu,
+                                num_values=num_values))
+        return U
+
     @abstractmethod
     def iterate(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mu=None, num_values=None):
         """Iterate time-stepper to the equation.
@@ -127,6 +188,121 @@ class TimeStepper(ImmutableObject):
         pass
 
 
+class TrajectorySink(BasicObject):
+    """Interface for consumers of solution trajectories computed by a |TimeStepper|.
+
+    A sink is passed as `sink` argument to :meth:`TimeStepper.solve` (or to
+    :meth:`~pymor.models.interface.Model.solve` of an |InstationaryModel|). Each
+    vector of the trajectory is passed to :meth:`append` directly after it has been
+    computed, so that the full trajectory never has to be kept in memory.
+    """
+
+    def start(self, space, num_values):
+        """Prepare the sink for receiving a new trajectory.
+
+        Parameters
+        ----------
+        space
+            The |VectorSpace| the trajectory vectors belong to.
+        num_values
+            The expected number of trajectory vectors or `None` if unknown.
+        """
+        pass
+
+    @abstractmethod
+    def append(self, U, t):
+        """Consume the next trajectory vector.
+
+        Parameters
+        ----------
+        U
+            |VectorArray| of length 1 containing the solution at time `t`. The
+            time-stepper may reuse `U`, so it has to be copied if it is stored.
+        t
+            The current time.
+        """
+        pass
+
+    def finish(self):
+        """Called after the last trajectory vector has been passed to the sink.
+
+        Returns
+        -------
+        The return value of :meth:`TimeStepper.solve`.
+        """
+        pass
+
+
+class MemmapTrajectorySink(TrajectorySink):
+    """Write the trajectory into a memory-mapped |NumPy array| on disk.
+
+    Parameters
+    ----------
+    filename
+        Path of the file to which the trajectory is written.
+    dtype
+        The dtype of the array. If `None`, the dtype is determined from the first
+        trajectory vector.
+    """
+
+    def __init__(self, filename, dtype=None):
+        self.filename, self.dtype = filename, dtype
+
+    def start(self, space, num_values):
+        if num_values is None:
+            raise ValueError('MemmapTrajectorySink requires the number of trajectory vectors to be known')
+        self.space, self.num_values = space, num_values
+        self.array, self.count = None, 0
+
+    def append(self, U, t):
+        U = U.to_numpy()
+        if self.array is None:
+            self.array = np.lib.format.open_memmap(self.filename, mode='w+',
+                                                   dtype=self.dtype or U.dtype,
+                                                   shape=(self.num_values, self.space.dim))
+        self.array[self.count] = U[0]
+        self.count += 1
+
+    def finish(self):
+        """Flush the array to disk.
+
+        Returns
+        -------
+        The memory-mapped array containing the trajectory vectors.
+        """
+        if self.array is None:
+            return np.empty((0, self.space.dim))
+        self.array.flush()
+        return self.array[:self.count]
+
+
+class OutputTrajectorySink(TrajectorySink):
+    """Only keep the output of the model along the trajectory.
+
+    Parameters
+    ----------
+    output_functional
+        The output |Operator| which is applied to each trajectory vector.
+    mu
+        |Parameter values| for which `output_functional` is evaluated.
+    """
+
+    def __init__(self, output_functional, mu=None):
+        self.output_functional, self.mu = output_functional, mu
+
+    def start(self, space, num_values):
+        assert space == self.output_functional.source
+        self.outputs = []
+
+    def append(self, U, t):
+        self.outputs.append(self.output_functional.apply(U, mu=self.mu).to_numpy())
+
+    def finish(self):
+        """Return the outputs as a |NumPy array| of shape `(num_values, output_dim)`."""
+        return (np.vstack(self.outputs) if self.outputs
+                else np.empty((0, self.output_functional.range.dim)))
+
+
 class ImplicitEulerTimeStepper(TimeStepper):
     """Implicit Euler time-stepper.
 
@@ -146,9 +322,14 @@ class ImplicitEulerTimeStepper(TimeStepper):
         The special values `'mass'` and `'operator'` are
         recognized, in which case the solver_options of
         M (resp. A) are used.
+    low_rank_update
+        If `True` and the time-dependent part of `M + dt*A` is a linear combination of
+        non-parametric :class:`LowRankOperators <pymor.operators.constructions.LowRankOperator>`,
+        only the time-independent part is factorized and the time-dependent part is
+        taken into account using the Sherman-Morrison-Woodbury formula.
     """
 
-    def __init__(self, nt, solver_options='operator'):
+    def __init__(self, nt, solver_options='operator', low_rank_update=False):
         self.__auto_init(locals())
 
     def estimate_time_step_count(self, initial_time, end_time):
@@ -193,9 +374,7 @@ class ImplicitEulerTimeStepper(TimeStepper):
         options = (A.solver_options if self.solver_options == 'operator' else
                    M.solver_options if self.solver_options == 'mass' else
                    self.solver_options)
-        M_dt_A = (M + A * dt).with_(solver_options=options)
-        if not _depends_on_time(M_dt_A, mu):
-            M_dt_A = M_dt_A.assemble(mu)
+        M_dt_A = _ImplicitSystem((M + A * dt).with_(solver_options=options), mu, self.low_rank_update)
 
         t = t0
         U = U0.copy()
@@ -215,6 +394,22 @@ class ImplicitEulerTimeStepper(TimeStepper):
                 num_ret_values += 1
                 yield U, t
 
+        M_dt_A.log_timings(self.logger)
+
+    def solve_batch(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mus=None,
+                    num_values=None):
+        """Apply time-stepper to the equation for multiple |parameter values|.
+
+        See :func:`_solve_batch_implicit` for the cases in which all trajectories
+        are advanced simultaneously.
+        """
+        U = _solve_batch_implicit(self, 1., initial_time, end_time, initial_data, operator, rhs, mass, mus,
+                                  num_values)
+        if U is None:
+            U = super().solve_batch(initial_time, end_time, initial_data, operator, rhs=rhs, mass=mass, mus=mus,
+                                    num_values=num_values)
+        return U
+
 
 class ExplicitEulerTimeStepper(TimeStepper):
     """Explicit Euler time-stepper.
@@ -315,9 +510,14 @@ class ImplicitMidpointTimeStepper(TimeStepper):
         The special values `'mass'` and `'operator'` are
         recognized, in which case the solver_options of
         M (resp. A) are used.
+    low_rank_update
+        If `True` and the time-dependent part of `M + dt/2*A` is a linear combination of
+        non-parametric :class:`LowRankOperators <pymor.operators.constructions.LowRankOperator>`,
+        only the time-independent part is factorized and the time-dependent part is
+        taken into account using the Sherman-Morrison-Woodbury formula.
     """
 
-    def __init__(self, nt, solver_options='operator'):
+    def __init__(self, nt, solver_options='operator', low_rank_update=False):
         self.__auto_init(locals())
 
     def estimate_time_step_count(self, initial_time, end_time):
@@ -368,9 +568,7 @@ class ImplicitMidpointTimeStepper(TimeStepper):
         else:
             options = self.solver_options
 
-        M_dt_A_impl = (M + A * (dt/2)).with_(solver_options=options)
-        if not _depends_on_time(M_dt_A_impl, mu):
-            M_dt_A_impl = M_dt_A_impl.assemble(mu)
+        M_dt_A_impl = _ImplicitSystem((M + A * (dt/2)).with_(solver_options=options), mu, self.low_rank_update)
         M_dt_A_expl = (M - A * (dt/2)).with_(solver_options=options)
         if not _depends_on_time(M_dt_A_expl, mu):
             M_dt_A_expl = M_dt_A_expl.assemble(mu)
@@ -393,6 +591,22 @@ class ImplicitMidpointTimeStepper(TimeStepper):
                 num_ret_values += 1
                 yield U, t
 
+        M_dt_A_impl.log_timings(self.logger)
+
+    def solve_batch(self, initial_time, end_time, initial_data, operator, rhs=None, mass=None, mus=None,
+                    num_values=None):
+        """Apply time-stepper to the equation for multiple |parameter values|.
+
+        See :func:`_solve_batch_implicit` for the cases in which all trajectories
+        are advanced simultaneously.
+        """
+        U = _solve_batch_implicit(self, 0.5, initial_time, end_time, initial_data, operator, rhs, mass, mus,
+                                  num_values)
+        if U is None:
+            U = super().solve_batch(initial_time, end_time, initial_data, operator, rhs=rhs, mass=mass, mus=mus,
+                                    num_values=num_values)
+        return U
+
 
 class DiscreteTimeStepper(TimeStepper):
     """Discrete time-stepper.
@@ -467,6 +681,244 @@ class DiscreteTimeStepper(TimeStepper):
                 yield U, k
 
 
+class _ImplicitSystem:
+    """Linear system matrix of an implicit time-stepping scheme.
+
+    If the operator does not depend on time, it is assembled and factorized
+    once, and the factorization is reused in all time steps. If `low_rank_update`
+    is `True` and the operator is the sum of a time-independent operator and a
+    time-dependent linear combination of non-parametric, non-inverted
+    |LowRankOperators| `L C R^H`, the time-independent part is factorized once
+    and the systems are solved using the Sherman-Morrison-Woodbury formula ::
+
+        (A + L C R^H)^{-1} = A^{-1} - A^{-1} L (I + C R^H A^{-1} L)^{-1} C R^H A^{-1}.
+
+    The time spent for assembly and factorization and for the solves is recorded
+    and reported by :meth:`log_timings`.
+    """
+
+    def __init__(self, operator, mu, low_rank_update):
+        tic = perf_counter()
+        self.operator, self.num_solves, self.solve_time = operator, 0, 0.
+        self.low_rank_coefficients = None
+        if not _depends_on_time(operator, mu):
+            self.operator = _factorize(operator.assemble(mu))
+        elif low_rank_update:
+            split = _split_low_rank_part(operator, mu)
+            if split is not None:
+                static_operator, lr_operators, self.low_rank_coefficients = split
+                self.operator = _factorize(static_operator.assemble(mu))
+                self.cores = [op.core for op in lr_operators]
+                L = lr_operators[0].left.copy()
+                R = lr_operators[0].right.copy()
+                for op in lr_operators[1:]:
+                    L.append(op.left)
+                    R.append(op.right)
+                self.R = R
+                self.AinvL = self.operator.apply_inverse(L)
+                self.RhAinvL = R.inner(self.AinvL)
+        self.factorization_time = perf_counter() - tic
+
+    def apply_inverse(self, V, mu=None, initial_guess=None):
+        tic = perf_counter()
+        if self.low_rank_coefficients is None:
+            U = self.operator.apply_inverse(V, mu=mu, initial_guess=initial_guess)
+        else:
+            C = spla.block_diag(*(core * (c.evaluate(mu) if hasattr(c, 'evaluate') else c)
+                                  for core, c in zip(self.cores, self.low_rank_coefficients)))
+            U = self.operator.apply_inverse(V)
+            coeffs = spla.solve(np.eye(len(C)) + C @ self.RhAinvL, C @ self.R.inner(U))
+            U -= self.AinvL.lincomb(coeffs.T)
+        self.num_solves += 1
+        self.solve_time += perf_counter() - tic
+        return U
+
+    def log_timings(self, logger):
+        logger.debug(f'Assembly/factorization: {self.factorization_time:.3g}s, '
+                     f'{self.num_solves} solves: {self.solve_time:.3g}s')
+
+
+def _solve_batch_implicit(time_stepper, theta, initial_time, end_time, initial_data, operator, rhs, mass, mus,
+                          num_values):
+    """Advance the trajectories of a linear theta scheme for multiple |parameter values| at once.
+
+    The scheme ::
+
+        (M + theta*dt*A) u_{n+1} = (M - (1-theta)*dt*A) u_n + dt*F
+
+    is used, where `A` and `F` are evaluated at `t_n + theta*dt`, which yields
+    the implicit Euler method for `theta == 1` and the implicit midpoint rule for
+    `theta == 1/2`. Two cases are handled:
+
+    - If `A`, `M` and `F` are (linear combinations of) dense |NumpyMatrixOperators|,
+      as is the case for reduced models, the system matrices for all |parameter values|
+      are assembled as stacked three-dimensional arrays (see :mod:`pymor.algorithms.batch`).
+      When `A` does not depend on time, the time-step propagators are computed with a
+      single batched solve beforehand, so that each time step only requires batched
+      matrix-vector products. Otherwise, all systems are solved with a single call of
+      :func:`numpy.linalg.solve` in each time step.
+
+    - If `A` is not parametric, the implicit system is assembled and factorized
+      once and all trajectories are advanced by a single multi-right-hand-side
+      solve per time step.
+
+    Returns `None` in all other cases.
+    """
+    from pymor.algorithms.batch import (
+        as_range_array_batch,
+        assemble_batch,
+        dense_affine_decomposition,
+    )
+    from pymor.operators.constructions import IdentityOperator, VectorOperator
+
+    A, F, M, U0, t0, t1, nt = operator, rhs, mass, initial_data, initial_time, end_time, time_stepper.nt
+    assert isinstance(A, Operator)
+    assert isinstance(F, (type(None), Operator, VectorArray))
+    assert isinstance(M, (type(None), Operator))
+    assert A.source == A.range
+    assert U0 in A.source
+    assert len(U0) == len(mus)
+    if not A.linear or (M is not None and M.parametric) or getattr(time_stepper, 'low_rank_update', False):
+        return None
+    options = (A.solver_options if time_stepper.solver_options == 'operator' else
+               M.solver_options if time_stepper.solver_options == 'mass' and M is not None else
+               None if time_stepper.solver_options in ('operator', 'mass') else
+               time_stepper.solver_options)
+
+    num_values = num_values or nt + 1
+    dt = (t1 - t0) / nt
+    DT = (t1 - t0) / (num_values - 1)
+    if isinstance(F, VectorArray):
+        assert len(F) == 1
+        F = VectorOperator(F)
+    if M is None:
+        M = IdentityOperator(A.source)
+    assert A.source == M.source == M.range
+
+    def mus_at(t):
+        return [mu.with_(t=t) for mu in mus]
+
+    F_time_dep = F is not None and any(_depends_on_time(F, mu) for mu in mus)
+    A_time_dep = any(_depends_on_time(A, mu) for mu in mus)
+
+    A_decomposition = dense_affine_decomposition(A)
+    M_decomposition = None if isinstance(M, IdentityOperator) else dense_affine_decomposition(M)
+    F_decomposition = None if F is None else dense_affine_decomposition(F)
+    dense = (A_decomposition is not None
+             and (isinstance(M, IdentityOperator) or M_decomposition is not None)
+             and (F is None or F_decomposition is not None)
+             and not (options and options.get('inverse')))
+
+    if dense:
+        if not mus:
+            return A.source.empty()
+        M_mat = (np.eye(A.source.dim) if isinstance(M, IdentityOperator)
+                 else assemble_batch(M_decomposition, [Mu()])[0])
+
+        def systems(mus_t):
+            A_mats = assemble_batch(A_decomposition, mus_t)
+            return M_mat + (theta * dt) * A_mats, M_mat - ((1 - theta) * dt) * A_mats
+
+        def dt_F(mus_t):
+            return dt * assemble_batch(F_decomposition, mus_t)[..., 0]
+
+        def batched_solve(S, B):
+            try:
+                return np.linalg.solve(S, B)
+            except np.linalg.LinAlgError as e:
+                raise InversionError(f'{str(type(e))}: {str(e)}') from e
+
+        U = U0.to_numpy()
+        if not A_time_dep:
+            mus_t = mus_at(t0 + theta * dt)
+            S, E = systems(mus_t)
+            if F is not None and not F_time_dep:
+                P = batched_solve(S, np.concatenate([E, dt_F(mus_t)[..., np.newaxis]], axis=2))
+                P, g = P[..., :-1], P[..., -1]
+            else:
+                P = batched_solve(S, np.concatenate([E, np.broadcast_to(np.eye(A.source.dim), S.shape)], axis=2))
+                P, S_inv = P[..., :A.source.dim], P[..., A.source.dim:]
+
+        def step(U, t):
+            mus_t = mus_at(t + theta * dt) if A_time_dep or F_time_dep else None
+            if A_time_dep:
+                S, E = systems(mus_t)
+                V = (E @ U[..., np.newaxis])[..., 0]
+                if F is not None:
+                    V += dt_F(mus_t)
+                return batched_solve(S, V[..., np.newaxis])[..., 0]
+            V = (P @ U[..., np.newaxis])[..., 0]
+            if F is not None:
+                V += (S_inv @ dt_F(mus_t)[..., np.newaxis])[..., 0] if F_time_dep else g
+            return V
+    elif not A.parametric:
+        U = U0
+        implicit_system = _ImplicitSystem((M + A * (theta * dt)).with_(solver_options=options), None, False)
+        explicit_system = M if theta == 1 else (M - A * ((1 - theta) * dt)).assemble()
+        if F is not None and not F_time_dep:
+            F_values = (as_range_array_batch(F, mus_at(t0 + theta * dt)) if F.parametric
+                        else F.as_vector()) * dt
+
+        def step(U, t):
+            V = explicit_system.apply(U)
+            if F_time_dep:
+                V += as_range_array_batch(F, mus_at(t + theta * dt)) * dt
+            elif F is not None:
+                V.axpy(1., F_values)
+            return implicit_system.apply_inverse(V, initial_guess=U)
+    else:
+        return None
+
+    Us = [U.copy()]
+    num_ret_values = 1
+    t = t0
+    for n in range(nt):
+        U = step(U, t)
+        t += dt
+        while t - t0 + (min(dt, DT) * 0.5) >= num_ret_values * DT:
+            num_ret_values += 1
+            Us.append(U)
+
+    # reorder from time-major to trajectory-major
+    order = np.arange(len(Us) * len(mus)).reshape((len(Us), len(mus))).T.ravel()
+    if dense:
+        return A.source.make_array(np.concatenate(Us)[order])
+    V = A.source.empty(reserve=len(Us) * len(mus))
+    for U in Us:
+        V.append(U)
+    implicit_system.log_timings(time_stepper.logger)
+    return V[order]
+
+
+def _factorize(operator):
+    from pymor.operators.numpy import NumpyMatrixOperator
+    if isinstance(operator, NumpyMatrixOperator) and operator.source.dim == operator.range.dim > 0:
+        operator._factorize()
+    return operator
+
+
+def _split_low_rank_part(operator, mu):
+    from pymor.algorithms.simplify import expand
+    from pymor.operators.constructions import LincombOperator, LowRankOperator
+    operator = expand(operator)
+    if not isinstance(operator, LincombOperator):
+        return None
+    static_operators, static_coefficients, lr_operators, lr_coefficients = [], [], [], []
+    for op, c in zip(operator.operators, operator.coefficients):
+        if not _depends_on_time(op, mu) and not (hasattr(c, 'evaluate') and _depends_on_time(c, mu)):
+            static_operators.append(op)
+            static_coefficients.append(c)
+        elif isinstance(op, LowRankOperator) and not op.inverted and not op.parametric:
+            lr_operators.append(op)
+            lr_coefficients.append(c)
+        else:
+            return None
+    if not static_operators:
+        return None
+    return (LincombOperator(static_operators, static_coefficients, solver_options=operator.solver_options),
+            lr_operators, lr_coefficients)
+
+
 def _depends_on_time(obj, mu):
     if not mu:
         return False
@@ -0,0 +1,132 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+"""Tall-skinny QR decomposition of |VectorArrays|.
+
+The tall-skinny QR (TSQR) algorithm computes the QR decomposition of a
+|VectorArray| `A` whose vectors are distributed over several blocks of
+degrees of freedom, e.g. over the ranks of an MPI communicator. Each block
+computes a local Householder QR decomposition of its part of `A`. The
+resulting small R factors are then combined pairwise along a binary tree
+until a single R factor remains. Finally, the orthonormal factors of the
+tree nodes are propagated back to the blocks to form the local parts of
+the global Q factor.
+
+In contrast to Gram-Schmidt orthonormalization, only a single reduction
+of small `len(A) x len(A)` matrices is required, independent of the
+number of vectors in `A`.
+"""
+
+import numpy as np
+
+from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.core.logger import getLogger
+from pymor.operators.interface import Operator
+from pymor.tools import mpi
+from pymor.vectorarrays.interface import VectorArray
+from pymor.vectorarrays.mpi import MPIVectorArrayAutoComm
+from pymor.vectorarrays.numpy import NumpyVectorArray
+
+
+def tsqr(A, product=None):
+    """Compute the QR decomposition of a |VectorArray| using the TSQR algorithm.
+
+    Viewing the |VectorArray| `A` as a `A.dim` x `len(A)` matrix, this method
+    computes a |VectorArray| `Q` of orthonormal vectors and an upper
+    trapezoidal matrix `R` such that `A = Q.lincomb(R.T)`.
+
+    For |NumpyVectorArrays| the decomposition is computed by a single call to
+    LAPACK. For :class:`MPIVectorArrays <pymor.vectorarrays.mpi.MPIVectorArrayAutoComm>`
+    wrapping local arrays which support
+    :meth:`~pymor.vectorarrays.interface.VectorArray.to_numpy`, each MPI rank
+    computes a local QR decomposition and the local R factors are combined
+    along a binary tree. For all other |VectorArrays|, or if an inner `product`
+    is given, :func:`~pymor.algorithms.gram_schmidt.gram_schmidt` is used.
+    In this case, the dimensions of `Q` and `R` may be smaller due to the
+    removal of linearly dependent vectors.
+
+    Parameters
+    ----------
+    A
+        The |VectorArray| to decompose.
+    product
+        The inner product |Operator| w.r.t. which to orthonormalize.
+        If `None`, the Euclidean product is used.
+
+    Returns
+    -------
+    Q
+        |VectorArray| of orthonormal vectors.
+    R
+        The upper-triangular/trapezoidal |NumPy array| with non-negative
+        diagonal.
+    """
+    assert isinstance(A, VectorArray)
+    assert product is None or isinstance(product, Operator)
+
+    logger = getLogger('pymor.algorithms.tsqr.tsqr')
+
+    if product is None and type(A) is NumpyVectorArray:
+        Q, R = _local_qr(A.to_numpy().T)
+        return A.space.from_numpy(Q.T), R
+    elif product is None and isinstance(A, MPIVectorArrayAutoComm):
+        obj_id, R = mpi.call(mpi.function_call, _MPIVectorArrayAutoComm_tsqr, A.impl.obj_id, A.ind)
+        return A.space.make_array(obj_id), R
+    else:
+        logger.info('No TSQR implementation available. Using gram_schmidt.')
+        return gram_schmidt(A, product=product, return_R=True, check=False)
+
+
+def _local_qr(M):
+    Q, R = np.linalg.qr(M)
+    # normalize the diagonal of R to be non-negative as in gram_schmidt
+    d = np.diag(R)
+    abs_d = np.abs(d)
+    phases = np.divide(d, abs_d, out=np.ones_like(d), where=abs_d > 0)
+    Q *= phases
+    R /= phases[:, np.newaxis]
+    return Q, R
+
+
+def _tree_qr(R):
+    """Combine the local R factors of all MPI ranks along a binary tree.
+
+    Returns the global R factor (on rank 0) and the matrix with which the local
+    Q factor has to be multiplied to obtain the local part of the global Q factor.
+    """
+    comm, rank, size = mpi.comm, mpi.rank, mpi.size
+
+    # upward sweep: combine R factors pairwise
+    nodes = []
+    step = 1
+    while step < size:
+        if rank % (2 * step):
+            parent = rank - step
+            comm.send(R, dest=parent)
+            break
+        child = rank + step
+        if child < size:
+            R_child = comm.recv(source=child)
+            Q, R_new = _local_qr(np.vstack([R, R_child]))
+            nodes.append((child, len(R), Q))
+            R = R_new
+        step *= 2
+
+    # downward sweep: propagate the orthonormal factors of the tree nodes
+    M = np.eye(len(R), dtype=R.dtype) if rank == 0 else comm.recv(source=parent)
+    for child, k, Q in reversed(nodes):
+        M = Q @ M
+        comm.send(M[k:], dest=child)
+        M = M[:k]
+
+    return R, M
+
+
+def _MPIVectorArrayAutoComm_tsqr(self, ind):
+    self = self if ind is None else self[ind]
+    Q, R = _local_qr(self.to_numpy().T)
+    R, M = _tree_qr(R)
+    obj_id = mpi.manage_object(self.space.from_numpy((Q @ M).T))
+    if mpi.rank0:
+        return obj_id, R
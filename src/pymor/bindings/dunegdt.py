@@ -91,6 +91,9 @@ class DuneXTVector(CopyOnWriteVector):
     def to_numpy(self, ensure_copy=False):
         return np.array(self.impl, copy=ensure_copy)
 
+    def buffer(self):
+        return np.array(self.impl, copy=False)
+
 
 class DuneXTVectorSpace(ComplexifiedListVectorSpace):
     """A |VectorSpace| yielding DuneXTVector.
@@ -43,6 +43,10 @@ class FenicsVector(CopyOnWriteVector):
     def to_numpy(self, ensure_copy=False):
         return self.impl.get_local()  # always returns a copy
 
+    def buffer(self):
+        # the local part only agrees with the vector in the serial case
+        return self.impl.get_local() if df.MPI.size(self.impl.mpi_comm()) == 1 else None
+
     def _scal(self, alpha):
         self.impl *= alpha
 
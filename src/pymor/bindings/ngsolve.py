@@ -52,6 +52,9 @@ class NGSolveVector(NGSolveVectorCommon, CopyOnWriteVector):
         self._copy_data_if_needed()
         return self.impl.vec.FV().NumPy()
 
+    def buffer(self):
+        return self.impl.vec.FV().NumPy()
+
     def _scal(self, alpha):
         self.impl.vec.data = float(alpha) * self.impl.vec
 
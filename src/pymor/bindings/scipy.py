@@ -2,9 +2,17 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
-
 import numpy as np
-from scipy.linalg import solve, solve_continuous_are, solve_continuous_lyapunov, solve_discrete_lyapunov
+from scipy.linalg import (
+    LinAlgError,
+    cholesky,
+    inv,
+    qr,
+    solve,
+    solve_continuous_are,
+    solve_continuous_lyapunov,
+    solve_discrete_lyapunov,
+)
 from scipy.sparse.linalg import LinearOperator, bicgstab, lgmres, lsqr, spilu, splu, spsolve
 
 from pymor.algorithms.genericsolvers import _parse_options
@@ -12,14 +20,16 @@ from pymor.algorithms.lyapunov import _chol, _solve_lyap_dense_check_args, _solv
 from pymor.algorithms.riccati import _solve_ricc_check_args, _solve_ricc_dense_check_args
 from pymor.algorithms.to_matrix import to_matrix
 from pymor.core.config import config
-from pymor.core.defaults import defaults
+from pymor.core.defaults import defaults, get_defaults
 from pymor.core.exceptions import InversionError
 from pymor.operators.numpy import NumpyMatrixOperator
 
 
 @defaults('bicgstab_tol', 'bicgstab_maxiter', 'spilu_drop_tol',
-          'spilu_fill_factor', 'spilu_drop_rule', 'spilu_permc_spec', 'spsolve_permc_spec',
-          'spsolve_keep_factorization',
+          'spilu_fill_factor', 'spilu_drop_rule', 'spilu_permc_spec', 'spilu_keep_preconditioner',
+          'spsolve_permc_spec', 'spsolve_keep_factorization',
+          'block_cg_tol', 'block_cg_maxiter', 'block_cg_preconditioner',
+          'block_gmres_tol', 'block_gmres_maxiter', 'block_gmres_restart', 'block_gmres_preconditioner',
           'lgmres_tol', 'lgmres_maxiter', 'lgmres_inner_m', 'lgmres_outer_k', 'least_squares_lsmr_damp',
           'least_squares_lsmr_atol', 'least_squares_lsmr_btol', 'least_squares_lsmr_conlim',
           'least_squares_lsmr_maxiter', 'least_squares_lsmr_show', 'least_squares_lsqr_atol',
@@ -31,8 +41,16 @@ def solver_options(bicgstab_tol=1e-15,
                    spilu_fill_factor=10,
                    spilu_drop_rule=None,
                    spilu_permc_spec='COLAMD',
+                   spilu_keep_preconditioner=False,
                    spsolve_permc_spec='COLAMD',
                    spsolve_keep_factorization=True,
+                   block_cg_tol=1e-10,
+                   block_cg_maxiter=None,
+                   block_cg_preconditioner=None,
+                   block_gmres_tol=1e-10,
+                   block_gmres_maxiter=100,
+                   block_gmres_restart=10,
+                   block_gmres_preconditioner='spilu',
                    lgmres_tol=1e-5,
                    lgmres_maxiter=1000,
                    lgmres_inner_m=39,
@@ -65,10 +83,31 @@ def solver_options(bicgstab_tol=1e-15,
         See :func:`scipy.sparse.linalg.spilu`.
     spilu_permc_spec
         See :func:`scipy.sparse.linalg.spilu`.
+    spilu_keep_preconditioner
+        If `True`, the incomplete LU factorization is stored with the matrix and
+        reused in subsequent solves with the same ILU options. The matrix must
+        not be modified in-place afterwards.
     spsolve_permc_spec
         See :func:`scipy.sparse.linalg.spsolve`.
     spsolve_keep_factorization
         See :func:`scipy.sparse.linalg.spsolve`.
+    block_cg_tol
+        Relative residual tolerance of the block conjugate gradient method.
+    block_cg_maxiter
+        Maximum number of iterations of the block conjugate gradient method.
+        If `None`, ten times the dimension of the system is used.
+    block_cg_preconditioner
+        Preconditioner for the block conjugate gradient method (`None` or `'spilu'`).
+        Note that the incomplete LU factorization of a symmetric matrix is
+        not symmetric in general.
+    block_gmres_tol
+        Relative residual tolerance of the block GMRES method.
+    block_gmres_maxiter
+        Maximum number of restarts of the block GMRES method.
+    block_gmres_restart
+        Number of block Arnoldi steps after which the block GMRES method is restarted.
+    block_gmres_preconditioner
+        Right preconditioner for the block GMRES method (`None` or `'spilu'`).
     lgmres_tol
         See :func:`scipy.sparse.linalg.lgmres`.
     lgmres_maxiter
@@ -112,7 +151,8 @@ def solver_options(bicgstab_tol=1e-15,
                                          'spilu_drop_tol': spilu_drop_tol,
                                          'spilu_fill_factor': spilu_fill_factor,
                                          'spilu_drop_rule': spilu_drop_rule,
-                                         'spilu_permc_spec': spilu_permc_spec},
+                                         'spilu_permc_spec': spilu_permc_spec,
+                                         'keep_preconditioner': spilu_keep_preconditioner},
             'scipy_bicgstab':           {'type': 'scipy_bicgstab',
                                          'tol': bicgstab_tol,
                                          'maxiter': bicgstab_maxiter},
@@ -124,6 +164,25 @@ def solver_options(bicgstab_tol=1e-15,
                                          'maxiter': lgmres_maxiter,
                                          'inner_m': lgmres_inner_m,
                                          'outer_k': lgmres_outer_k},
+            'scipy_block_cg':           {'type': 'scipy_block_cg',
+                                         'tol': block_cg_tol,
+                                         'maxiter': block_cg_maxiter,
+                                         'preconditioner': block_cg_preconditioner,
+                                         'spilu_drop_tol': spilu_drop_tol,
+                                         'spilu_fill_factor': spilu_fill_factor,
+                                         'spilu_drop_rule': spilu_drop_rule,
+                                         'spilu_permc_spec': spilu_permc_spec,
+                                         'keep_preconditioner': spilu_keep_preconditioner},
+            'scipy_block_gmres':        {'type': 'scipy_block_gmres',
+                                         'tol': block_gmres_tol,
+                                         'maxiter': block_gmres_maxiter,
+                                         'restart': block_gmres_restart,
+                                         'preconditioner': block_gmres_preconditioner,
+                                         'spilu_drop_tol': spilu_drop_tol,
+                                         'spilu_fill_factor': spilu_fill_factor,
+                                         'spilu_drop_rule': spilu_drop_rule,
+                                         'spilu_permc_spec': spilu_permc_spec,
+                                         'keep_preconditioner': spilu_keep_preconditioner},
             'scipy_least_squares_lsqr': {'type': 'scipy_least_squares_lsqr',
                                          'damp': least_squares_lsqr_damp,
                                          'atol': least_squares_lsqr_atol,
@@ -169,7 +228,8 @@ def apply_inverse(op, V, initial_guess=None, options=None, least_squares=False,
         Test if solution only contains finite values.
     default_solver
         Default solver to use (scipy_spsolve, scipy_bicgstab, scipy_bicgstab_spilu,
-        scipy_lgmres, scipy_least_squares_lsmr, scipy_least_squares_lsqr).
+        scipy_lgmres, scipy_block_cg, scipy_block_gmres, scipy_least_squares_lsmr,
+        scipy_least_squares_lsqr).
     default_least_squares_solver
         Default solver to use for least squares problems (scipy_least_squares_lsmr,
         scipy_least_squares_lsqr).
@@ -205,9 +265,8 @@ def apply_inverse(op, V, initial_guess=None, options=None, least_squares=False,
                     raise InversionError('bicgstab failed with error code {} (illegal input or breakdown)'.
                                          format(info))
     elif options['type'] == 'scipy_bicgstab_spilu':
-        ilu = spilu(matrix, drop_tol=options['spilu_drop_tol'], fill_factor=options['spilu_fill_factor'],
-                    drop_rule=options['spilu_drop_rule'], permc_spec=options['spilu_permc_spec'])
-        precond = LinearOperator(matrix.shape, ilu.solve)
+        ilu = _spilu(matrix, promoted_type, options)
+        precond = LinearOperator(matrix.shape, ilu.solve, dtype=promoted_type)
         for i, VV in enumerate(V):
             R[i], info = bicgstab(matrix, VV, initial_guess[i] if initial_guess is not None else None,
                                   tol=options['tol'], maxiter=options['maxiter'], M=precond, atol='legacy')
@@ -232,11 +291,7 @@ def apply_inverse(op, V, initial_guess=None, options=None, least_squares=False,
                 # which should be zero.
                 R = matrix.factorization.solve(V.T).T.astype(promoted_type, copy=False)
             elif options['keep_factorization']:
-                # the matrix is always converted to the promoted type.
-                # if matrix.dtype == promoted_type, this is a no_op
-                matrix.factorization = splu(matrix_astype_nocopy(matrix.tocsc(), promoted_type),
-                                            permc_spec=options['permc_spec'])
-                matrix.factorizationdtype = promoted_type
+                _splu(matrix, promoted_type, options)
                 R = matrix.factorization.solve(V.T).T
             else:
                 # the matrix is always converted to the promoted type.
@@ -255,6 +310,25 @@ def apply_inverse(op, V, initial_guess=None, options=None, least_squares=False,
             if info > 0:
                 raise InversionError(f'lgmres failed to converge after {info} iterations')
             assert info == 0
+    elif options['type'] in ('scipy_block_cg', 'scipy_block_gmres'):
+        if options['preconditioner'] == 'spilu':
+            precond = _spilu(matrix, promoted_type, options).solve
+        elif options['preconditioner'] is None:
+            precond = None
+        else:
+            raise ValueError('Unknown preconditioner')
+        B = V.T.astype(promoted_type, copy=False)
+        X = (initial_guess.T.astype(promoted_type) if initial_guess is not None
+             else np.zeros((matrix.shape[1], len(V)), dtype=promoted_type))
+        if options['type'] == 'scipy_block_cg':
+            maxiter = options['maxiter'] if options['maxiter'] is not None else 10 * matrix.shape[0]
+            X, converged = _block_cg(matrix, B, X, options['tol'], maxiter, precond)
+        else:
+            X, converged = _block_gmres(matrix, B, X, options['tol'], options['maxiter'], options['restart'],
+                                        precond)
+        if not converged:
+            raise InversionError(f'{options["type"][6:]} failed to converge')
+        R = X.T
     elif options['type'] == 'scipy_least_squares_lsmr':
         from scipy.sparse.linalg import lsmr
         for i, VV in enumerate(V):
@@ -292,6 +366,136 @@ def apply_inverse(op, V, initial_guess=None, options=None, least_squares=False,
     return op.source.from_numpy(R)
 
 
+def factorize(matrix, options=None):
+    """Factorize a sparse matrix for subsequent calls of :func:`apply_inverse`.
+
+    If `options` select the `scipy_spsolve` solver, the sparse LU decomposition of
+    `matrix` is computed and stored with the matrix, independent of the
+    `keep_factorization` option. Otherwise, nothing is done.
+
+    Parameters
+    ----------
+    matrix
+        The |SciPy spmatrix| to factorize.
+    options
+        The |solver_options| which will be passed to :func:`apply_inverse`.
+        If `None`, the `default_solver` of :func:`apply_inverse` is assumed.
+
+    Returns
+    -------
+    `True` if `matrix` has been factorized, `False` otherwise.
+    """
+    if options is None:
+        options = get_defaults()[f'{apply_inverse.__module__}.{apply_inverse.__qualname__}.default_solver']
+    options = _parse_options(options, solver_options(), None, None, False)
+    if options['type'] != 'scipy_spsolve':
+        return False
+    if not hasattr(matrix, 'factorization'):
+        try:
+            _splu(matrix, matrix.dtype, options)
+        except RuntimeError as e:
+            raise InversionError(e) from e
+    return True
+
+
+def _splu(matrix, dtype, options):
+    # the matrix is always converted to the given dtype.
+    # if matrix.dtype == dtype, this is a no_op
+    matrix.factorization = splu(matrix_astype_nocopy(matrix.tocsc(), dtype), permc_spec=options['permc_spec'])
+    matrix.factorizationdtype = dtype
+
+
+def _spilu(matrix, dtype, options):
+    """Compute incomplete LU factorization of `matrix`, reusing a stored one if requested."""
+    key = (options['spilu_drop_tol'], options['spilu_fill_factor'], options['spilu_drop_rule'],
+           options['spilu_permc_spec'], np.dtype(dtype))
+    if options['keep_preconditioner'] and getattr(matrix, 'preconditioner_key', None) == key:
+        return matrix.preconditioner
+    ilu = spilu(matrix_astype_nocopy(matrix.tocsc(), dtype), drop_tol=options['spilu_drop_tol'],
+                fill_factor=options['spilu_fill_factor'], drop_rule=options['spilu_drop_rule'],
+                permc_spec=options['spilu_permc_spec'])
+    if options['keep_preconditioner']:
+        matrix.preconditioner, matrix.preconditioner_key = ilu, key
+    return ilu
+
+
+def _block_cg(A, B, X, tol, maxiter, M=None):
+    """Block preconditioned conjugate gradient method for all columns of `B` at once."""
+    norm_B = np.linalg.norm(B, axis=0)
+    norm_B[norm_B == 0] = 1
+    R = B - A @ X
+    Z = M(R) if M is not None else R
+    P = Z
+    RZ = _inner(R, Z)
+    for _ in range(maxiter):
+        if np.all(np.linalg.norm(R, axis=0) <= tol * norm_B):
+            return X, True
+        Q = A @ P
+        # least squares solves avoid breakdown when the residuals become linearly dependent
+        alpha = np.linalg.lstsq(_inner(P, Q), RZ, rcond=None)[0]
+        X = X + P @ alpha
+        R = R - Q @ alpha
+        Z = M(R) if M is not None else R
+        RZ_new = _inner(R, Z)
+        beta = np.linalg.lstsq(RZ, RZ_new, rcond=None)[0]
+        P = Z + P @ beta
+        RZ = RZ_new
+    return X, bool(np.all(np.linalg.norm(R, axis=0) <= tol * norm_B))
+
+
+def _block_gmres(A, B, X, tol, maxiter, restart, M=None):
+    """Restarted block GMRES method with right preconditioning for all columns of `B` at once."""
+    n, k = B.shape
+    norm_B = np.linalg.norm(B, axis=0)
+    norm_B[norm_B == 0] = 1
+    for _ in range(maxiter):
+        R = B - A @ X
+        if np.all(np.linalg.norm(R, axis=0) <= tol * norm_B):
+            return X, True
+        dtype = np.promote_types(R.dtype, A.dtype)
+        V = np.empty((n, (restart + 1) * k), dtype=dtype, order='F')
+        Z = np.empty((n, restart * k), dtype=dtype, order='F') if M is not None else V
+        H = np.zeros(((restart + 1) * k, restart * k), dtype=dtype)
+        V[:, :k], S = _block_orthonormalize(R)
+        for j in range(restart):
+            if M is not None:
+                Z[:, j*k:(j+1)*k] = M(V[:, j*k:(j+1)*k])
+            W = A @ Z[:, j*k:(j+1)*k]
+            # block classical Gram-Schmidt with reorthogonalization
+            Vj = V[:, :(j+1)*k]
+            for _ in range(2):
+                Hj = _inner(Vj, W)
+                W -= Vj @ Hj
+                H[:(j+1)*k, j*k:(j+1)*k] += Hj
+            V[:, (j+1)*k:(j+2)*k], H[(j+1)*k:(j+2)*k, j*k:(j+1)*k] = _block_orthonormalize(W)
+            E = np.zeros(((j + 2) * k, k), dtype=dtype)
+            E[:k] = S
+            Hj = H[:(j+2)*k, :(j+1)*k]
+            Y = np.linalg.lstsq(Hj, E, rcond=None)[0]
+            if np.all(np.linalg.norm(E - Hj @ Y, axis=0) <= tol * norm_B):
+                break
+        X = X + Z[:, :(j+1)*k] @ Y
+    return X, bool(np.all(np.linalg.norm(B - A @ X, axis=0) <= tol * norm_B))
+
+
+def _block_orthonormalize(W):
+    """Compute a thin QR decomposition of `W` using CholeskyQR2, falling back to Householder QR."""
+    try:
+        R1 = cholesky(_inner(W, W))
+        d = np.abs(np.diag(R1))
+        if d.min() > 1e-6 * d.max():
+            Q = W @ inv(R1)
+            R2 = cholesky(_inner(Q, Q))
+            return Q @ inv(R2), R2 @ R1
+    except LinAlgError:
+        pass
+    return qr(W, mode='economic')
+
+
+def _inner(X, Y):
+    return X.T @ Y if np.isrealobj(X) else X.T.conj() @ Y
+
+
 # unfortunately, this is necessary, as scipy does not
 # forward the copy=False argument in its csc_matrix.astype function
 def matrix_astype_nocopy(matrix, dtype):
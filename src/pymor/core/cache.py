@@ -16,7 +16,8 @@ instance.
 Making this assumption, the keys for cache lookup are created from
 the following data:
 
-    1. the instance's :attr:`~CacheableObject.cache_id` in case of a
+    1. the instance's :attr:`~CacheableObject.cache_id`, if set, else the
+       instance's :func:`content_hash` in case of a
        :attr:`~CacheRegion.persistent` :class:`CacheRegion`, else the instance's
        :attr:`~pymor.core.base.BasicObject.uid`,
     2. the method's `__name__`,
@@ -27,22 +28,30 @@ private attributes. It is the implementors responsibility not to break things.
 (See this :ref:`warning <ImmutableObjectWarning>`.)
 
 Backends for storage of cached return values derive from :class:`CacheRegion`.
-Currently two backends are provided for memory-based and disk-based caching
-(:class:`MemoryRegion` and :class:`DiskRegion`). The available regions
+Currently backends are provided for memory-based and disk-based caching
+(:class:`MemoryRegion`, :class:`DiskRegion` and :class:`SharedDiskRegion`). The available regions
 are stored in the module level `cache_regions` dict. The user can add
 additional regions (e.g. multiple disk cache regions) as required.
 :attr:`CacheableObject.cache_region` specifies a key of the `cache_regions` dict
 to select a cache region which should be used by the instance.
 (Setting :attr:`~CacheableObject.cache_region` to `None` or `'none'` disables caching.)
 
-By default, a 'memory', a 'disk' and a 'persistent' cache region are configured. The
-paths and maximum sizes of the disk regions, as well as the maximum number of keys of
-the memory cache region can be configured via the
+By default, a 'memory', a 'disk', a 'persistent' and a 'shared' cache region are
+configured. The 'shared' region is a :class:`SharedDiskRegion`, which can be used
+concurrently by multiple processes, e.g. by the workers of a |WorkerPool|. The
+paths and maximum sizes of the disk regions, as well as the maximum number of keys,
+the maximum size and the eviction policy of the memory cache region can be configured
+via the
 `pymor.core.cache.default_regions.disk_path`,
 `pymor.core.cache.default_regions.disk_max_size`,
 `pymor.core.cache.default_regions.persistent_path`,
-`pymor.core.cache.default_regions.persistent_max_size` and
-`pymor.core.cache.default_regions.memory_max_keys` |defaults|.
+`pymor.core.cache.default_regions.persistent_max_size`,
+`pymor.core.cache.default_regions.shared_path`,
+`pymor.core.cache.default_regions.shared_max_size`,
+`pymor.core.cache.default_regions.shared_shards`,
+`pymor.core.cache.default_regions.memory_max_keys`,
+`pymor.core.cache.default_regions.memory_max_size` and
+`pymor.core.cache.default_regions.memory_eviction_policy` |defaults|.
 
 There two ways to disable and enable caching in pyMOR:
 
@@ -59,29 +68,47 @@ any call to :func:`enable_caching`.
 
 A cache region can be emptied using :meth:`CacheRegion.clear`. The function
 :func:`clear_caches` clears each cache region registered in `cache_regions`.
+
+Statistics on the cached method calls of a cache region, e.g. the number of cache
+hits and misses and the time spent for computing cache keys, can be obtained using
+:meth:`CacheRegion.stats`. The statistics for a given block of code can be collected
+using the :func:`cache_statistics` context manager. :func:`format_cache_statistics`
+formats these statistics as a table.
 """
 
 import atexit
+import bz2
 import functools
 import getpass
 import hashlib
 import inspect
+import lzma
+import mmap
 import os
+import sys
 import tempfile
+import time
+import zlib
 from collections import OrderedDict
+from contextlib import contextmanager
 from copy import deepcopy
 from numbers import Number
-from types import MethodType
+from types import FunctionType, MethodType
 
 import diskcache
 import numpy as np
+import scipy.sparse as sps
 
 from pymor.core.base import ImmutableObject
 from pymor.core.defaults import defaults, defaults_changes
 from pymor.core.exceptions import CacheKeyGenerationError, UnpicklableError
 from pymor.core.logger import getLogger
-from pymor.core.pickle import dumps
+from pymor.core.pickle import dumps, loads
 from pymor.parameters.base import Mu
+from pymor.tools.table import format_table
+from pymor.vectorarrays.interface import VectorArray
+
+NoneType = type(None)
 
 
 @atexit.register
@@ -89,6 +116,8 @@ def cleanup_non_persistent_regions():
     for region in cache_regions.values():
         if not region.persistent:
             region.clear()
+        elif isinstance(region, TieredDiskRegion):
+            region.flush()
 
 
 def _safe_filename(old_name):
@@ -137,32 +166,185 @@ class CacheRegion:
         """Clear the entire cache region."""
         raise NotImplementedError
 
+    def stats(self):
+        """Return statistics on the cached method calls using this region.
+
+        The statistics are recorded by :class:`CacheableObject` for each call of a
+        :func:`cached` method. Direct calls of :meth:`get` and :meth:`set` are not
+        counted.
+
+        Returns
+        -------
+        Dict with the following keys:
+
+        :hits:        Number of cache hits.
+        :misses:      Number of cache misses.
+        :key_time:    Total time spent for computing cache keys.
+        :lookup_time: Total time spent for looking up cache entries.
+        :insert_time: Total time spent for inserting cache entries.
+        :bytes:       Total estimated size of all inserted values in bytes.
+        :evictions:   Number of entries evicted from the region or `None` if
+                      unknown.
+        :methods:     Dict mapping the qualified names of all cached methods
+                      to dicts with the statistics (except `evictions`) for
+                      the respective method.
+        """
+        methods = {m: dict(v) for m, v in self.__dict__.get('_method_stats', {}).items()}
+        return dict(_sum_stats(methods.values()), evictions=self._evictions(), methods=methods)
+
+    def _evictions(self):
+        return None
+
+    def _record_stats(self, method, **values):
+        method_stats = self.__dict__.setdefault('_method_stats', {})
+        _add_stats(method_stats.setdefault(method, dict.fromkeys(STATS_FIELDS, 0)), values)
+
+
+STATS_FIELDS = ('hits', 'misses', 'key_time', 'lookup_time', 'insert_time', 'bytes')
+
+
+def _add_stats(stats, values):
+    for k, v in values.items():
+        stats[k] += v
+
+
+def _sum_stats(stats):
+    total = dict.fromkeys(STATS_FIELDS, 0)
+    for s in stats:
+        _add_stats(total, s)
+    return total
+
 
 class MemoryRegion(CacheRegion):
+    """Cache region storing the cache entries in memory.
+
+    Cache entries are evicted when either the number of entries exceeds
+    `max_keys` or the estimated total size of all entries exceeds `max_size`
+    bytes. Values larger than `max_size` are not cached.
+
+    Values are not deep-copied when they are stored or retrieved. Instead,
+    |VectorArrays| are copied using their copy-on-write semantics, such that
+    their data is only copied when either the cached or the returned array is
+    modified. |NumPy arrays| are copied, |immutable| objects are shared and
+    all other objects are deep-copied.
+
+    Parameters
+    ----------
+    max_keys
+        Maximum number of cache entries.
+    max_size
+        Maximum estimated size of all cache entries in bytes. If `None`,
+        only the number of cache entries is limited.
+    eviction_policy
+        If `'lru'`, the least recently used entries are evicted first.
+        If `'lfu'`, the least frequently used entries are evicted first,
+        where entries of larger size are evicted before smaller entries
+        with the same number of accesses.
+    evict_callback
+        If not `None`, a function which is called with key and value of
+        each evicted cache entry.
+
+    Attributes
+    ----------
+    evictions
+        Number of evicted cache entries.
+    size
+        Estimated total size of all cache entries in bytes.
+    """
 
     NO_VALUE = {}
 
-    def __init__(self, max_keys):
+    def __init__(self, max_keys, max_size=None, eviction_policy='lru', evict_callback=None):
+        assert eviction_policy in ('lru', 'lfu')
         self.max_keys = max_keys
-        self._cache = OrderedDict()
+        self.max_size = max_size
+        self.eviction_policy = eviction_policy
+        self.evict_callback = evict_callback
+        self.evictions = 0
+        self.clear()
 
     def get(self, key):
-        value = self._cache.get(key, self.NO_VALUE)
-        if value is self.NO_VALUE:
+        entry = self._cache.get(key, self.NO_VALUE)
+        if entry is self.NO_VALUE:
             return False, None
         else:
-            return True, deepcopy(value)
+            self._cache.move_to_end(key)
+            entry[2] += 1
+            return True, _copy_value(entry[0])
 
     def set(self, key, value):
         if key in self._cache:
             getLogger('pymor.core.cache.MemoryRegion').warning('Key already present in cache region, ignoring.')
             return
-        if len(self._cache) == self.max_keys:
-            self._cache.popitem(last=False)
-        self._cache[key] = deepcopy(value)
+        size = _estimate_size(value)
+        if self.max_size is not None and size > self.max_size:
+            getLogger('pymor.core.cache.MemoryRegion').info(
+                f'Value of size {size} exceeds max_size of cache region. Not caching result.'
+            )
+            return
+        while self._cache and (len(self._cache) >= self.max_keys
+                               or self.max_size is not None and self.size + size > self.max_size):
+            self._evict()
+        self._cache[key] = [_copy_value(value), size, 0]
+        self.size += size
 
     def clear(self):
         self._cache = OrderedDict()
+        self.size = 0
+
+    def _evictions(self):
+        return self.evictions
+
+    def _evict(self):
+        if self.eviction_policy == 'lru':
+            key = next(iter(self._cache))
+        else:
+            # min returns the first, i.e. least recently used, of all minimal entries
+            key = min(self._cache, key=lambda k: (self._cache[k][2], -self._cache[k][1]))
+        value, size, _ = self._cache.pop(key)
+        self.size -= size
+        self.evictions += 1
+        if self.evict_callback is not None:
+            self.evict_callback(key, value)
+
+
+def _copy_value(value):
+    t = type(value)
+    if t in (NoneType, bool, int, float, complex, str, bytes) or isinstance(value, ImmutableObject):
+        return value
+    elif isinstance(value, VectorArray):
+        return value.copy()
+    elif t is np.ndarray:
+        return value.copy(order='K')
+    elif t in (list, tuple):
+        return t(_copy_value(v) for v in value)
+    elif t is dict:
+        return {k: _copy_value(v) for k, v in value.items()}
+    else:
+        return deepcopy(value)
+
+
+def _itemsize(U):
+    try:
+        # only convert a single vector to determine the data type
+        return U[:1].to_numpy().itemsize
+    except NotImplementedError:
+        # assume real double precision data for arrays without NumPy representation
+        return np.dtype(float).itemsize
+
+
+def _estimate_size(value):
+    t = type(value)
+    if isinstance(value, VectorArray):
+        return len(value) * value.dim * _itemsize(value)
+    elif t is np.ndarray:
+        return value.nbytes
+    elif t in (list, tuple):
+        return sys.getsizeof(value) + sum(_estimate_size(v) for v in value)
+    elif t is dict:
+        return sys.getsizeof(value) + sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    else:
+        return sys.getsizeof(value)
 
 
 class DiskRegion(CacheRegion):
@@ -176,18 +358,21 @@ class DiskRegion(CacheRegion):
 
         if not persistent:
             self.clear()
+        else:
+            self._initial_len, self._added = len(self._cache), 0
 
     def get(self, key):
         has_key = key in self._cache
         return has_key, self._cache.get(key, default=None)
 
     def set(self, key, value):
-        has_key = key in self._cache
-        if has_key:
-            getLogger('pymor.core.cache.DiskRegion').warning('Key already present in cache region, ignoring.')
-            return
+        # add atomically checks for the key, which matters when other
+        # processes access the same cache directory
         try:
-            self._cache.set(key, value)
+            if self._cache.add(key, value):
+                self._added += 1
+            else:
+                getLogger('pymor.core.cache.DiskRegion').warning('Key already present in cache region, ignoring.')
         except UnpicklableError as e:
             getLogger('pymor.core.cache.DiskRegion').warning(f'{e.cls} cannot be pickled. Not caching result.')
         except (TypeError, AttributeError) as e:
@@ -195,14 +380,287 @@ class DiskRegion(CacheRegion):
 
     def clear(self):
         self._cache.clear()
+        self._initial_len, self._added = 0, 0
+
+    def _evictions(self):
+        # diskcache silently culls entries when the size limit is exceeded
+        return self._initial_len + self._added - len(self._cache)
+
+
+class SharedDiskRegion(DiskRegion):
+    """Disk-based cache region shared between multiple processes.
+
+    The cache entries are stored in a :class:`diskcache.FanoutCache`, which
+    distributes the entries over multiple independent shards to reduce
+    lock contention between processes accessing the region concurrently.
+    Entries are inserted atomically, such that concurrent insertions of the
+    same key by different processes are safe. All local processes, e.g. the
+    workers of a |WorkerPool|, which open a `SharedDiskRegion` with the same
+    `path` reuse each other's results.
+
+    As the :attr:`~pymor.core.base.BasicObject.uid` of an object differs
+    between processes, the region is :attr:`~CacheRegion.persistent`, i.e.,
+    cache keys are computed using :func:`content_hash`, and the region is never
+    cleared automatically.
+
+    Instances of `SharedDiskRegion` can be pickled for transfer to other
+    processes.
+
+    Parameters
+    ----------
+    path
+        Path of the cache directory.
+    max_size
+        Maximum size of the cache in bytes.
+    shards
+        Number of shards.
+    """
+
+    persistent = True
+    NO_VALUE = object()
+
+    def __init__(self, path, max_size, shards=8):
+        self.path = path
+        self.max_size = max_size
+        self.shards = shards
+        self._cache = diskcache.FanoutCache(path, shards=shards, size_limit=int(max_size))
+
+    def __getstate__(self):
+        return self.path, self.max_size, self.shards
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def get(self, key):
+        # a single lookup avoids races with concurrent evictions
+        value = self._cache.get(key, default=self.NO_VALUE)
+        if value is self.NO_VALUE:
+            return False, None
+        return True, value
+
+    def set(self, key, value):
+        try:
+            if not self._cache.add(key, value):
+                getLogger('pymor.core.cache.SharedDiskRegion').debug('Key already added by other process.')
+        except UnpicklableError as e:
+            getLogger('pymor.core.cache.SharedDiskRegion').warning(f'{e.cls} cannot be pickled. Not caching result.')
+        except (TypeError, AttributeError) as e:
+            getLogger('pymor.core.cache.SharedDiskRegion').warning(
+                f'Pickling failed. Not caching result (error: {e}).'
+            )
+
+    def _evictions(self):
+        # entries are also added by other processes
+        return None
+
+
+class TieredDiskRegion(CacheRegion):
+    """Cache region with an in-memory hot tier and an on-disk cold tier.
+
+    The hot tier is a :class:`MemoryRegion`. The cold tier is a :class:`diskcache.Cache`
+    in which each value is stored as a single file. All
+    contiguous |NumPy arrays| contained in the value, e.g. the data of
+    |NumpyVectorArrays|, are written as raw data blocks next to the
+    pickled remainder of the value, such that they are neither copied
+    during pickling nor unpickling. Uncompressed blocks are memory-mapped
+    when an entry is read from the cold tier, so data is only loaded from
+    disk when accessed. Modifications of the returned arrays do not affect
+    the stored data. Alternatively, all blocks can be compressed using one
+    of the codecs in :attr:`CODECS`.
+
+    Parameters
+    ----------
+    path
+        Path of the cache directory of the cold tier.
+    max_size
+        Maximum size of the cold tier in bytes.
+    persistent
+        If `True`, cache entries are kept between multiple program runs.
+    memory_max_keys
+        Maximum number of entries in the hot tier.
+    memory_max_size
+        Maximum estimated size of the hot tier in bytes.
+    compression
+        If not `None`, the key in :attr:`CODECS` of the codec used for
+        compressing the data in the cold tier.
+    promotion_threshold
+        Number of cold tier hits after which an entry is promoted to the
+        hot tier. If `None`, cold tier entries are never promoted.
+    demotion
+        If `'write_through'`, new entries are immediately written to both tiers.
+        If `'evict'`, new entries are only written to the cold tier when they are
+        evicted from the hot tier or when :meth:`flush` is called, which
+        happens automatically at program exit for persistent regions.
+    """
+
+    CODECS = {
+        'zlib': (zlib.compress, zlib.decompress),
+        'bz2': (bz2.compress, bz2.decompress),
+        'lzma': (lzma.compress, lzma.decompress),
+    }
+    ALIGNMENT = 64
+    NO_VALUE = object()
+
+    def __init__(self, path, max_size, persistent, memory_max_keys=100, memory_max_size=1024 ** 3,
+                 compression=None, promotion_threshold=1, demotion='write_through'):
+        assert compression is None or compression in self.CODECS
+        assert promotion_threshold is None or promotion_threshold >= 1
+        assert demotion in ('write_through', 'evict')
+        self.path = path
+        self.max_size = max_size
+        self.persistent = persistent
+        self.compression = compression
+        self.promotion_threshold = promotion_threshold
+        self.demotion = demotion
+        self.memory_region = MemoryRegion(memory_max_keys, max_size=memory_max_size,
+                                          evict_callback=self._demote if demotion == 'evict' else None)
+        self._cache = diskcache.Cache(path)
+        self._cache.reset('size_limit', int(max_size))
+        self._cold_hits = {}
+
+        if not persistent:
+            self.clear()
+        else:
+            self._initial_len, self._added = len(self._cache), 0
+
+    def get(self, key):
+        found, value = self.memory_region.get(key)
+        if found:
+            return True, value
+        f = self._cache.get(key, default=self.NO_VALUE, read=True)
+        if f is self.NO_VALUE:
+            return False, None
+        with f:
+            value = self._read_blob(f)
+        if self.promotion_threshold is not None:
+            hits = self._cold_hits.get(key, 0) + 1
+            if hits >= self.promotion_threshold:
+                self._cold_hits.pop(key, None)
+                self.memory_region.set(key, value)
+            else:
+                self._cold_hits[key] = hits
+        return True, value
+
+    def set(self, key, value):
+        if key in self.memory_region._cache:
+            getLogger('pymor.core.cache.TieredDiskRegion').warning('Key already present in cache region, ignoring.')
+            return
+        self.memory_region.set(key, value)
+        # values exceeding the size of the hot tier are always written to the cold tier
+        if self.demotion == 'write_through' or key not in self.memory_region._cache:
+            self._write_blob(key, value)
+
+    def clear(self):
+        self.memory_region.clear()
+        self._cache.clear()
+        self._cold_hits = {}
+        self._initial_len, self._added = 0, 0
+
+    def flush(self):
+        """Write all entries of the hot tier to the cold tier."""
+        for key, (value, _, _) in self.memory_region._cache.items():
+            self._demote(key, value)
 
+    def _demote(self, key, value):
+        if key not in self._cache:
+            self._write_blob(key, value)
 
-@defaults('disk_path', 'disk_max_size', 'persistent_path', 'persistent_max_size', 'memory_max_keys')
+    def _write_blob(self, key, value):
+        buffers = []
+        try:
+            data = dumps(value, protocol=5, buffer_callback=buffers.append)
+        except UnpicklableError as e:
+            getLogger('pymor.core.cache.TieredDiskRegion').warning(f'{e.cls} cannot be pickled. Not caching result.')
+            return
+        except (TypeError, AttributeError) as e:
+            getLogger('pymor.core.cache.TieredDiskRegion').warning(
+                f'Pickling failed. Not caching result (error: {e}).'
+            )
+            return
+        blocks = [memoryview(data)] + [b.raw() for b in buffers]
+        if self.compression:
+            compress = self.CODECS[self.compression][0]
+            blocks = [memoryview(compress(b)) for b in blocks]
+
+        # compute offsets of all blocks, the header size is computed iteratively
+        # as it depends on the offsets
+        header_size = 0
+        while True:
+            offsets, offset = [], self._align(8 + header_size)
+            for b in blocks:
+                offsets.append((offset, b.nbytes))
+                offset = self._align(offset + b.nbytes)
+            header = dumps((self.compression, offsets))
+            if len(header) == header_size:
+                break
+            header_size = len(header)
+
+        chunks, pos = [len(header).to_bytes(8, 'little'), header], 8 + header_size
+        for (offset, _), b in zip(offsets, blocks):
+            chunks.extend((bytes(offset - pos), b))
+            pos = offset + b.nbytes
+        if self._cache.add(key, _ChunkReader(chunks), read=True):
+            self._added += 1
+
+    def _evictions(self):
+        # count entries evicted from the cold tier, i.e. from the region
+        return self._initial_len + self._added - len(self._cache)
+
+    def _read_blob(self, f):
+        header_size = int.from_bytes(f.read(8), 'little')
+        compression, offsets = loads(f.read(header_size))
+        if compression:
+            decompress = self.CODECS[compression][1]
+            blocks = []
+            for offset, size in offsets:
+                f.seek(offset)
+                blocks.append(decompress(f.read(size)))
+            # ensure that the returned arrays are writable
+            buffers = [bytearray(b) for b in blocks[1:]]
+        else:
+            # map a private copy of the file such that the returned arrays are
+            # writable without modifying the cache entry
+            data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+            blocks = [data[offset:offset+size] for offset, size in offsets]
+            buffers = blocks[1:]
+        return loads(blocks[0], buffers=buffers)
+
+    @classmethod
+    def _align(cls, offset):
+        return -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
+
+
+class _ChunkReader:
+    """File-like object reading a sequence of bytes-like chunks without copying."""
+
+    def __init__(self, chunks):
+        self.chunks = [memoryview(c).cast('B') for c in chunks]
+        self.chunks.reverse()
+
+    def read(self, size):
+        while self.chunks:
+            chunk = self.chunks[-1]
+            if len(chunk) > size:
+                self.chunks[-1] = chunk[size:]
+                return chunk[:size]
+            self.chunks.pop()
+            if len(chunk):
+                return chunk
+        return b''
+
+
+@defaults('disk_path', 'disk_max_size', 'persistent_path', 'persistent_max_size', 'memory_max_keys',
+          'memory_max_size', 'memory_eviction_policy', 'shared_path', 'shared_max_size', 'shared_shards')
 def default_regions(disk_path=os.path.join(tempfile.gettempdir(), 'pymor.cache.' + getpass.getuser()),
                     disk_max_size=1024 ** 3,
                     persistent_path=os.path.join(tempfile.gettempdir(), 'pymor.persistent.cache.' + getpass.getuser()),
                     persistent_max_size=1024 ** 3,
-                    memory_max_keys=1000):
+                    memory_max_keys=1000,
+                    memory_max_size=1024 ** 3,
+                    memory_eviction_policy='lru',
+                    shared_path=os.path.join(tempfile.gettempdir(), 'pymor.shared.cache.' + getpass.getuser()),
+                    shared_max_size=1024 ** 3,
+                    shared_shards=8):
 
     parse_size_string = lambda size: \
         int(size[:-1]) * 1024 if size[-1] == 'K' else \
@@ -212,10 +670,16 @@ def default_regions(disk_path=os.path.join(tempfile.gettempdir(), 'pymor.cache.'
 
     if isinstance(disk_max_size, str):
         disk_max_size = parse_size_string(disk_max_size)
+    if isinstance(memory_max_size, str):
+        memory_max_size = parse_size_string(memory_max_size)
+    if isinstance(shared_max_size, str):
+        shared_max_size = parse_size_string(shared_max_size)
 
     cache_regions['disk'] = DiskRegion(path=disk_path, max_size=disk_max_size, persistent=False)
     cache_regions['persistent'] = DiskRegion(path=persistent_path, max_size=persistent_max_size, persistent=True)
-    cache_regions['memory'] = MemoryRegion(memory_max_keys)
+    cache_regions['memory'] = MemoryRegion(memory_max_keys, max_size=memory_max_size,
+                                           eviction_policy=memory_eviction_policy)
+    cache_regions['shared'] = SharedDiskRegion(path=shared_path, max_size=shared_max_size, shards=shared_shards)
 
 
 cache_regions = {}
@@ -243,6 +707,84 @@ def clear_caches():
         r.clear()
 
 
+@contextmanager
+def cache_statistics():
+    """Context manager collecting statistics on all cached method calls in the `with` block.
+
+    Example::
+
+        with cache_statistics() as stats:
+            rb_greedy(fom, reductor, training_set)
+        print(format_cache_statistics(stats))
+
+    Yields
+    ------
+    Dict, which is filled at the end of the `with` block, mapping the names of
+    all cache regions which have been used in the block to dicts with the
+    statistics of the block's cached method calls, as described in
+    :meth:`CacheRegion.stats`.
+    """
+    collector = {}
+    evictions = {name: (region, region._evictions()) for name, region in cache_regions.items()}
+    _stats_collectors.append(collector)
+    stats = {}
+    try:
+        yield stats
+    finally:
+        _stats_collectors.remove(collector)
+        for name, (region, methods) in collector.items():
+            initial_region, initial_evictions = evictions.get(name, (None, 0))
+            region_evictions = region._evictions()
+            if region_evictions is not None and region is initial_region:
+                region_evictions -= initial_evictions
+            stats[name] = dict(_sum_stats(methods.values()), evictions=region_evictions, methods=methods)
+
+
+def format_cache_statistics(stats=None, width='AUTO'):
+    """Format cache statistics as a table.
+
+    Parameters
+    ----------
+    stats
+        Dict mapping names of cache regions to their statistics, as yielded
+        by :func:`cache_statistics`. If `None`, the statistics returned by
+        :meth:`CacheRegion.stats` for all regions in `cache_regions` are formatted.
+    width
+        Maximum width of the table. If `'AUTO'`, the terminal width is used.
+
+    Returns
+    -------
+    The formatted table as a string.
+    """
+    if stats is None:
+        stats = {name: region.stats() for name, region in cache_regions.items()}
+
+    def row(region, method, s):
+        calls = s['hits'] + s['misses']
+        return [region, method, s['hits'], s['misses'],
+                f'{s["hits"] / calls:.1%}' if calls else '-',
+                f'{s["key_time"]:.3f}', f'{s["lookup_time"]:.3f}', f'{s["insert_time"]:.3f}',
+                f'{s["bytes"] / 1024 ** 2:.1f}',
+                '-' if s.get('evictions', '-') is None else s.get('evictions', '')]
+
+    rows = [['region', 'method', 'hits', 'misses', 'hit rate', 'key [s]', 'lookup [s]', 'insert [s]',
+             'inserted [MiB]', 'evictions']]
+    for name, region_stats in stats.items():
+        rows.append(row(name, '', region_stats))
+        rows.extend(row('', method, s) for method, s in sorted(region_stats['methods'].items()))
+    return format_table(rows, width=width, title='Cache statistics')
+
+
+_stats_collectors = []
+
+
+def _record_stats(region_name, region, method, **values):
+    region._record_stats(method, **values)
+    for collector in _stats_collectors:
+        methods = collector.setdefault(region_name, (region, {}))[1]
+        _add_stats(methods.setdefault(method, dict.fromkeys(STATS_FIELDS, 0)), values)
+
+
 class CacheableObject(ImmutableObject):
     """Base class for anything that wants to use our built-in caching.
 
@@ -280,10 +822,10 @@ class CacheableObject(ImmutableObject):
             is disabled.
         cache_id
             Identifier for the object instance on which a cached method is called.
-            Must be specified when `region` is :attr:`~CacheRegion.persistent`.
-            When `region` is not :attr:`~CacheRegion.persistent` and no `cache_id`
-            is given, the object's :attr:`~pymor.core.base.BasicObject.uid`
-            is used instead.
+            When `region` is :attr:`~CacheRegion.persistent` and no `cache_id`
+            is given, the object's :func:`content_hash` is used instead.
+            Otherwise, the object's :attr:`~pymor.core.base.BasicObject.uid`
+            is used.
         """
         self.__dict__['cache_id'] = cache_id
         if region in (None, 'none'):
@@ -292,7 +834,8 @@ class CacheableObject(ImmutableObject):
             self.__dict__['cache_region'] = region
             r = cache_regions.get(region, None)
             if r and r.persistent and cache_id is None:
-                raise ValueError('For persistent CacheRegions a cache_id has to be specified.')
+                # fail early if no content hash can be computed for the object
+                content_hash(self)
 
     def cached_method_call(self, method, *args, **kwargs):
         """Call a given `method` and cache the return value.
@@ -334,9 +877,10 @@ class CacheableObject(ImmutableObject):
         except KeyError as e:
             raise KeyError(f'No cache region "{self.cache_region}" found') from e
 
+        tic = time.perf_counter()
+
         # id for self
-        assert self.cache_id or not region.persistent
-        self_id = self.cache_id or self.uid
+        self_id = self.cache_id or (content_hash(self) if region.persistent else self.uid)
 
         # ensure that passing a value as positional or keyword argument does not matter
         kwargs.update(zip(argnames, args))
@@ -351,17 +895,27 @@ class CacheableObject(ImmutableObject):
             kwargs['mu'] = self.parameters.parse(kwargs['mu'])
 
         key = build_cache_key((method.__name__, self_id, kwargs))
+        toc = time.perf_counter()
+        key_time, tic = toc - tic, toc
         found, value = region.get(key)
+        lookup_time = time.perf_counter() - tic
+        method_name = f'{self.__class__.__name__}.{method.__name__}'
 
         if found:
+            _record_stats(self.cache_region, region, method_name,
+                          hits=1, key_time=key_time, lookup_time=lookup_time)
             value, cached_defaults_changes = value
             if cached_defaults_changes != defaults_changes():
                 getLogger('pymor.core.cache').warning('pyMOR defaults have been changed. Cached result may be wrong.')
             return value
         else:
-            self.logger.debug(f'creating new cache entry for {self.__class__.__name__}.{method.__name__}')
+            self.logger.debug(f'creating new cache entry for {method_name}')
             value = method(self, **kwargs) if pass_self else method(**kwargs)
+            tic = time.perf_counter()
             region.set(key, (value, defaults_changes()))
+            _record_stats(self.cache_region, region, method_name,
+                          misses=1, key_time=key_time, lookup_time=lookup_time,
+                          insert_time=time.perf_counter() - tic, bytes=_estimate_size(value))
             return value
 
 
@@ -382,9 +936,6 @@ def cached(function):
     return wrapper
 
 
-NoneType = type(None)
-
-
 def build_cache_key(obj):
 
     def transform_obj(obj):
@@ -397,6 +948,8 @@ def build_cache_key(obj):
             return obj
         elif t is Mu:
             return transform_obj(obj._raw_values)
+        elif isinstance(obj, ImmutableObject):
+            return ('ImmutableObject', content_hash(obj))
         elif t in (list, tuple):
             return tuple(transform_obj(o) for o in obj)
         elif t in (set, frozenset):
@@ -413,3 +966,132 @@ def build_cache_key(obj):
     key = hashlib.sha256(dumps(obj, protocol=-1)).hexdigest()
 
     return key
+
+
+HASH_CHUNK_SIZE = 2 ** 20
+
+
+def content_hash(obj):
+    """Compute a hash of an |ImmutableObject| based on its `__init__` arguments.
+
+    As the state of an |ImmutableObject| is determined by its `__init__`
+    arguments, equal hashes are obtained for objects of the same class which
+    have been constructed with equal arguments, in particular across different
+    program runs and processes. The hash is memoized per instance.
+
+    The following `__init__` argument values are supported: `None`, numbers,
+    strings, bytes, |NumPy arrays|, :mod:`scipy.sparse` matrices, |parameter values|,
+    |VectorArrays| which support :meth:`~pymor.vectorarrays.interface.VectorArray.to_numpy`,
+    classes and functions defined at module level, other |immutable| objects, as
+    well as lists, tuples, sets and dicts of those. The data of arrays and
+    matrices is hashed in chunks of `HASH_CHUNK_SIZE` bytes without serializing it.
+
+    Parameters
+    ----------
+    obj
+        The |ImmutableObject| to hash.
+
+    Returns
+    -------
+    The hash as a hex string.
+
+    Raises
+    ------
+    CacheKeyGenerationError
+        No hash can be computed for some `__init__` argument of the object.
+    """
+    assert isinstance(obj, ImmutableObject)
+    try:
+        return obj.__dict__['_content_hash']
+    except KeyError:
+        pass
+    if obj._init_has_args or obj._init_has_kwargs:
+        raise CacheKeyGenerationError(f'Cannot compute content hash for {type(obj).__name__} '
+                                      f'(__init__ has variable arguments)')
+    h = hashlib.sha256()
+    _update_hash(h, type(obj))
+    for arg in obj._init_arguments:
+        try:
+            value = getattr(obj, arg)
+        except AttributeError as e:
+            raise CacheKeyGenerationError(f'Cannot compute content hash for {type(obj).__name__} '
+                                          f'(__init__ argument {arg} is not stored as attribute)') from e
+        _update_hash(h, arg)
+        _update_hash(h, value)
+    obj._content_hash = h.hexdigest()
+    return obj._content_hash
+
+
+def _update_hash(h, obj):
+    t = type(obj)
+    h.update(t.__qualname__.encode())
+    if t in (NoneType, bool, int, float, complex):
+        h.update(repr(obj).encode())
+    elif t is str:
+        h.update(repr(obj).encode())
+    elif t is bytes:
+        h.update(repr(len(obj)).encode())
+        h.update(obj)
+    elif t is np.ndarray:
+        _update_hash_array(h, obj)
+    elif sps.issparse(obj):
+        if obj.format not in ('csr', 'csc'):
+            obj = obj.tocsr()
+        h.update(repr((obj.format, obj.shape)).encode())
+        for a in (obj.data, obj.indices, obj.indptr):
+            _update_hash_array(h, a)
+    elif t is Mu:
+        _update_hash(h, obj._raw_values)
+    elif isinstance(obj, ImmutableObject):
+        h.update(content_hash(obj).encode())
+    elif isinstance(obj, VectorArray):
+        _update_hash(h, obj.space)
+        try:
+            array = obj.to_numpy()
+        except NotImplementedError as e:
+            raise CacheKeyGenerationError(f'Cannot compute content hash for {obj}') from e
+        _update_hash_array(h, array)
+    elif isinstance(obj, (list, tuple)):
+        h.update(repr(len(obj)).encode())
+        for o in obj:
+            _update_hash(h, o)
+    elif isinstance(obj, (set, frozenset)):
+        # the elements are not necessarily comparable, so sort their hashes instead
+        h.update(repr(len(obj)).encode())
+        for digest in sorted(_digest(o) for o in obj):
+            h.update(digest)
+    elif isinstance(obj, dict):
+        h.update(repr(len(obj)).encode())
+        for digest in sorted(_digest(k, v) for k, v in obj.items()):
+            h.update(digest)
+    elif isinstance(obj, Number):
+        # handle numpy number objects
+        h.update(repr(obj).encode())
+    elif isinstance(obj, (type, FunctionType)) and '<' not in obj.__qualname__:
+        # only classes and functions defined at module level can be identified by their name
+        h.update(f'{obj.__module__}.{obj.__qualname__}'.encode())
+    else:
+        raise CacheKeyGenerationError(f'Cannot compute content hash for {obj}')
+
+
+def _digest(*objs):
+    h = hashlib.sha256()
+    for obj in objs:
+        _update_hash(h, obj)
+    return h.digest()
+
+
+def _update_hash_array(h, array):
+    if array.dtype == object:
+        raise CacheKeyGenerationError('Cannot compute content hash for object arrays')
+    h.update(repr((array.dtype.str, array.shape)).encode())
+    if array.ndim == 0:
+        array = array.reshape(1)
+    if array.flags.c_contiguous:
+        data = memoryview(array.reshape(-1).view(np.uint8))
+        for i in range(0, len(data), HASH_CHUNK_SIZE):
+            h.update(data[i:i+HASH_CHUNK_SIZE])
+    else:
+        rows = max(HASH_CHUNK_SIZE // max(array[0:1].nbytes, 1), 1)
+        for i in range(0, len(array), rows):
+            h.update(np.ascontiguousarray(array[i:i+rows]).reshape(-1).view(np.uint8))
@@ -40,9 +40,9 @@ if platform.python_implementation() == 'CPython':
         pickler.persistent_id = _function_pickling_handler
         pickler.dump(obj)
 
-    def dumps(obj, protocol=None):
+    def dumps(obj, protocol=None, buffer_callback=None):
         file = IOtype()
-        pickler = pickle.Pickler(file, protocol=protocol or PROTOCOL)
+        pickler = pickle.Pickler(file, protocol=protocol or PROTOCOL, buffer_callback=buffer_callback)
         pickler.persistent_id = _function_pickling_handler
         pickler.dump(obj)
         return file.getvalue()
@@ -52,9 +52,9 @@ if platform.python_implementation() == 'CPython':
         unpickler.persistent_load = _function_unpickling_handler
         return unpickler.load()
 
-    def loads(str):
+    def loads(str, buffers=None):
         file = IOtype(str)
-        unpickler = pickle.Unpickler(file)
+        unpickler = pickle.Unpickler(file, buffers=buffers)
         unpickler.persistent_load = _function_unpickling_handler
         return unpickler.load()
 
@@ -62,8 +62,8 @@ else:
     def dump(obj, file, protocol=None):
         pickle.dump(obj, file, protocol=protocol or PROTOCOL)
 
-    def dumps(obj, protocol=None):
-        pickle.dumps(obj, protocol=protocol or PROTOCOL)
+    def dumps(obj, protocol=None, buffer_callback=None):
+        return pickle.dumps(obj, protocol=protocol or PROTOCOL, buffer_callback=buffer_callback)
 
     load = pickle.load
     loads = pickle.loads
@@ -4,6 +4,7 @@
 
 import numpy as np
 
+from pymor.algorithms.batch import apply_batch, as_range_array_batch, dense_affine_decomposition, solve_batch
 from pymor.algorithms.timestepping import TimeStepper
 from pymor.models.interface import Model
 from pymor.operators.constructions import ConstantOperator, IdentityOperator, VectorOperator, ZeroOperator
@@ -88,6 +89,56 @@ class StationaryModel(Model):
     def _compute_solution(self, mu=None, **kwargs):
         return self.operator.apply_inverse(self.rhs.as_range_array(mu), mu=mu)
 
+    def _compute_batch(self, mus, solution=False, output=False, solution_error_estimate=False,
+                       input=None, **kwargs):
+        """Compute solutions for multiple |parameter values| simultaneously.
+
+        If :attr:`!operator` and :attr:`!rhs` are (linear combinations of) dense
+        |NumpyMatrixOperators|, as is the case for reduced models obtained by
+        Galerkin projection, the coefficients for all |parameter values| are
+        evaluated at once, the system matrices are assembled as a stacked
+        three-dimensional array and all systems are solved with a single call of
+        :func:`numpy.linalg.solve` (see :mod:`pymor.algorithms.batch`). Otherwise,
+        e.g. if the model has inputs or :meth:`!_compute_solution` is overridden,
+        the default implementation of :meth:`~pymor.models.interface.Model._compute_batch`
+        is used.
+
+        Note that solutions computed in batch mode are not :mod:`cached <pymor.core.cache>`.
+        """
+        if (kwargs or input is not None or self.dim_input > 0
+                or type(self)._compute_solution is not StationaryModel._compute_solution
+                or (self.operator.solver_options and self.operator.solver_options.get('inverse'))):
+            operator_decomposition = rhs_decomposition = None
+        else:
+            operator_decomposition = dense_affine_decomposition(self.operator)
+            rhs_decomposition = dense_affine_decomposition(self.rhs)
+        if operator_decomposition is None or rhs_decomposition is None:
+            return super()._compute_batch(mus, solution=solution, output=output,
+                                          solution_error_estimate=solution_error_estimate,
+                                          input=input, **kwargs)
+
+        data = {}
+        if not (solution or output or solution_error_estimate):
+            return data
+
+        U = self.solution_space.make_array(solve_batch(operator_decomposition, rhs_decomposition, mus))
+        data['solution'] = U
+
+        if output:
+            data['output'] = apply_batch(self.output_functional, U, mus).to_numpy()
+
+        if solution_error_estimate:
+            if self.error_estimator is None:
+                raise ValueError('Model has no error estimator')
+            if hasattr(self.error_estimator, 'estimate_error_batch'):
+                estimates = self.error_estimator.estimate_error_batch(U, mus, self)
+            else:
+                estimates = np.hstack([self.error_estimator.estimate_error(U[i], mu, self)
+                                       for i, mu in enumerate(mus)]) if mus else np.empty(0)
+            data['solution_error_estimate'] = estimates
+
+        return data
+
     def _compute_solution_d_mu_single_direction(self, parameter, index, solution, mu):
         lhs_d_mu = self.operator.d_mu(parameter, index).apply(solution, mu=mu)
         rhs_d_mu = self.rhs.d_mu(parameter, index).as_range_array(mu)
@@ -275,7 +326,7 @@ class InstationaryModel(Model):
         Name of the model.
     """
 
-    _compute_allowed_kwargs = frozenset({'return_error_sequence'})
+    _compute_allowed_kwargs = frozenset({'return_error_sequence', 'sink'})
 
     def __init__(self, T, initial_data, operator, rhs, mass=None, time_stepper=None, num_values=None,
                  output_functional=None, products=None, error_estimator=None, visualizer=None, name=None):
@@ -326,16 +377,96 @@ class InstationaryModel(Model):
     def with_time_stepper(self, **kwargs):
         return self.with_(time_stepper=self.time_stepper.with_(**kwargs))
 
+    def _compute(self, solution=False, output=False, solution_d_mu=False, output_d_mu=False,
+                 solution_error_estimate=False, output_error_estimate=False,
+                 output_d_mu_return_array=False, output_error_estimate_return_vector=False,
+                 mu=None, sink=None, **kwargs):
+        """Stream the solution trajectory into a sink.
+
+        If a :class:`~pymor.algorithms.timestepping.TrajectorySink` is passed as `sink`
+        argument to :meth:`~pymor.models.interface.Model.solve`, the trajectory vectors
+        are passed to the sink as soon as they have been computed and the solution
+        returned by :meth:`~pymor.models.interface.Model.solve` is the return value of
+        :meth:`~pymor.algorithms.timestepping.TrajectorySink.finish`. In this case, no
+        other quantities can be computed and the result is not
+        :mod:`cached <pymor.core.cache>`.
+        """
+        if sink is None:
+            return super()._compute(solution=solution, output=output,
+                                    solution_d_mu=solution_d_mu, output_d_mu=output_d_mu,
+                                    solution_error_estimate=solution_error_estimate,
+                                    output_error_estimate=output_error_estimate,
+                                    output_d_mu_return_array=output_d_mu_return_array,
+                                    output_error_estimate_return_vector=output_error_estimate_return_vector,
+                                    mu=mu, **kwargs)
+        if output or solution_d_mu or output_d_mu or solution_error_estimate or output_error_estimate or kwargs:
+            raise ValueError('Only the solution can be computed when a sink is given')
+        return {'solution': self._solve_time_stepper(mu, sink=sink)} if solution else {}
+
     def _compute_solution(self, mu=None, **kwargs):
+        return self._solve_time_stepper(mu)
+
+    def _solve_time_stepper(self, mu, sink=None):
         mu = mu.with_(t=0.)
         U0 = self.initial_data.as_range_array(mu)
         U = self.time_stepper.solve(operator=self.operator,
                                     rhs=None if isinstance(self.rhs, ZeroOperator) else self.rhs,
                                     initial_data=U0,
                                     mass=None if isinstance(self.mass, IdentityOperator) else self.mass,
-                                    initial_time=0, end_time=self.T, mu=mu, num_values=self.num_values)
+                                    initial_time=0, end_time=self.T, mu=mu, num_values=self.num_values,
+                                    sink=sink)
         return U
 
+    def _compute_batch(self, mus, solution=False, output=False, solution_error_estimate=False,
+                       input=None, **kwargs):
+        """Compute solutions for multiple |parameter values| simultaneously.
+
+        The solution trajectories for all |parameter values| are computed using
+        :meth:`~pymor.algorithms.timestepping.TimeStepper.solve_batch`. For
+        implicit time-steppers and reduced models with dense affinely decomposed
+        |Operators|, all trajectories are advanced simultaneously using stacked
+        system matrices. For full-order models with non-parametric
+        :attr:`!operator`, the implicit system is factorized once and solved for
+        all trajectories with a single multi-right-hand-side solve in each time step.
+        Otherwise, the default implementation of
+        :meth:`~pymor.models.interface.Model._compute_batch` is used.
+
+        Note that solutions computed in batch mode are not :mod:`cached <pymor.core.cache>`.
+        """
+        if (kwargs or input is not None or self.dim_input > 0
+                or type(self)._compute_solution is not InstationaryModel._compute_solution):
+            return super()._compute_batch(mus, solution=solution, output=output,
+                                          solution_error_estimate=solution_error_estimate,
+                                          input=input, **kwargs)
+
+        data = {}
+        if not (solution or output or solution_error_estimate):
+            return data
+
+        mus_0 = [mu.with_(t=0.) for mu in mus]
+        U0 = as_range_array_batch(self.initial_data, mus_0)
+        U = self.time_stepper.solve_batch(initial_time=0, end_time=self.T, initial_data=U0,
+                                          operator=self.operator,
+                                          rhs=None if isinstance(self.rhs, ZeroOperator) else self.rhs,
+                                          mass=None if isinstance(self.mass, IdentityOperator) else self.mass,
+                                          mus=mus, num_values=self.num_values)
+        data['solution'] = U
+        num_values = len(U) // len(mus) if mus else 0
+
+        if output:
+            data['output'] = apply_batch(self.output_functional, U,
+                                         [mu for mu in mus for _ in range(num_values)]).to_numpy()
+
+        if solution_error_estimate:
+            if self.error_estimator is None:
+                raise ValueError('Model has no error estimator')
+            data['solution_error_estimate'] = (
+                np.hstack([self.error_estimator.estimate_error(U[i*num_values:(i+1)*num_values], mu, self)
+                           for i, mu in enumerate(mus)]) if mus else np.empty(0)
+            )
+
+        return data
+
     def to_lti(self):
         """Convert model to |LTIModel|.
 
@@ -358,3 +489,4 @@ class InstationaryModel(Model):
 
         from pymor.models.iosys import LTIModel
         return LTIModel(A, B, C, E=E, visualizer=self.visualizer)
+
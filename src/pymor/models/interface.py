@@ -422,6 +422,107 @@ class Model(CacheableObject, ParametricObject):
 
         return data
 
+    def _compute_batch(self, mus, solution=False, output=False, solution_error_estimate=False,
+                       input=None, **kwargs):
+        """Compute model solutions and associated quantities for multiple |parameter values|.
+
+        This method is called by :meth:`compute_batch`. The default implementation
+        calls :meth:`compute` for each of the given |parameter values| and concatenates
+        the results. |Model| implementors may override this method to compute the
+        requested quantities for all |parameter values| simultaneously.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to compute the values.
+        solution
+            If `True`, return the model's internal states.
+        output
+            If `True`, return the model outputs.
+        solution_error_estimate
+            If `True`, return error estimates for the computed internal states.
+        input
+            The model input. See :meth:`compute`.
+        kwargs
+            Further keyword arguments to customize how the values are computed.
+
+        Returns
+        -------
+        A dict with the computed values.
+        """
+        results = [self.compute(solution=solution, output=output,
+                                solution_error_estimate=solution_error_estimate,
+                                mu=mu, input=input, **kwargs)
+                   for mu in mus]
+
+        data = {}
+        if solution:
+            U = self.solution_space.empty(reserve=len(mus))
+            for r in results:
+                U.append(r['solution'])
+            data['solution'] = U
+        if output:
+            data['output'] = (np.vstack([r['output'] for r in results]) if results
+                              else np.empty((0, self.dim_output)))
+        if solution_error_estimate:
+            data['solution_error_estimate'] = (np.hstack([r['solution_error_estimate'] for r in results])
+                                               if results else np.empty(0))
+        return data
+
+    def compute_batch(self, mus, solution=False, output=False, solution_error_estimate=False,
+                      *, input=None, **kwargs):
+        """Compute model solutions and associated quantities for multiple |parameter values|.
+
+        The results for the individual |parameter values| are concatenated, i.e.
+        `data['solution']` is a single |VectorArray| containing all solutions in the
+        order of `mus`, `data['output']` is obtained by vertically stacking the
+        outputs and `data['solution_error_estimate']` is a one-dimensional
+        |NumPy array| of the concatenated error estimates.
+
+        .. note::
+
+            The default implementation defers the actual computations to
+            :meth:`!_compute_batch`, which by default calls :meth:`compute` for each
+            |parameter value|. |Models| like
+            :class:`~pymor.models.basic.StationaryModel` override :meth:`!_compute_batch`
+            to compute the results for all |parameter values| simultaneously, which is
+            considerably faster for reduced models with small dense system matrices.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to compute the values.
+        solution
+            If `True`, return the model's internal states.
+        output
+            If `True`, return the model outputs.
+        solution_error_estimate
+            If `True`, return error estimates for the computed internal states.
+        input
+            The model input. See :meth:`compute`.
+        kwargs
+            Further keyword arguments to select further quantities that should
+            be returned or to customize how the values are computed.
+
+        Returns
+        -------
+        A dict with the computed values.
+        """
+        # make sure no unknown kwargs are passed
+        assert kwargs.keys() <= self._compute_allowed_kwargs
+        assert input is not None or self.dim_input == 0
+
+        # parse parameter values
+        mus = [mu if isinstance(mu, Mu) else self.parameters.parse(mu) for mu in mus]
+        assert all(self.parameters.assert_compatible(mu) for mu in mus)
+
+        if not self.logging_disabled:
+            self.logger.info(f'Solving {self.name} for {len(mus)} parameter values ...')
+
+        return self._compute_batch(mus, solution=solution, output=output,
+                                   solution_error_estimate=solution_error_estimate,
+                                   input=input, **kwargs)
+
     def solve(self, mu=None, input=None, return_error_estimate=False, **kwargs):
         """Solve the discrete problem for the |parameter values| `mu`.
 
@@ -466,6 +567,41 @@ class Model(CacheableObject, ParametricObject):
         else:
             return data['solution']
 
+    def solve_batch(self, mus, input=None, return_error_estimate=False, **kwargs):
+        """Solve the discrete problem for multiple |parameter values|.
+
+        This method is a convenience wrapper around :meth:`compute_batch`.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to solve.
+        input
+            The model input. See :meth:`solve`.
+        return_error_estimate
+            If `True`, also return error estimates for the computed solutions.
+        kwargs
+            Additional keyword arguments passed to :meth:`compute_batch` that
+            might affect how the solutions are computed.
+
+        Returns
+        -------
+        |VectorArray| containing the solutions for all |parameter values| in
+        `mus`. When `return_error_estimate` is `True`, the estimates are returned
+        as second value.
+        """
+        data = self.compute_batch(
+            mus,
+            solution=True,
+            solution_error_estimate=return_error_estimate,
+            input=input,
+            **kwargs
+        )
+        if return_error_estimate:
+            return data['solution'], data['solution_error_estimate']
+        else:
+            return data['solution']
+
     def output(self, mu=None, input=None, return_error_estimate=False,
                return_error_estimate_vector=False, **kwargs):
         """Return the model output for given |parameter values| `mu`.
@@ -515,6 +651,28 @@ class Model(CacheableObject, ParametricObject):
         else:
             return data['output']
 
+    def output_batch(self, mus, input=None, **kwargs):
+        """Return the model outputs for multiple |parameter values|.
+
+        This method is a convenience wrapper around :meth:`compute_batch`.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to compute the outputs.
+        input
+            The model input. See :meth:`output`.
+        kwargs
+            Additional keyword arguments passed to :meth:`compute_batch` that
+            might affect how the outputs are computed.
+
+        Returns
+        -------
+        The vertically stacked model outputs as a 2D |NumPy array|. For stationary
+        problems, axis 0 has dimension `len(mus)`.
+        """
+        return self.compute_batch(mus, output=True, input=input, **kwargs)['output']
+
     def solve_d_mu(self, parameter, index, mu=None, input=None, **kwargs):
         """Solve for the partial derivative of the solution w.r.t. a parameter index.
 
@@ -612,6 +770,27 @@ class Model(CacheableObject, ParametricObject):
             **kwargs
         )['solution_error_estimate']
 
+    def estimate_error_batch(self, mus, input=None, **kwargs):
+        """Estimate the errors of the computed internal states for multiple |parameter values|.
+
+        This method is a convenience wrapper around :meth:`compute_batch`.
+
+        Parameters
+        ----------
+        mus
+            List of |parameter values| for which to estimate the error.
+        input
+            The model input. See :meth:`estimate_error`.
+        kwargs
+            Additional keyword arguments passed to :meth:`compute_batch` that
+            might affect how the error estimates (or the solutions) are computed.
+
+        Returns
+        -------
+        |NumPy array| of the concatenated error estimates.
+        """
+        return self.compute_batch(mus, solution_error_estimate=True, input=input, **kwargs)['solution_error_estimate']
+
     def estimate_output_error(self, mu=None, input=None, return_vector=False, **kwargs):
         """Estimate the error for the computed output.
 
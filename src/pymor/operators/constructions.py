@@ -13,6 +13,7 @@ import scipy.linalg as spla
 from pymor.core.defaults import defaults
 from pymor.core.exceptions import InversionError
 from pymor.operators.interface import Operator
+from pymor.operators.numpy import NumpyMatrixBasedOperator, factorization_cache
 from pymor.parameters.base import ParametricObject
 from pymor.parameters.functionals import ConjugateParameterFunctional, ParameterFunctional
 from pymor.vectorarrays.interface import VectorArray, VectorSpace
@@ -78,6 +79,24 @@ class LincombOperator(Operator):
         assert self.parameters.assert_compatible(mu)
         return [c.evaluate(mu) if hasattr(c, 'evaluate') else c for c in self.coefficients]
 
+    def evaluate_coefficients_many(self, mus):
+        """Compute the linear coefficients for multiple |parameter values| at once.
+
+        Parameters
+        ----------
+        mus
+            |Parameter values| for which to compute the linear coefficients, see
+            :meth:`~pymor.parameters.functionals.ParameterFunctional.evaluate_many`.
+
+        Returns
+        -------
+        |NumPy array| of shape `(n_mus, len(self.operators))`.
+        """
+        from pymor.algorithms.batch import evaluate_coefficients_batch
+        if self.parameters:
+            mus = self.parameters.stack(mus)
+        return evaluate_coefficients_batch(self.coefficients, mus)
+
     def apply(self, U, mu=None):
         coeffs = self.evaluate_coefficients(mu)
         if coeffs[0]:
@@ -190,6 +209,9 @@ class LincombOperator(Operator):
                 coefficients = self.evaluate_coefficients(mu)
                 U *= (1. / coefficients[0])
                 return U
+        elif self._assembles_to_matrix:
+            return self._assemble_cached(mu).apply_inverse(V, initial_guess=initial_guess,
+                                                           least_squares=least_squares)
         else:
             return super().apply_inverse(V, mu=mu, initial_guess=initial_guess, least_squares=least_squares)
 
@@ -206,9 +228,20 @@ class LincombOperator(Operator):
                                                             initial_guess=initial_guess, least_squares=least_squares)
                 V *= (1. / coeff)
                 return V
+        elif self._assembles_to_matrix:
+            return self._assemble_cached(mu).apply_inverse_adjoint(U, initial_guess=initial_guess,
+                                                                   least_squares=least_squares)
         else:
             return super().apply_inverse_adjoint(U, mu=mu, initial_guess=initial_guess, least_squares=least_squares)
 
+    @property
+    def _assembles_to_matrix(self):
+        return all(isinstance(op, NumpyMatrixBasedOperator) for op in self.operators)
+
+    def _assemble_cached(self, mu):
+        cache = factorization_cache()
+        return self.assemble(mu) if cache is None else cache.assemble(self, mu)
+
     def _as_array(self, source, mu):
         coefficients = np.array(self.evaluate_coefficients(mu))
         arrays = [op.as_source_array(mu) if source else op.as_range_array(mu) for op in self.operators]
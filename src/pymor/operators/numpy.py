@@ -15,6 +15,7 @@ This module provides the following |NumPy|-based |Operators|:
   Markov parameters.
 """
 
+from collections import OrderedDict
 from functools import reduce
 
 import numpy as np
@@ -140,7 +141,15 @@ class NumpyMatrixBasedOperator(Operator):
         return self.assemble(mu).as_source_array()
 
     def apply_inverse(self, V, mu=None, initial_guess=None, least_squares=False):
-        return self.assemble(mu).apply_inverse(V, initial_guess=initial_guess, least_squares=least_squares)
+        return self._assemble_cached(mu).apply_inverse(V, initial_guess=initial_guess, least_squares=least_squares)
+
+    def apply_inverse_adjoint(self, U, mu=None, initial_guess=None, least_squares=False):
+        return self._assemble_cached(mu).apply_inverse_adjoint(U, initial_guess=initial_guess,
+                                                                least_squares=least_squares)
+
+    def _assemble_cached(self, mu):
+        cache = factorization_cache()
+        return self.assemble(mu) if cache is None else cache.assemble(self, mu)
 
     def export_matrix(self, filename, matrix_name=None, output_format='matlab', mu=None):
         """Save the matrix of the operator to a file.
@@ -325,17 +334,7 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
                     raise InversionError(f'{str(type(e))}: {str(e)}') from e
                 R = R.T
             else:
-                if not hasattr(self, '_lu_factor'):
-                    try:
-                        self._lu_factor = lu_factor(self.matrix)
-                    except np.linalg.LinAlgError as e:
-                        raise InversionError(f'{str(type(e))}: {str(e)}') from e
-                    gecon = get_lapack_funcs('gecon', self._lu_factor)
-                    rcond, _ = gecon(self._lu_factor[0], np.linalg.norm(self.matrix, ord=1), norm='1')
-                    if rcond < np.finfo(np.float64).eps:
-                        self.logger.warning(f'Ill-conditioned matrix (rcond={rcond:.6g}) in apply_inverse: '
-                                            'result may not be accurate.')
-                R = lu_solve(self._lu_factor, V.to_numpy().T).T
+                R = lu_solve(self._factorize(), V.to_numpy().T).T
 
             if check_finite:
                 if not np.isfinite(np.sum(R)):
@@ -343,8 +342,86 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
 
             return self.source.make_array(R)
 
-    def apply_inverse_adjoint(self, U, mu=None, initial_guess=None, least_squares=False):
-        return self.H.apply_inverse(U, mu=mu, initial_guess=initial_guess, least_squares=least_squares)
+    @defaults('check_finite')
+    def apply_inverse_adjoint(self, U, mu=None, initial_guess=None, least_squares=False, check_finite=True):
+        """Apply the inverse adjoint operator.
+
+        If no |solver_options| for `inverse_adjoint` are set, the LU factorization of the
+        operator's matrix computed by :meth:`apply_inverse` is reused by solving with its
+        conjugate transpose. Otherwise, :meth:`apply_inverse` of :attr:`H` is called.
+
+        Parameters
+        ----------
+        U
+            |VectorArray| of vectors to which the inverse adjoint operator is applied.
+        mu
+            The |parameter values| for which to evaluate the inverse adjoint operator.
+        initial_guess
+            |VectorArray| with the same length as `U` containing initial guesses
+            for the solution.  Some implementations of `apply_inverse_adjoint` may
+            ignore this parameter.  If `None` a solver-dependent default is used.
+        least_squares
+            If `True`, solve the least squares problem::
+
+                v = argmin ||op^*(v) - u||_2.
+
+        check_finite
+            Test if solution only contains finite values.
+
+        Returns
+        -------
+        |VectorArray| of the inverse adjoint operator evaluations.
+
+        Raises
+        ------
+        InversionError
+            The operator could not be inverted.
+        """
+        assert U in self.source
+        U = U.to_numpy()
+        # reuse the SuperLU factorization kept by pymor.bindings.scipy.apply_inverse
+        factorization = getattr(self.matrix, 'factorization', None) if self.sparse else None
+        if (least_squares or U.shape[1] == 0 or self.source.dim != self.range.dim
+                or self.solver_options and self.solver_options.get('inverse_adjoint')
+                or self.sparse and (factorization is None
+                                    or not np.can_cast(U.dtype, self.matrix.factorizationdtype, casting='safe'))):
+            # keep the adjoint operator to retain its factorization
+            if not hasattr(self, '_adjoint_op'):
+                self._adjoint_op = self.H
+            return self._adjoint_op.apply_inverse(self.source.make_array(U), initial_guess=initial_guess,
+                                                  least_squares=least_squares)
+
+        if self.sparse:
+            try:
+                R = factorization.solve(U.T, trans='H').T
+            except RuntimeError as e:
+                raise InversionError(e) from e
+            R = R.astype(np.promote_types(self.matrix.dtype, U.dtype), copy=False)
+        else:
+            R = lu_solve(self._factorize(), U.T, trans=2).T
+
+        if check_finite:
+            if not np.isfinite(np.sum(R)):
+                raise InversionError('Result contains non-finite values')
+
+        return self.range.make_array(R)
+
+    def _factorize(self):
+        if self.sparse:
+            from pymor.bindings.scipy import factorize
+            factorize(self.matrix, self.solver_options.get('inverse') if self.solver_options else None)
+            return getattr(self.matrix, 'factorization', None)
+        if not hasattr(self, '_lu_factor'):
+            try:
+                self._lu_factor = lu_factor(self.matrix)
+            except np.linalg.LinAlgError as e:
+                raise InversionError(f'{str(type(e))}: {str(e)}') from e
+            gecon = get_lapack_funcs('gecon', self._lu_factor)
+            rcond, _ = gecon(self._lu_factor[0], np.linalg.norm(self.matrix, ord=1), norm='1')
+            if rcond < np.finfo(np.float64).eps:
+                self.logger.warning(f'Ill-conditioned matrix (rcond={rcond:.6g}) in apply_inverse: '
+                                    'result may not be accurate.')
+        return self._lu_factor
 
     def _assemble_lincomb(self, operators, coefficients, identity_shift=0., solver_options=None, name=None):
         if not all(isinstance(op, NumpyMatrixOperator) for op in operators):
@@ -398,6 +475,9 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
     def __getstate__(self):
         if hasattr(self.matrix, 'factorization'):  # remove unpicklable SuperLU factorization
             del self.matrix.factorization
+        if hasattr(self.matrix, 'preconditioner'):  # remove unpicklable incomplete LU factorization
+            del self.matrix.preconditioner
+            del self.matrix.preconditioner_key
         return self.__dict__
 
     def _format_repr(self, max_width, verbosity):
@@ -408,6 +488,137 @@ class NumpyMatrixOperator(NumpyMatrixBasedOperator):
         return super()._format_repr(max_width, verbosity, override={'matrix': matrix_repr})
 
 
+class FactorizationCache:
+    """Bounded LRU cache of assembled |NumpyMatrixOperators|.
+
+    Parametric operators which assemble into a |NumpyMatrixOperator| keep the assembled
+    operators for the most recently used operators and |parameter values| in the global
+    cache returned by :func:`factorization_cache` when
+    :meth:`~pymor.operators.interface.Operator.apply_inverse` or
+    :meth:`~pymor.operators.interface.Operator.apply_inverse_adjoint` is called.
+    Since the assembled operators store the LU factorization (or SuperLU factorization
+    for sparse matrices) of their matrix, repeated solves for the same |parameter values|
+    neither re-assemble nor re-factorize the matrix.
+
+    The cache is bounded by the number of entries and by the total memory occupied by
+    the matrices and their factorizations. When a bound is exceeded, the least recently
+    used entries are evicted. The most recently used entry is always kept. Thus, with
+    the default bounds, the global cache holds up to 64 MiB of data for all operators
+    together, or a single assembled operator of larger size. Use :meth:`clear` to free
+    the memory.
+
+    Operators depending on time, i.e. operators with a parameter `'t'` or time-dependent
+    |parameter values|, are not cached, since they are typically assembled for each
+    time step only once.
+
+    Parameters
+    ----------
+    max_keys
+        Maximum number of cached operators. If `0`, nothing is cached.
+    max_size
+        Maximum total size in bytes of the cached matrices and factorizations.
+
+    Attributes
+    ----------
+    hits
+        Number of cache hits.
+    misses
+        Number of cache misses.
+    """
+
+    @defaults('max_keys', 'max_size')
+    def __init__(self, max_keys=16, max_size=2**26):
+        self.max_keys = max_keys
+        self.max_size = max_size
+        self.clear()
+
+    def assemble(self, op, mu=None):
+        """Return `op.assemble(mu)`, using the cached operator if present."""
+        if 't' in op.parameters or mu is not None and any(mu.is_time_dependent(k) for k in op.parameters):
+            return op.assemble(mu)
+        self._evict()
+        key = (op.uid,) + tuple((k, mu[k].tobytes()) for k in op.parameters)
+        assembled_op = self._entries.get(key)
+        if assembled_op is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return assembled_op
+        self.misses += 1
+        assembled_op = op.assemble(mu)
+        if self.max_keys > 0 and isinstance(assembled_op, NumpyMatrixOperator):
+            self._entries[key] = assembled_op
+            self._evict()
+        return assembled_op
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._entries = OrderedDict()
+        self.hits = self.misses = 0
+
+    @property
+    def size(self):
+        """Total size in bytes of the cached matrices and factorizations."""
+        return sum(_operator_nbytes(op) for op in self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict(self):
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+        sizes = [_operator_nbytes(op) for op in self._entries.values()]
+        total = sum(sizes)
+        for size in sizes[:-1]:
+            if total <= self.max_size:
+                break
+            self._entries.popitem(last=False)
+            total -= size
+
+
+_factorization_cache = None
+
+
+@defaults('enabled')
+def factorization_cache(enabled=True):
+    """Return the global :class:`FactorizationCache` used for solving with parametric operators.
+
+    The cache is not part of the state of the |Operators| using it, so it is neither
+    pickled nor copied along with them.
+
+    Parameters
+    ----------
+    enabled
+        If `False`, `None` is returned and assembled operators are not cached.
+
+    Returns
+    -------
+    The global :class:`FactorizationCache` or `None`.
+    """
+    global _factorization_cache
+    if not enabled:
+        return None
+    if _factorization_cache is None:
+        _factorization_cache = FactorizationCache()
+    return _factorization_cache
+
+
+def _operator_nbytes(op, include_matrix=True):
+    def nbytes(matrix):
+        return sum(getattr(matrix, a).nbytes for a in ('data', 'indices', 'indptr', 'row', 'col', 'offsets')
+                   if hasattr(matrix, a)) if issparse(matrix) else matrix.nbytes
+
+    result = nbytes(op.matrix) if include_matrix else 0
+    if hasattr(op, '_lu_factor'):
+        result += op._lu_factor[0].nbytes + op._lu_factor[1].nbytes
+    for factorization in (getattr(op.matrix, 'factorization', None), getattr(op.matrix, 'preconditioner', None)):
+        if factorization is not None:
+            result += nbytes(factorization.L) + nbytes(factorization.U)
+    if hasattr(op, '_adjoint_op'):
+        # the adjoint operator's matrix is a view of op.matrix
+        result += _operator_nbytes(op._adjoint_op, include_matrix=False)
+    return result
+
+
 class NumpyHankelOperator(NumpyGenericOperator):
     r"""Implicit representation of a Hankel operator by a |NumPy Array|.
 
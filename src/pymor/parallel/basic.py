@@ -5,13 +5,31 @@
 """This module contains a base class for implementing WorkerPool."""
 
 import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
+from itertools import chain
+from threading import Lock, RLock
+from time import perf_counter
+
+import numpy as np
 
 from pymor.core.base import ImmutableObject
 from pymor.parallel.interface import RemoteObject, WorkerPool
+from pymor.tools.random import spawn_rng
+
+
+def synchronized(method):
+    """Decorator ensuring exclusive access to the pool during a method call."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class WorkerPoolDefaultImplementations:
 
+    @synchronized
     def scatter_array(self, U, copy=True):
         slice_len = len(U) // len(self) + (1 if len(U) % len(self) else 0)
         if copy:
@@ -27,6 +45,7 @@ class WorkerPoolDefaultImplementations:
         self.map(_append_array_slice, slices, U=remote_U)
         return remote_U
 
+    @synchronized
     def scatter_list(self, l):
         slice_len = len(l) // len(self) + (1 if len(l) % len(self) else 0)
         slices = []
@@ -39,11 +58,28 @@ class WorkerPoolDefaultImplementations:
 
 
 class WorkerPoolBase(WorkerPoolDefaultImplementations, WorkerPool):
-    """Basic |WorkerPool|."""
+    """Basic |WorkerPool|.
+
+    Attributes
+    ----------
+    map_statistics
+        `None` or a dict with statistics of the last call of
+        :meth:`~pymor.parallel.interface.WorkerPool.map` with
+        `schedule='dynamic'`. The dict contains the wall time of the call
+        (`'wall_time'`), and |NumPy arrays| with the number of processed
+        chunks (`'chunks'`), the time spent executing the mapped function
+        (`'busy_time'`) and the remaining time (`'idle_time'`) for each
+        worker.
+    """
+
+    map_statistics = None
+    _async_executor = None
 
     def __init__(self):
         self._pushed_immutable_objects = {}
+        self._lock = RLock()
 
+    @synchronized
     def push(self, obj):
         if isinstance(obj, ImmutableObject):
             uid = obj.uid
@@ -65,18 +101,91 @@ class WorkerPoolBase(WorkerPoolDefaultImplementations, WorkerPool):
                     v)
                 for k, v in kwargs.items()}
 
+    @synchronized
     def apply(self, function, *args, **kwargs):
         kwargs = self._map_kwargs(kwargs)
         return self._apply(function, *args, **kwargs)
 
+    @synchronized
     def apply_only(self, function, worker, *args, **kwargs):
         kwargs = self._map_kwargs(kwargs)
         return self._apply_only(function, worker, *args, **kwargs)
 
-    def map(self, function, *args, **kwargs):
+    @synchronized
+    def map(self, function, *args, chunksize=None, schedule='static', **kwargs):
+        assert schedule in ('static', 'dynamic')
         kwargs = self._map_kwargs(kwargs)
-        chunks = self._split_into_chunks(len(self), *args)
-        return self._map(function, chunks, **kwargs)
+        if schedule == 'static':
+            chunks = self._split_into_chunks(len(self), *args)
+            return self._map(function, chunks, **kwargs)
+
+        lens = set(map(len, args))
+        assert len(lens) == 1
+        n = lens.pop()
+        if chunksize is None:
+            chunksize = max(n // (4 * len(self)), 1)
+        assert chunksize > 0
+        chunks = [tuple(arg[i:i+chunksize] for arg in args) for i in range(0, n, chunksize)]
+
+        tic = perf_counter()
+        results = self._map_dynamic(function, chunks, **kwargs)
+        wall_time = perf_counter() - tic
+
+        chunk_counts, busy_times = np.zeros(len(self), dtype=int), np.zeros(len(self))
+        for worker, busy_time, _ in results:
+            chunk_counts[worker] += 1
+            busy_times[worker] += busy_time
+        self.map_statistics = {'wall_time': wall_time, 'chunks': chunk_counts,
+                               'busy_time': busy_times, 'idle_time': np.maximum(wall_time - busy_times, 0.)}
+        if len(chunks):
+            self.logger.info(f'Mapped {len(chunks)} chunks in {wall_time:.2f}s '
+                             f'(mean load {np.mean(busy_times) / max(wall_time, 1e-16):.0%})')
+        return list(chain.from_iterable(r for _, _, r in results))
+
+    def apply_async(self, function, *args, **kwargs):
+        return self._submit(self.apply, function, *args, **kwargs)
+
+    def apply_only_async(self, function, worker, *args, **kwargs):
+        return self._submit(self.apply_only, function, worker, *args, **kwargs)
+
+    def map_async(self, function, *args, chunksize=None, schedule='static', **kwargs):
+        return self._submit(self.map, function, *args, chunksize=chunksize, schedule=schedule, **kwargs)
+
+    def _submit(self, method, *args, **kwargs):
+        """Execute a synchronous pool method in a background thread.
+
+        All methods submitted this way are executed one after another. Synchronous
+        calls from other threads are blocked while a submitted method is executed.
+        """
+        if self._async_executor is None:
+            self._async_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=type(self).__name__)
+
+        def call_method():
+            return method(*args, **kwargs)
+
+        return self._async_executor.submit(spawn_rng(call_method))
+
+    def _map_dynamic(self, function, chunks, **kwargs):
+        """Execute `function` on the given chunks, distributing the chunks on demand.
+
+        Has to return a list of tuples `(worker, busy_time, chunk_results)` in the
+        order of `chunks`.
+
+        The default implementation processes the chunks in rounds of one chunk per
+        worker using :meth:`_map`. Implementations should override this method
+        to assign new chunks to workers as soon as they become idle.
+        """
+        results = []
+        for i in range(0, len(chunks), len(self)):
+            round_chunks = chunks[i:i+len(self)]
+            padding = [[]] * (len(self) - len(round_chunks))
+            round_results = self._map(_call_function_on_chunk_with_kwargs,
+                                      ([[function]] * len(round_chunks) + padding,
+                                       [[c] for c in round_chunks] + padding),
+                                      **kwargs)
+            results.extend((worker, busy_time, result)
+                           for worker, (busy_time, result) in enumerate(round_results))
+        return results
 
     def _split_into_chunks(self, count, *args):
         lens = list(map(len, args))
@@ -89,7 +198,6 @@ class WorkerPoolBase(WorkerPoolDefaultImplementations, WorkerPool):
             for _ in range(count):
                 chunk, arg = arg[:chunk_size], arg[chunk_size:]
                 yield chunk
-        from itertools import chain
         for arg in args:
             assert list(chain(*split_arg(arg))) == arg
         chunks = tuple(list(split_arg(arg)) for arg in args)
@@ -106,14 +214,15 @@ class GenericRemoteObject(RemoteObject):
 
     def _remove(self):
         pool = self.pool()
-        if self.uid is not None:
-            remote_id, ref_count = pool._pushed_immutable_objects.pop(self.uid)
-            if ref_count > 1:
-                pool._pushed_immutable_objects[self.remote_id] = (remote_id, ref_count - 1)
+        with pool._lock:
+            if self.uid is not None:
+                remote_id, ref_count = pool._pushed_immutable_objects.pop(self.uid)
+                if ref_count > 1:
+                    pool._pushed_immutable_objects[self.remote_id] = (remote_id, ref_count - 1)
+                else:
+                    pool._remove_object(remote_id)
             else:
-                pool._remove_object(remote_id)
-        else:
-            pool._remove_object(self.remote_id)
+                pool._remove_object(self.remote_id)
 
 
 def _append_array_slice(s, U=None):
@@ -122,3 +231,36 @@ def _append_array_slice(s, U=None):
 
 def _append_list_slice(s, l=None):
     l.extend(s)
+
+
+def _call_function_on_chunk(function, args, kwargs):
+    tic = perf_counter()
+    result = [function(*a, **kwargs) for a in zip(*args)]
+    return perf_counter() - tic, result
+
+
+def _call_function_on_chunk_with_kwargs(function, args, **kwargs):
+    return _call_function_on_chunk(function, args, kwargs)
+
+
+def gather_futures(futures):
+    """Return a :class:`~concurrent.futures.Future` for the list of results of `futures`."""
+    future = Future()
+    remaining = [len(futures)]
+    lock = Lock()
+
+    def done_callback(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        try:
+            future.set_result([f.result() for f in futures])
+        except Exception as e:
+            future.set_exception(e)
+
+    if not futures:
+        future.set_result([])
+    for f in futures:
+        f.add_done_callback(done_callback)
+    return future
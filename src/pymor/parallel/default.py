@@ -9,8 +9,8 @@ from pymor.core.logger import getLogger
 from pymor.parallel.dummy import dummy_pool
 
 
-@defaults('ipython_num_engines', 'ipython_profile', 'allow_mpi')
-def new_parallel_pool(ipython_num_engines=None, ipython_profile=None, allow_mpi=True):
+@defaults('ipython_num_engines', 'ipython_profile', 'allow_mpi', 'process_num_workers')
+def new_parallel_pool(ipython_num_engines=None, ipython_profile=None, allow_mpi=True, process_num_workers=None):
     """Creates a new default |WorkerPool|.
 
     If `ipython_num_engines` or `ipython_profile` is provided as an argument or set as
@@ -20,6 +20,11 @@ def new_parallel_pool(ipython_num_engines=None, ipython_profile=None, allow_mpi=
     Otherwise, when `allow_mpi` is `True` and an MPI parallel run is detected,
     an :class:`~pymor.parallel.mpi.MPIPool` |WorkerPool| will be created.
 
+    Otherwise, if `process_num_workers` is provided as an argument or set as a
+    |default|, a :class:`~pymor.parallel.process.ProcessPool` |WorkerPool| with
+    the given number of local worker processes will be created. A value of `0`
+    uses as many workers as CPUs are available.
+
     Otherwise, a sequential run is assumed and
     :attr:`pymor.parallel.dummy.dummy_pool <pymor.parallel.dummy.DummyPool>`
     is returned.
@@ -35,19 +40,20 @@ def new_parallel_pool(ipython_num_engines=None, ipython_profile=None, allow_mpi=
         pool = nip.__enter__()
         _pool = ('ipython', pool, nip)
         return pool
-    elif allow_mpi:
+    if allow_mpi:
         from pymor.tools import mpi
         if mpi.parallel:
             from pymor.parallel.mpi import MPIPool
             pool = MPIPool()
             _pool = ('mpi', pool)
             return pool
-        else:
-            _pool = ('dummy', dummy_pool)
-            return dummy_pool
-    else:
-        _pool = ('dummy', dummy_pool)
-        return dummy_pool
+    if process_num_workers is not None:
+        from pymor.parallel.process import ProcessPool
+        pool = ProcessPool(num_workers=process_num_workers or None)
+        _pool = ('process', pool)
+        return pool
+    _pool = ('dummy', dummy_pool)
+    return dummy_pool
 
 
 _pool = None
@@ -58,4 +64,6 @@ def _cleanup():
     global _pool
     if _pool and _pool[0] == 'ipython':
         _pool[2].__exit__(None, None, None)
+    elif _pool and _pool[0] == 'process':
+        _pool[1].shutdown()
     _pool = None
@@ -40,7 +40,8 @@ class DummyPool(WorkerPool):
         kwargs = self._map_kwargs(kwargs)
         return function(*args, **kwargs)
 
-    def map(self, function, *args, **kwargs):
+    def map(self, function, *args, chunksize=None, schedule='static', **kwargs):
+        assert schedule in ('static', 'dynamic')
         kwargs = self._map_kwargs(kwargs)
         result = [function(*a, **kwargs) for a in zip(*args)]
         return result
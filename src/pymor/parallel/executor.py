@@ -0,0 +1,88 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+"""Adapters for using |WorkerPools| with :mod:`concurrent.futures` and :mod:`asyncio`."""
+
+import asyncio
+import concurrent.futures
+from threading import Lock
+
+from pymor.parallel.interface import WorkerPool
+
+
+class WorkerPoolExecutor(concurrent.futures.Executor):
+    """:class:`~concurrent.futures.Executor` executing tasks on the workers of a |WorkerPool|.
+
+    Each submitted task is executed via
+    :meth:`~pymor.parallel.interface.WorkerPool.apply_only_async` on the worker
+    with the least number of pending tasks. The executor can, e.g., be passed as
+    `executor` to :func:`~pymor.algorithms.hapod.hapod`.
+
+    Parameters
+    ----------
+    pool
+        The |WorkerPool| to use.
+    """
+
+    def __init__(self, pool):
+        assert isinstance(pool, WorkerPool)
+        self.pool = pool
+        self._max_workers = len(pool)
+        self._pending = [set() for _ in range(len(pool))]
+        self._lock = Lock()
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._lock:
+            worker = min(range(len(self._pending)), key=lambda w: len(self._pending[w]))
+            future = self.pool.apply_only_async(fn, worker, *args, **kwargs)
+            self._pending[worker].add(future)
+        future.add_done_callback(lambda f: self._done_callback(f, worker))
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._lock:
+            futures = set().union(*self._pending)
+        if cancel_futures:
+            for f in futures:
+                f.cancel()
+        if wait:
+            concurrent.futures.wait(futures)
+
+    def _done_callback(self, future, worker):
+        with self._lock:
+            self._pending[worker].discard(future)
+
+
+class AsyncWorkerPool:
+    """:mod:`asyncio` adapter for |WorkerPools|.
+
+    Provides awaitable versions of the
+    :meth:`~pymor.parallel.interface.WorkerPool.apply`,
+    :meth:`~pymor.parallel.interface.WorkerPool.apply_only` and
+    :meth:`~pymor.parallel.interface.WorkerPool.map` methods of the given
+    |WorkerPool|, which are based on the pool's asynchronous methods.
+
+    Parameters
+    ----------
+    pool
+        The |WorkerPool| to wrap.
+    """
+
+    def __init__(self, pool):
+        assert isinstance(pool, WorkerPool)
+        self.pool = pool
+
+    def __len__(self):
+        return len(self.pool)
+
+    async def apply(self, function, *args, **kwargs):
+        return await asyncio.wrap_future(self.pool.apply_async(function, *args, **kwargs))
+
+    async def apply_only(self, function, worker, *args, **kwargs):
+        return await asyncio.wrap_future(self.pool.apply_only_async(function, worker, *args, **kwargs))
+
+    async def map(self, function, *args, chunksize=None, schedule='static', **kwargs):
+        return await asyncio.wrap_future(
+            self.pool.map_async(function, *args, chunksize=chunksize, schedule=schedule, **kwargs)
+        )
@@ -2,6 +2,8 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+from concurrent.futures import Future
+
 from pymor.core.base import BasicObject, abstractmethod
 
 
@@ -20,7 +22,13 @@ class WorkerPool(BasicObject):
     :meth:`~WorkerPool.map` function is available, which
     automatically scatters the data among the workers.
 
-    All operations are performed synchronously.
+    All these operations are performed synchronously. Asynchronous variants
+    (:meth:`~WorkerPool.apply_async`, :meth:`~WorkerPool.apply_only_async`,
+    :meth:`~WorkerPool.map_async`) return a :class:`concurrent.futures.Future`
+    immediately, allowing to overlap computations on the workers with other
+    work on the master. Asynchronous operations are executed in the order
+    of submission. For use within :mod:`asyncio` code, see
+    :class:`~pymor.parallel.executor.AsyncWorkerPool`.
     """
 
     @abstractmethod
@@ -156,7 +164,7 @@ class WorkerPool(BasicObject):
         pass
 
     @abstractmethod
-    def map(self, function, *args, **kwargs):
+    def map(self, function, *args, chunksize=None, schedule='static', **kwargs):
         """Parallel version of the builtin :func:`map` function.
 
         Each positional argument (after `function`) must be a sequence
@@ -169,12 +177,26 @@ class WorkerPool(BasicObject):
         been pushed before will be transmitted and the remote copy will be
         destroyed after function execution.)
 
+        With `schedule='static'`, the positional arguments are split into
+        `len(self)` chunks of equal size in advance, one for each worker.
+        With `schedule='dynamic'`, the arguments are split into chunks of
+        `chunksize` items which are handed out to the workers on demand,
+        such that workers which finish early will process more chunks.
+        This improves the load balance when the execution times of `function`
+        vary significantly between the arguments.
+
         Parameters
         ----------
         function
             The function to execute on each worker.
         args
             The sequences of positional arguments for `function`.
+        chunksize
+            Number of argument combinations per chunk for `schedule='dynamic'`.
+            If `None`, a chunk size leading to about four chunks per worker is
+            chosen.
+        schedule
+            Either `'static'` or `'dynamic'` (see above).
         kwargs
             The keyword arguments for `function`.
 
@@ -185,6 +207,45 @@ class WorkerPool(BasicObject):
         """
         pass
 
+    def apply_async(self, function, *args, **kwargs):
+        """Asynchronous version of :meth:`apply`.
+
+        The default implementation calls :meth:`apply` synchronously and
+        returns a completed future.
+
+        Returns
+        -------
+        A :class:`concurrent.futures.Future` for the list of return values of
+        the function executions, ordered by worker number.
+        """
+        return _call_synchronously(self.apply, function, *args, **kwargs)
+
+    def apply_only_async(self, function, worker, *args, **kwargs):
+        """Asynchronous version of :meth:`apply_only`.
+
+        The default implementation calls :meth:`apply_only` synchronously and
+        returns a completed future.
+
+        Returns
+        -------
+        A :class:`concurrent.futures.Future` for the return value of the function
+        execution.
+        """
+        return _call_synchronously(self.apply_only, function, worker, *args, **kwargs)
+
+    def map_async(self, function, *args, chunksize=None, schedule='static', **kwargs):
+        """Asynchronous version of :meth:`map`.
+
+        The default implementation calls :meth:`map` synchronously and
+        returns a completed future.
+
+        Returns
+        -------
+        A :class:`concurrent.futures.Future` for the list of return values of the
+        function executions, ordered by the sequence of positional arguments.
+        """
+        return _call_synchronously(self.map, function, *args, chunksize=chunksize, schedule=schedule, **kwargs)
+
 
 class RemoteObject:
     """Handle to remote data on the workers of a |WorkerPool|.
@@ -234,3 +295,12 @@ class RemoteObject:
 
     def __del__(self):
         self.remove()
+
+
+def _call_synchronously(method, *args, **kwargs):
+    future = Future()
+    try:
+        future.set_result(method(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
@@ -13,7 +13,7 @@ from itertools import chain
 
 from pymor.core import defaults
 from pymor.core.base import BasicObject
-from pymor.parallel.basic import WorkerPoolBase
+from pymor.parallel.basic import WorkerPoolBase, _call_function_on_chunk
 from pymor.tools.counter import Counter
 
 try:
@@ -180,6 +180,19 @@ class IPythonPool(WorkerPoolBase):
                                     *zip(*((function, True, a, kwargs) for a in zip(*chunks))))
         return list(chain(*result))
 
+    def _map_dynamic(self, function, chunks, **kwargs):
+        if defaults.defaults_changes() > self._updated_defaults:
+            self._update_defaults()
+        if not chunks:
+            return []
+        # the load balanced view hands out chunks to idle engines
+        view = self.client.load_balanced_view(targets=self.view.targets)
+        async_result = view.map(_worker_call_chunk, [function] * len(chunks), chunks, [kwargs] * len(chunks),
+                                block=False, ordered=True, chunksize=1)
+        results = async_result.get()
+        targets = list(self.view.targets)
+        return [(targets.index(engine_id),) + r for engine_id, r in zip(async_result.engine_id, results)]
+
     def _remove_object(self, remote_id):
         self.view.apply(_remove_object, remote_id)
 
@@ -203,6 +216,14 @@ def _worker_call_function(function, loop, args, kwargs):
         return function(*args, **kwargs)
 
 
+def _worker_call_chunk(function, args, kwargs):
+    global _remote_objects
+    kwargs = {k: (_remote_objects[v] if isinstance(v, RemoteId) else  # NOQA
+                  v)
+              for k, v in kwargs.items()}
+    return _call_function_on_chunk(function, args, kwargs)
+
+
 def _setup_worker(seed_seq):
     global _remote_objects
     _remote_objects = {}
@@ -5,13 +5,23 @@
 import os
 from itertools import chain
 
-from pymor.parallel.basic import WorkerPoolBase
+import numpy as np
+
+from pymor.parallel.basic import GenericRemoteObject, WorkerPoolBase, _call_function_on_chunk, synchronized
 from pymor.tools import mpi
 from pymor.tools.random import get_seed_seq
+from pymor.vectorarrays.numpy import NumpyVectorArray
 
 
 class MPIPool(WorkerPoolBase):
-    """|WorkerPool| based pyMOR's MPI :mod:`event loop <pymor.tools.mpi>`."""
+    """|WorkerPool| based pyMOR's MPI :mod:`event loop <pymor.tools.mpi>`.
+
+    Large buffers of pushed objects and of the arguments of :meth:`map`
+    are communicated out-of-band without being pickled (see
+    :func:`~pymor.tools.mpi.bcast_object`). The data of |NumpyVectorArrays|
+    passed to :meth:`scatter_array` is sent directly from the array's memory
+    using `Scatterv`.
+    """
 
     def __init__(self):
         super().__init__()
@@ -26,6 +36,20 @@ class MPIPool(WorkerPoolBase):
     def __len__(self):
         return mpi.size
 
+    @synchronized
+    def scatter_array(self, U, copy=True):
+        if type(U) is not NumpyVectorArray:
+            return super().scatter_array(U, copy=copy)
+        payload = mpi.get_object(self._payload)
+        payload[0] = np.ascontiguousarray(U.to_numpy())
+        try:
+            remote_id = mpi.call(mpi.function_call_manage, _scatter_array, self._payload, U.space)
+        finally:
+            payload[0] = None
+        if not copy:
+            del U[:]
+        return GenericRemoteObject(self, remote_id)
+
     def _push_object(self, obj):
         return mpi.call(mpi.function_call_manage, _push_object, obj)
 
@@ -50,6 +74,15 @@ class MPIPool(WorkerPoolBase):
             payload[0] = None
         return result
 
+    def _map_dynamic(self, function, chunks, **kwargs):
+        payload = mpi.get_object(self._payload)
+        payload[0] = chunks
+        try:
+            result = mpi.call(mpi.function_call, _worker_map_dynamic_function, self._payload, function, **kwargs)
+        finally:
+            payload[0] = None
+        return result
+
     def _remove_object(self, remote_id):
         mpi.call(mpi.remove_object, remote_id)
 
@@ -81,7 +114,7 @@ def _worker_map_function(payload, function, **kwargs):
         args = list(zip(*payload[0]))
     else:
         args = None
-    args = zip(*mpi.comm.scatter(args, root=0))
+    args = zip(*mpi.scatter_objects(args, root=0))
 
     result = [mpi.function_call(function, *a, **kwargs) for a in args]
     result = mpi.comm.gather(result, root=0)
@@ -90,6 +123,50 @@ def _worker_map_function(payload, function, **kwargs):
         return list(chain(*result))
 
 
+def _worker_map_dynamic_function(payload, function, **kwargs):
+    chunks = mpi.bcast_object(payload[0] if mpi.rank0 else None)
+
+    # the next chunk to process is obtained by atomically incrementing a counter
+    # on rank 0 via one-sided communication
+    counter = np.zeros(1 if mpi.rank0 else 0, dtype=np.int64)
+    window = mpi.MPI.Win.Create(counter, disp_unit=counter.itemsize, comm=mpi.comm)
+    one, i = np.ones(1, dtype=np.int64), np.empty(1, dtype=np.int64)
+    results = []
+    try:
+        while True:
+            window.Lock(0)
+            window.Fetch_and_op(one, i, 0, 0, mpi.MPI.SUM)
+            window.Unlock(0)
+            if i[0] >= len(chunks):
+                break
+            results.append((int(i[0]), mpi.rank) + _call_function_on_chunk(function, chunks[i[0]], kwargs))
+    finally:
+        window.Free()
+
+    results = mpi.comm.gather(results, root=0)
+    if mpi.rank0:
+        return [r[1:] for r in sorted(chain(*results))]
+
+
+def _scatter_array(payload, space):
+    array = payload[0] if mpi.rank0 else None
+    shape, dtype = mpi.comm.bcast((array.shape, array.dtype) if mpi.rank0 else None, root=0)
+    slice_len = shape[0] // mpi.size + (1 if shape[0] % mpi.size else 0)
+    displs = [min(r * slice_len, shape[0]) for r in range(mpi.size)]
+    counts = [min((r+1) * slice_len, shape[0]) - d for r, d in enumerate(displs)]
+    local_array = np.empty((counts[mpi.rank], shape[1]), dtype=dtype)
+    row_size = shape[1] * dtype.itemsize
+    if row_size:
+        # send whole rows to avoid overflowing the element counts of MPI
+        row_type = mpi.MPI.BYTE.Create_contiguous(row_size).Commit()
+        try:
+            mpi.comm.Scatterv([array, counts, displs, row_type] if mpi.rank0 else None,
+                              [local_array, row_type], root=0)
+        finally:
+            row_type.Free()
+    return space.from_numpy(local_array)
+
+
 def _setup_worker():
     return [None]
 
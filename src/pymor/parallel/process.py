@@ -0,0 +1,261 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import chain
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from pymor.core import defaults
+from pymor.core.pickle import dumps, loads
+from pymor.parallel.basic import (
+    GenericRemoteObject,
+    WorkerPoolBase,
+    _call_function_on_chunk,
+    gather_futures,
+    synchronized,
+)
+from pymor.tools.counter import Counter
+from pymor.tools.random import get_seed_seq
+from pymor.vectorarrays.numpy import NumpyVectorArray
+
+
+class ProcessPool(WorkerPoolBase):
+    """|WorkerPool| based on local worker processes.
+
+    Each worker is a separate Python process, managed by a single-process
+    :class:`~concurrent.futures.ProcessPoolExecutor`, such that all
+    workers of the pool can be addressed individually. No external services
+    are required.
+
+    Pushed objects are serialized only once and then sent to all workers.
+    |NumpyVectorArrays| passed to :meth:`scatter_array` are copied to a
+    :class:`~multiprocessing.shared_memory.SharedMemory` block, from which each
+    worker reads its part of the array, such that the data is not pickled.
+
+    All functions and arguments passed to the pool need to be picklable.
+    In particular, functions have to be defined at module level.
+
+    Parameters
+    ----------
+    num_workers
+        Number of worker processes. If `None`, the number of CPUs is used.
+    mp_context
+        The :mod:`multiprocessing` context or the name of the start method
+        used for creating the worker processes. If `None`, the default
+        context is used.
+    """
+
+    _updated_defaults = 0
+
+    def __init__(self, num_workers=None, mp_context=None):
+        super().__init__()
+        num_workers = num_workers or os.cpu_count() or 1
+        if mp_context is None or isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        # let the workers share the resource tracker of this process to avoid
+        # spurious cleanup of the shared memory blocks used by scatter_array
+        resource_tracker.ensure_running()
+        self.executors = [ProcessPoolExecutor(max_workers=1, mp_context=mp_context,
+                                              initializer=_setup_worker, initargs=(seed_seq,))
+                          for seed_seq in get_seed_seq().spawn(num_workers)]
+        self._remote_objects_created = Counter()
+        self.logger.info(f'Started {num_workers} worker processes')
+        self._apply(os.chdir, os.getcwd())
+
+        if defaults.defaults_changes() > 0:
+            self._update_defaults()
+
+    def __len__(self):
+        return len(self.executors)
+
+    def shutdown(self):
+        """Shut down all worker processes."""
+        for executor in self.executors:
+            _shutdown_executor(executor, wait=True)
+        self.executors = []
+
+    def __del__(self):
+        for executor in getattr(self, 'executors', []):
+            _shutdown_executor(executor, wait=False)
+
+    @synchronized
+    def scatter_array(self, U, copy=True):
+        if type(U) is not NumpyVectorArray:
+            return super().scatter_array(U, copy=copy)
+
+        array = U.to_numpy()
+        shape, dtype, space = array.shape, array.dtype, U.space
+        shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+        try:
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf)[...] = array
+            del array
+            if not copy:
+                del U[:]
+            del U
+            slice_len = shape[0] // len(self) + (1 if shape[0] % len(self) else 0)
+            remote_id = RemoteId(self._remote_objects_created.inc())
+            self._wait([e.submit(_scatter_shared_array, remote_id, space, shm.name, shape, dtype,
+                                 i*slice_len, (i+1)*slice_len)
+                        for i, e in enumerate(self.executors)])
+        finally:
+            shm.close()
+            shm.unlink()
+        return GenericRemoteObject(self, remote_id)
+
+    def apply_async(self, function, *args, **kwargs):
+        with self._lock:
+            self._check_defaults()
+            kwargs = self._map_kwargs(kwargs)
+            return gather_futures([e.submit(_worker_call_function, function, False, args, kwargs)
+                                   for e in self.executors])
+
+    def apply_only_async(self, function, worker, *args, **kwargs):
+        with self._lock:
+            self._check_defaults()
+            kwargs = self._map_kwargs(kwargs)
+            return self.executors[worker].submit(_worker_call_function, function, False, args, kwargs)
+
+    def map_async(self, function, *args, chunksize=None, schedule='static', **kwargs):
+        if schedule != 'static':
+            return super().map_async(function, *args, chunksize=chunksize, schedule=schedule, **kwargs)
+        with self._lock:
+            self._check_defaults()
+            kwargs = self._map_kwargs(kwargs)
+            chunks = self._split_into_chunks(len(self), *args)
+            future = gather_futures([e.submit(_worker_call_function, function, True, a, kwargs)
+                                     for e, a in zip(self.executors, zip(*chunks))])
+        return _chain_future(future, lambda result: list(chain(*result)))
+
+    def _push_object(self, obj):
+        remote_id = RemoteId(self._remote_objects_created.inc())
+        data = dumps(obj)
+        self._wait([e.submit(_push_object, remote_id, data) for e in self.executors])
+        return remote_id
+
+    def _apply(self, function, *args, **kwargs):
+        self._check_defaults()
+        return self._wait([e.submit(_worker_call_function, function, False, args, kwargs)
+                           for e in self.executors])
+
+    def _apply_only(self, function, worker, *args, **kwargs):
+        self._check_defaults()
+        return self.executors[worker].submit(_worker_call_function, function, False, args, kwargs).result()
+
+    def _map(self, function, chunks, **kwargs):
+        self._check_defaults()
+        result = self._wait([e.submit(_worker_call_function, function, True, a, kwargs)
+                             for e, a in zip(self.executors, zip(*chunks))])
+        return list(chain(*result))
+
+    def _map_dynamic(self, function, chunks, **kwargs):
+        self._check_defaults()
+        chunks = enumerate(chunks)
+        results = []
+        pending = {}
+
+        def submit_next_chunk(worker):
+            i, chunk = next(chunks, (None, None))
+            if i is not None:
+                results.append(None)
+                future = self.executors[worker].submit(_worker_call_chunk, function, chunk, kwargs)
+                pending[future] = (worker, i)
+
+        for worker in range(len(self)):
+            submit_next_chunk(worker)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                worker, i = pending.pop(future)
+                results[i] = (worker,) + future.result()
+                submit_next_chunk(worker)
+        return results
+
+    def _remove_object(self, remote_id):
+        for executor in self.executors:
+            executor.submit(_remove_object, remote_id)
+
+    def _check_defaults(self):
+        if defaults.defaults_changes() > self._updated_defaults:
+            self._update_defaults()
+
+    def _update_defaults(self):
+        self._updated_defaults = defaults.defaults_changes()
+        self._apply(defaults.set_defaults, defaults.get_defaults(user=True, file=True, code=False))
+
+    @staticmethod
+    def _wait(futures):
+        return [f.result() for f in futures]
+
+
+def _chain_future(future, f):
+    chained_future = Future()
+
+    def done_callback(_):
+        try:
+            chained_future.set_result(f(future.result()))
+        except Exception as e:
+            chained_future.set_exception(e)
+
+    future.add_done_callback(done_callback)
+    return chained_future
+
+
+def _shutdown_executor(executor, wait):
+    # cancel_futures is only available for Python >= 3.9
+    if sys.version_info >= (3, 9):
+        executor.shutdown(wait=wait, cancel_futures=True)
+    else:
+        executor.shutdown(wait=wait)
+
+
+class RemoteId(int):
+    pass
+
+
+def _worker_call_function(function, loop, args, kwargs):
+    kwargs = {k: (_remote_objects[v] if isinstance(v, RemoteId) else v)
+              for k, v in kwargs.items()}
+    if loop:
+        return [function(*a, **kwargs) for a in zip(*args)]
+    else:
+        return function(*args, **kwargs)
+
+
+def _worker_call_chunk(function, args, kwargs):
+    kwargs = {k: (_remote_objects[v] if isinstance(v, RemoteId) else v)
+              for k, v in kwargs.items()}
+    return _call_function_on_chunk(function, args, kwargs)
+
+
+def _setup_worker(seed_seq):
+    global _remote_objects
+    _remote_objects = {}
+    # ensure that each worker starts with a different yet deterministically
+    # initialized rng
+    from pymor.tools.random import new_rng
+    new_rng(seed_seq).install()
+
+
+def _push_object(remote_id, data):
+    _remote_objects[remote_id] = loads(data)
+
+
+def _scatter_shared_array(remote_id, space, name, shape, dtype, start, stop):
+    shm = SharedMemory(name=name)
+    try:
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        _remote_objects[remote_id] = space.from_numpy(array[start:stop], ensure_copy=True)
+        del array
+    finally:
+        shm.close()
+
+
+def _remove_object(remote_id):
+    del _remote_objects[remote_id]
@@ -233,6 +233,38 @@ class Parameters(SortedFrozenDict):
 
         return Mu({k: parse_value(k, v) for k, v in mu.items()})
 
+    def stack(self, mus):
+        """Stack multiple |parameter values| into |NumPy arrays|.
+
+        Parameters
+        ----------
+        mus
+            The |parameter values| to stack. Either a list of |parameter values|
+            (or objects which can be :meth:`parsed <parse>` as such), a 2D |NumPy array|
+            of shape `(len(mus), self.dim)` where each row contains the values of all
+            parameters concatenated in alphabetical order, or an already stacked dict
+            as returned by this method.
+
+        Returns
+        -------
+        Dict mapping each parameter name to a 2D |NumPy array| of shape
+        `(len(mus), dim)` containing the values of the parameter for all
+        elements of `mus`. If a dict is passed, it is returned unchanged.
+        """
+        if isinstance(mus, dict):
+            assert all(k in mus and mus[k].ndim == 2 and mus[k].shape[1] == v for k, v in self.items())
+            return mus
+        if isinstance(mus, np.ndarray):
+            assert mus.ndim == 2 and mus.shape[1] == self.dim
+            values, offset = {}, 0
+            for k, v in self.items():
+                values[k] = mus[:, offset:offset+v]
+                offset += v
+            return values
+        mus = [mu if isinstance(mu, Mu) else self.parse(mu) for mu in mus]
+        assert all(self.assert_compatible(mu) for mu in mus)
+        return {k: np.array([mu[k] for mu in mus]).reshape((len(mus), v)) for k, v in self.items()}
+
     def space(self, *ranges):
         """Create a |ParameterSpace| with given ranges.
 
@@ -24,6 +24,34 @@ class ParameterFunctional(ParametricObject):
         """Evaluate the functional for given |parameter values| `mu`."""
         pass
 
+    def evaluate_many(self, mus):
+        """Evaluate the functional for multiple |parameter values| at once.
+
+        Parameters
+        ----------
+        mus
+            The |parameter values| for which to evaluate the functional. Either a list
+            of |parameter values|, a 2D |NumPy array| of shape `(n_mus, self.parameters.dim)`
+            or a dict of stacked |parameter values|, see
+            :meth:`~pymor.parameters.base.Parameters.stack`.
+
+        Returns
+        -------
+        |NumPy array| of shape `(n_mus,)` containing the values of the functional.
+        """
+        count = len(next(iter(mus.values()))) if isinstance(mus, dict) and mus else len(mus)
+        return self._evaluate_many(self.parameters.stack(mus), count)
+
+    def _evaluate_many(self, values, count):
+        """Evaluate the functional for stacked |parameter values|.
+
+        Override this method to provide a vectorized implementation of
+        :meth:`evaluate_many`. The default implementation calls
+        :meth:`evaluate` for each of the `count` |parameter values|.
+        `values` may contain additional parameters.
+        """
+        return np.array([self.evaluate(Mu({k: v[i] for k, v in values.items()})) for i in range(count)])
+
     def d_mu(self, parameter, index=0):
         """Return the functionals's derivative with respect to a given parameter.
 
@@ -153,6 +181,9 @@ class ProjectionParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return mu[self.parameter].item(self.index)
 
+    def _evaluate_many(self, values, count):
+        return values[self.parameter][:, self.index].copy()
+
     def d_mu(self, parameter, index=0):
         if parameter == self.parameter:
             assert 0 <= index < self.size
@@ -295,6 +326,13 @@ class ExpressionParameterFunctional(GenericParameterFunctional):
             second_derivative_mappings = None
         super().__init__(exp_mapping, parameters, name, derivative_mappings, second_derivative_mappings)
         self.__auto_init(locals())
+        self._many_variables = tuple(sorted(parameters))
+        self._many_mapping = self.expression_obj.to_numpy(self._many_variables)
+
+    def _evaluate_many(self, values, count):
+        if not self._many_variables:
+            return np.full(count, self.evaluate())
+        return self._many_mapping(*(values[k] for k in self._many_variables)).reshape(count)
 
     def __reduce__(self):
         return (ExpressionParameterFunctional,
@@ -323,6 +361,10 @@ class ProductParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return np.array([f.evaluate(mu) if hasattr(f, 'evaluate') else f for f in self.factors]).prod()
 
+    def _evaluate_many(self, values, count):
+        return np.array([f._evaluate_many(values, count) if hasattr(f, 'evaluate') else np.full(count, f)
+                         for f in self.factors]).prod(axis=0)
+
     def d_mu(self, parameter, index=0):
         summands = []
         for i, f in enumerate(self.factors):
@@ -364,6 +406,9 @@ class ConjugateParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return np.conj(self.functional.evaluate(mu))
 
+    def _evaluate_many(self, values, count):
+        return np.conj(self.functional._evaluate_many(values, count))
+
     def d_mu(self, parameter, index=0):
         return self.with_(functional=self.functional.d_mu(parameter, index), name=f'{self.name}_d_{parameter}_{index}')
 
@@ -386,6 +431,9 @@ class ConstantParameterFunctional(ParameterFunctional):
     def evaluate(self, mu=None):
         return self.constant_value
 
+    def _evaluate_many(self, values, count):
+        return np.full(count, self.constant_value)
+
     def d_mu(self, parameter, index=0):
         return self.with_(constant_value=0, name=f'{self.name}_d_{parameter}_{index}')
 
@@ -423,6 +471,9 @@ class LincombParameterFunctional(ParameterFunctional):
         assert self.parameters.assert_compatible(mu)
         return sum(c * f(mu) for c, f in zip(self.coefficients, self.functionals))
 
+    def _evaluate_many(self, values, count):
+        return sum(c * f._evaluate_many(values, count) for c, f in zip(self.coefficients, self.functionals))
+
     def d_mu(self, parameter, index=0):
         functionals_d_mu = [f.d_mu(parameter, index) for f in self.functionals]
         return self.with_(functionals=functionals_d_mu, name=f'{self.name}_d_{parameter}_{index}')
@@ -488,6 +539,11 @@ class MinThetaParameterFunctional(ParameterFunctional):
         assert np.all(thetas_mu > 0)
         return self.alpha_mu_bar * np.min(thetas_mu / self.thetas_mu_bar)
 
+    def _evaluate_many(self, values, count):
+        thetas_mu = np.array([theta._evaluate_many(values, count) for theta in self.thetas])
+        assert np.all(thetas_mu > 0)
+        return self.alpha_mu_bar * np.min(thetas_mu / self.thetas_mu_bar[:, np.newaxis], axis=0)
+
 
 class BaseMaxThetaParameterFunctional(ParameterFunctional):
     """Implements a generalization of the max-theta approach from :cite:`Haa17` (Exercise 5.12).
@@ -587,6 +643,16 @@ class BaseMaxThetaParameterFunctional(ParameterFunctional):
             # special case
             return self.gamma_mu_bar * np.abs(np.max(thetas_prime_mu / self.abs_thetas_mu_bar))
 
+    def _evaluate_many(self, values, count):
+        thetas_prime_mu = np.array([theta._evaluate_many(values, count) for theta in self.thetas_prime])
+        result = self.gamma_mu_bar * np.abs(np.max(thetas_prime_mu / self.thetas_mu_bar[:, np.newaxis], axis=0))
+        if self.theta_mu_bar_has_negative:
+            # special case, see evaluate
+            has_zero = np.any(thetas_prime_mu == 0, axis=0)
+            result[has_zero] = self.gamma_mu_bar * np.abs(
+                np.max(thetas_prime_mu[:, has_zero] / self.abs_thetas_mu_bar[:, np.newaxis], axis=0))
+        return result
+
     def d_mu(self, component, index=()):
         raise NotImplementedError
 
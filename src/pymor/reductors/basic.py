@@ -123,12 +123,13 @@ class ProjectionBasedReductor(BasicObject):
         """Reconstruct high-dimensional vector from reduced vector `u`."""
         return self.bases[basis][:u.dim].lincomb(u.to_numpy())
 
-    def extend_basis(self, U, basis='RB', method='gram_schmidt', pod_modes=1, pod_orthonormalize=True, copy_U=True):
+    def extend_basis(self, U, basis='RB', method='gram_schmidt', pod_modes=1, pod_orthonormalize=True, copy_U=True,
+                     pod_svd=None):
         basis_length = len(self.bases[basis])
 
         extend_basis(U, self.bases[basis], self.products.get(basis), method=method, pod_modes=pod_modes,
                      pod_orthonormalize=pod_orthonormalize,
-                     copy_U=copy_U)
+                     copy_U=copy_U, pod_svd=pod_svd)
 
         self._check_orthonormality(basis, basis_length)
 
@@ -462,8 +463,10 @@ class DelayLTIPGReductor(ProjectionBasedReductor):
         return super().reconstruct(u, basis)
 
 
-def extend_basis(U, basis, product=None, method='gram_schmidt', pod_modes=1, pod_orthonormalize=True, copy_U=True):
+def extend_basis(U, basis, product=None, method='gram_schmidt', pod_modes=1, pod_orthonormalize=True, copy_U=True,
+                 pod_svd=None):
     assert method in ('trivial', 'gram_schmidt', 'pod')
+    assert pod_svd is None or method == 'pod'
 
     basis_length = len(basis)
 
@@ -480,10 +483,18 @@ def extend_basis(U, basis, product=None, method='gram_schmidt', pod_modes=1, pod
     elif method == 'pod':
         U_proj_err = U - basis.lincomb(U.inner(basis, product))
 
-        basis.append(pod(U_proj_err, modes=pod_modes, product=product, orth_tol=np.inf)[0])
+        if pod_svd is None:
+            basis.append(pod(U_proj_err, modes=pod_modes, product=product, orth_tol=np.inf)[0])
+        else:
+            # the SVD contains the projection errors of all previous snapshots
+            pod_svd.update(U_proj_err)
+            basis.append(pod_svd.modes[:pod_modes])
 
         if pod_orthonormalize:
             gram_schmidt(basis, offset=basis_length, product=product, copy=False, check=False)
 
+        if pod_svd is not None:
+            pod_svd.project_out(basis[basis_length:])
+
     if len(basis) <= basis_length:
         raise ExtensionError
@@ -4,6 +4,7 @@
 
 import numpy as np
 
+from pymor.algorithms.batch import apply_batch, as_range_array_batch, evaluate_coefficients_batch
 from pymor.algorithms.image import estimate_image
 from pymor.algorithms.projection import project
 from pymor.core.base import ImmutableObject
@@ -11,7 +12,7 @@ from pymor.operators.constructions import LincombOperator, induced_norm
 from pymor.operators.numpy import NumpyMatrixOperator
 from pymor.parameters.functionals import ConstantParameterFunctional, ParameterFunctional
 from pymor.reductors.basic import StationaryRBReductor
-from pymor.reductors.residual import ResidualReductor
+from pymor.reductors.residual import ResidualOperator, ResidualReductor
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 
 
@@ -83,6 +84,24 @@ class CoerciveRBEstimator(ImmutableObject):
             est /= self.coercivity_estimator(mu)
         return est
 
+    def estimate_error_batch(self, U, mus, m):
+        """Estimate the errors of multiple reduced solutions at once.
+
+        `U[i]` is the reduced solution for |parameter values| `mus[i]`. The
+        projected residual operator and the coercivity estimator are evaluated
+        for all |parameter values| simultaneously.
+        """
+        assert len(U) == len(mus)
+        if type(self.residual) is not ResidualOperator:
+            return np.hstack([self.estimate_error(U[i], mu, m) for i, mu in enumerate(mus)]) if mus else np.empty(0)
+        R = apply_batch(self.residual.operator, U, mus)
+        if self.residual.rhs:
+            R -= as_range_array_batch(self.residual.rhs, mus)
+        est = R.norm()
+        if self.coercivity_estimator:
+            est /= evaluate_coefficients_batch([self.coercivity_estimator], mus)[:, 0]
+        return est
+
     def estimate_output_error(self, U, mu, m, return_vector=False):
         if self.projected_output_adjoint is None:
             raise NotImplementedError
@@ -285,6 +304,33 @@ class SimpleCoerciveRBEstimator(ImmutableObject):
 
         return est
 
+    def estimate_error_batch(self, U, mus, m):
+        """Estimate the errors of multiple reduced solutions at once.
+
+        `U[i]` is the reduced solution for |parameter values| `mus[i]`. The
+        coefficients for all |parameter values| are evaluated into a single
+        array and all residual norms are computed with one product against
+        `estimator_matrix`.
+        """
+        assert len(U) == len(mus)
+        if not m.rhs.parametric:
+            CR = np.ones((len(mus), 1))
+        else:
+            CR = evaluate_coefficients_batch(m.rhs.coefficients, mus)
+
+        if not m.operator.parametric:
+            CO = np.ones((len(mus), 1))
+        else:
+            CO = evaluate_coefficients_batch(m.operator.coefficients, mus)
+
+        C = np.hstack((CR, (CO[:, :, np.newaxis] * U.to_numpy()[:, np.newaxis, :]).reshape((len(mus), -1))))
+
+        est = self.norm(NumpyVectorSpace.make_array(C))
+        if self.coercivity_estimator:
+            est /= evaluate_coefficients_batch([self.coercivity_estimator], mus)[:, 0]
+
+        return est
+
     def estimate_output_error(self, U, mu, m, return_vector=False):
         if not self.output_estimator_matrices or not self.output_functional_coeffs:
             raise NotImplementedError
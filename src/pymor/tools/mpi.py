@@ -26,7 +26,9 @@ When :func:`event_loop` is running on the MPI ranks, :func:`call`
 can be used on rank 0 to execute the same Python function (given
 as first argument) simultaneously on all MPI ranks (including
 rank 0). Calling :func:`quit` will exit :func:`event_loop` on
-all MPI ranks.
+all MPI ranks. Large contiguous buffers in the arguments passed to :func:`call`,
+e.g. the data of |NumPy arrays| or |SciPy spmatrices|, are not pickled but are
+transferred out-of-band (see :func:`bcast_object`).
 
 Additionally, this module provides several helper methods which are
 intended to be used in conjunction with :func:`call`: :func:`mpi_info`
@@ -49,10 +51,15 @@ return value and return the corresponding :class:`ObjectId`. The functions
 :class:`ObjectId` and a string as first and second argument and execute
 the method named by the second argument on the object referred to by the
 first argument.
+
+Finally, :func:`bcast_object` and :func:`scatter_objects` can be used within
+functions executed via :func:`call` to communicate large objects between
+the ranks without pickling their buffer data.
 """
 
 import sys
 
+import numpy as np
 from packaging.version import Version
 
 from pymor.core.config import config
@@ -118,7 +125,7 @@ def event_loop():
     assert not rank0
     while True:
         try:
-            method, args, kwargs = comm.bcast(None)
+            method, args, kwargs = bcast_object(None)
             if method == 'QUIT':
                 assert not _managed_objects
                 break
@@ -154,7 +161,7 @@ def call(method, *args, **kwargs):
     assert rank0
     if finished:
         return
-    comm.bcast((method, args, kwargs), root=0)
+    bcast_object((method, args, kwargs))
     return method(*args, **kwargs)
 
 
@@ -171,7 +178,7 @@ def quit():
              'This might be caused by a resource leak.')
         for obj_id in list(_managed_objects):
             call(remove_object, obj_id)
-    comm.bcast(('QUIT', None, None))
+    bcast_object(('QUIT', None, None))
     finished = True
     _event_loop_running = False
 
@@ -179,6 +186,109 @@ def quit():
 ################################################################################
 
 
+OUT_OF_BAND_MIN_SIZE = 2**16
+MAX_MESSAGE_SIZE = 2**30
+
+
+def bcast_object(obj, root=0):
+    """Broadcast `obj` from rank `root` to all ranks.
+
+    In contrast to `comm.bcast`, the data of all contiguous buffers of at least
+    `OUT_OF_BAND_MIN_SIZE` bytes contained in `obj` (e.g. the data of
+    |NumPy arrays| or the `data`, `indices` and `indptr` arrays of
+    |SciPy spmatrices|) is extracted out-of-band using pickle protocol 5 and sent
+    using `Bcast` directly from the memory of the original object. Only the
+    remaining small pickle is broadcast using `comm.bcast`.
+
+    Parameters
+    ----------
+    obj
+        The object to broadcast. Ignored on all ranks except `root`.
+    root
+        The rank from which to broadcast.
+
+    Returns
+    -------
+    `obj` on rank `root`, a copy of `obj` on all other ranks.
+    """
+    if rank == root:
+        data, buffers = _dumps_out_of_band(obj)
+        comm.bcast((data, [b.nbytes for b in buffers]), root=root)
+        for b in buffers:
+            _bcast_buffer(b, root)
+        return obj
+    else:
+        data, sizes = comm.bcast(None, root=root)
+        buffers = [np.empty(size, dtype=np.uint8) for size in sizes]
+        for b in buffers:
+            _bcast_buffer(b, root)
+        return pymor.core.pickle.loads(data, buffers=buffers)
+
+
+def scatter_objects(objs, root=0):
+    """Send `objs[i]` from rank `root` to rank `i`.
+
+    As for :func:`bcast_object`, large buffers are extracted out-of-band
+    and are sent without being copied into a pickle.
+
+    Parameters
+    ----------
+    objs
+        Sequence of `size` objects to scatter. Ignored on all ranks except `root`.
+    root
+        The rank from which to scatter.
+
+    Returns
+    -------
+    The object sent to this rank.
+    """
+    if rank == root:
+        assert len(objs) == size
+        pickled = [(None, []) if r == root else _dumps_out_of_band(obj) for r, obj in enumerate(objs)]
+        comm.scatter([(data, [b.nbytes for b in buffers]) for data, buffers in pickled], root=root)
+        requests = [comm.Isend([chunk, MPI.BYTE], dest=r)
+                    for r, (_, buffers) in enumerate(pickled)
+                    for b in buffers
+                    for chunk in _chunks(b)]
+        MPI.Request.Waitall(requests)
+        return objs[root]
+    else:
+        data, sizes = comm.scatter(None, root=root)
+        buffers = [np.empty(size, dtype=np.uint8) for size in sizes]
+        for b in buffers:
+            for chunk in _chunks(b):
+                comm.Recv([chunk, MPI.BYTE], source=root)
+        return pymor.core.pickle.loads(data, buffers=buffers)
+
+
+def _dumps_out_of_band(obj):
+    buffers = []
+
+    def buffer_callback(buffer):
+        raw = buffer.raw()
+        if raw.nbytes < OUT_OF_BAND_MIN_SIZE:
+            return True
+        buffers.append(raw)
+        return False
+
+    data = pymor.core.pickle.dumps(obj, protocol=5,
+                                   buffer_callback=buffer_callback)
+    return data, buffers
+
+
+def _bcast_buffer(b, root):
+    for chunk in _chunks(b):
+        comm.Bcast([chunk, MPI.BYTE], root=root)
+
+
+def _chunks(b):
+    # split large buffers to stay below the maximum message size of MPI
+    return [b[i:i+MAX_MESSAGE_SIZE] for i in range(0, b.nbytes, MAX_MESSAGE_SIZE)]
+
+
+################################################################################
+
+
 def mpi_info():
     """Print some information on the MPI setup.
 
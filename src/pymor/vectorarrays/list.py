@@ -5,6 +5,7 @@
 import numpy as np
 
 from pymor.core.base import BasicObject, abstractclassmethod, abstractmethod, classinstancemethod
+from pymor.core.defaults import defaults
 from pymor.vectorarrays.interface import VectorArray, VectorArrayImpl, VectorSpace, _create_random_values
 
 
@@ -43,6 +44,18 @@ class Vector(BasicObject):
         _, max_val = self.amax()
         return max_val
 
+    def buffer(self):
+        """Return the vector's data as a one-dimensional |NumPy array|.
+
+        The Euclidean inner product of the returned arrays has to agree with
+        :meth:`inner`. The array may share memory with the vector and must not be
+        modified. If implemented, |ListVectorArray| uses the buffers to compute
+        inner products, linear combinations and norms of many vectors at once with
+        single BLAS calls. The default implementation returns `None`, in which case
+        the operations are performed vector by vector.
+        """
+        return None
+
     @abstractmethod
     def dofs(self, dof_indices):
         pass
@@ -249,6 +262,13 @@ class ComplexifiedVector(Vector):
         else:
             return self.real_part.to_numpy(ensure_copy=ensure_copy)
 
+    def buffer(self):
+        real_buffer = self.real_part.buffer()
+        if real_buffer is None or self.imag_part is None:
+            return real_buffer
+        imag_buffer = self.imag_part.buffer()
+        return None if imag_buffer is None else real_buffer + imag_buffer * 1j
+
     @property
     def real(self):
         return type(self)(self.real_part.copy(), None)
@@ -282,6 +302,9 @@ class NumpyVector(CopyOnWriteVector):
     def dim(self):
         return len(self._array)
 
+    def buffer(self):
+        return self._array
+
     def _copy_data(self):
         self._array = self._array.copy()
 
@@ -424,14 +447,28 @@ class ListVectorArrayImpl(VectorArrayImpl):
                 for xx, y in zip(x_list, self._indexed(ind)):
                     y.axpy(alpha, xx)
 
+    def _packed(self, ind, allow_copy=True):
+        return _packed_array(self._indexed(ind), self.space.dim, allow_copy)
+
     def inner(self, other, ind, oind):
+        A = self._packed(ind)
+        B = other._packed(oind) if A is not None else None
+        if B is not None:
+            return A.conj().dot(B.T)
         return (np.array([[a.inner(b) for b in other._indexed(oind)] for a in self._indexed(ind)])
                   .reshape((self.len_ind(ind), other.len_ind(oind))))
 
     def pairwise_inner(self, other, ind, oind):
+        A = self._packed(ind)
+        B = other._packed(oind) if A is not None else None
+        if B is not None:
+            return np.sum(A.conj() * B, axis=1)
         return np.array([a.inner(b) for a, b in zip(self._indexed(ind), other._indexed(oind))])
 
     def gramian(self, ind):
+        A = self._packed(ind)
+        if A is not None:
+            return A.conj().dot(A.T)
         self_list = self._indexed(ind)
         l = len(self_list)
         if l == 0:
@@ -448,6 +485,12 @@ class ListVectorArrayImpl(VectorArrayImpl):
         return R
 
     def lincomb(self, coefficients, ind):
+        A = self._packed(ind)
+        if A is not None:
+            try:
+                return ListVectorArrayImpl([self.space.vector_from_numpy(r) for r in coefficients.dot(A)], self.space)
+            except NotImplementedError:
+                pass
         RL = []
         for coeffs in coefficients:
             R = self.space.zero_vector()
@@ -458,12 +501,21 @@ class ListVectorArrayImpl(VectorArrayImpl):
         return ListVectorArrayImpl(RL, self.space)
 
     def norm(self, ind):
+        A = self._packed(ind, allow_copy=False)
+        if A is not None:
+            return np.linalg.norm(A, axis=1)
         return np.array([v.norm() for v in self._indexed(ind)])
 
     def norm2(self, ind):
+        A = self._packed(ind, allow_copy=False)
+        if A is not None:
+            return np.sum((A * A.conj()).real, axis=1)
         return np.array([v.norm2() for v in self._indexed(ind)])
 
     def dofs(self, dof_indices, ind):
+        A = self._packed(ind, allow_copy=False)
+        if A is not None:
+            return A[:, dof_indices]
         return (np.array([v.dofs(dof_indices) for v in self._indexed(ind)])
                   .reshape((self.len_ind(ind), len(dof_indices))))
 
@@ -491,6 +543,47 @@ class ListVectorArrayImpl(VectorArrayImpl):
         return ListVectorArrayImpl([v.conj() for v in self._indexed(ind)], self.space)
 
 
+@defaults('enabled')
+def _packed_array(vectors, dim, allow_copy, enabled=True):
+    """Return the buffers of the given vectors as rows of a two-dimensional |NumPy array|.
+
+    If the buffers are equally spaced rows of the same |NumPy array| (e.g. when the
+    vectors have been created using :meth:`~ListVectorSpace.from_numpy`), a read-only
+    view is returned. Otherwise, the buffers are copied into a new array if
+    `allow_copy` is `True`. Returns `None` if one of the vectors does not provide a
+    :meth:`~Vector.buffer`, if the buffers cannot be packed without copying and
+    `allow_copy` is `False` or if `enabled` is `False`.
+    """
+    if not enabled:
+        return None
+    buffers = []
+    for v in vectors:
+        b = v.buffer()
+        if b is None:
+            return None
+        buffers.append(b)
+    if not buffers:
+        return np.empty((0, dim))
+
+    first = buffers[0]
+    if len(buffers) == 1:
+        return first[np.newaxis, :]
+    if first.ndim == 1 and all(b.dtype == first.dtype and b.shape == first.shape and b.strides == first.strides
+                               and _root_array(b) is _root_array(first) for b in buffers):
+        addresses = np.array([b.__array_interface__['data'][0] for b in buffers])
+        stride = addresses[1] - addresses[0]
+        if stride > 0 and np.all(np.diff(addresses) == stride):
+            return np.lib.stride_tricks.as_strided(first, shape=(len(buffers), len(first)),
+                                                   strides=(stride, first.strides[0]), writeable=False)
+    return np.array(buffers) if allow_copy else None
+
+
+def _root_array(array):
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
 class ListVectorArray(VectorArray):
     """|VectorArray| implemented as a Python list of vectors.
 
@@ -2,12 +2,15 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+import mmap
+import tempfile
 from numbers import Integral, Number
 
 import numpy as np
 from scipy.sparse import issparse
 
 from pymor.core.base import classinstancemethod
+from pymor.core.defaults import defaults
 from pymor.vectorarrays.interface import VectorArray, VectorArrayImpl, VectorSpace, _create_random_values
 
 
@@ -71,14 +74,30 @@ class NumpyVectorArrayImpl(VectorArrayImpl):
         if len_other <= self._array.shape[0] - self._len:
             if self._array.dtype != other_array.dtype:
                 self._array = self._array.astype(np.promote_types(self._array.dtype, other_array.dtype))
-            self._array[self._len:self._len + len_other] = other_array
         else:
-            self._array = np.append(self._array[:self._len], other_array, axis=0)
+            # grow geometrically to avoid quadratic copying when appending vector by vector
+            new_array = np.empty((_grown_capacity(self._len + len_other, self._array.shape[0]), self._array.shape[1]),
+                                 dtype=np.promote_types(self._array.dtype, other_array.dtype))
+            new_array[:self._len] = self._array[:self._len]
+            _record_reallocation(self._array[:self._len].nbytes)
+            self._array = new_array
+        self._array[self._len:self._len + len_other] = other_array
         self._len += len_other
 
         if remove_from_other:
             other.delete(oind)
 
+    def __getstate__(self):
+        # do not pickle the unused capacity of the array
+        state = self.__dict__.copy()
+        state['_array'] = self._array[:self._len]
+        return state
+
+    def shrink_to_fit(self):
+        if self._array.shape[0] > self._len:
+            self._array = self._array[:self._len].copy()
+            _record_reallocation(self._array.nbytes)
+
     def scal(self, alpha, ind):
         ind = slice(None, self._len) if ind is None else ind
         if type(alpha) is np.ndarray:
@@ -109,7 +128,7 @@ class NumpyVectorArrayImpl(VectorArrayImpl):
         if self._array.dtype != alpha_dtype or self._array.dtype != B.dtype:
             dtype = np.promote_types(self._array.dtype, alpha_dtype)
             dtype = np.promote_types(dtype, B.dtype)
-            self._array = self._array.astype(dtype)
+            self._array = self._array.astype(dtype, copy=False)
 
         if type(alpha) is np.ndarray:
             alpha = alpha[:, np.newaxis]
@@ -177,6 +196,317 @@ class NumpyVectorArrayImpl(VectorArrayImpl):
         return max_ind, max_val
 
 
+class NumpyMemmapVectorArrayImpl(NumpyVectorArrayImpl):
+    """|NumPy array| based implementation backed by a memory-mapped file.
+
+    All operations are performed block-wise, such that the memory footprint does not
+    depend on the number of vectors in the array. Growing the array extends the
+    underlying file in chunks without copying the existing data.
+
+    Parameters
+    ----------
+    array
+        Memory-mapped two-dimensional |NumPy array| holding the data.
+    l
+        Number of vectors in `array` that belong to the |VectorArray|.
+    file
+        File object `array` has been mapped from. If `None`, the file is not owned
+        by the array and will be copied to a new temporary file when the array
+        needs to be extended.
+    chunk_size
+        Approximate size in bytes by which the underlying file is extended.
+    block_size
+        Approximate size in bytes of the blocks in which the data is processed.
+    max_in_memory_size
+        Results of operations (e.g. copies or linear combinations) with a size in
+        bytes of at most `max_in_memory_size` are held in RAM. Larger results are
+        again backed by temporary files.
+    """
+
+    @defaults('chunk_size', 'block_size', 'max_in_memory_size')
+    def __init__(self, array, l=None, file=None, chunk_size=2**28, block_size=2**26, max_in_memory_size=2**28):
+        super().__init__(array, l)
+        self._file = file
+        self._chunk_size, self._block_size, self._max_in_memory_size = chunk_size, block_size, max_in_memory_size
+
+    @classmethod
+    @defaults('directory')
+    def zeros(cls, count, reserve, dim, dtype=np.float64, directory=None, **kwargs):
+        """Create a new array backed by a temporary file in `directory`.
+
+        If `directory` is `None`, the default location of :mod:`tempfile` is used.
+        """
+        file = tempfile.TemporaryFile(dir=directory)
+        capacity = max(count, reserve, 1)
+        file.truncate(max(capacity * dim * np.dtype(dtype).itemsize, 1))  # empty files cannot be mapped
+        array = np.memmap(file, dtype=dtype, mode='r+', shape=(capacity, dim))
+        return cls(array, count, file=file, **kwargs)
+
+    def _options(self):
+        return {'chunk_size': self._chunk_size, 'block_size': self._block_size,
+                'max_in_memory_size': self._max_in_memory_size}
+
+    def __reduce__(self):
+        return NumpyVectorArrayImpl, (np.array(self._array[:self._len]),)
+
+    def _new_impl(self, count, dtype):
+        dim = self._array.shape[1]
+        if count * dim * np.dtype(dtype).itemsize <= self._max_in_memory_size:
+            return NumpyVectorArrayImpl(np.zeros((count, dim), dtype=dtype))
+        return NumpyMemmapVectorArrayImpl.zeros(count, 0, dim, dtype, **self._options())
+
+    def _block_len(self):
+        return max(1, self._block_size // max(self._array.shape[1] * self._array.itemsize, 1))
+
+    def _selectors(self, ind, length=None):
+        """Yield slices `s` of the selected vectors and the corresponding rows `sel` of `_array`."""
+        selection = _normalize_ind(self._len, ind)
+        length = _len_selection(selection) if length is None else length
+        block_len = self._block_len()
+        for start in range(0, length, block_len):
+            s = slice(start, min(start + block_len, length))
+            yield s, _sub_selection(selection, s)
+
+    def _map_blocks(self, f, ind, dtype):
+        result = self._new_impl(self.len_ind(ind), dtype)
+        for s, sel in self._selectors(ind):
+            result._array[s] = f(self._array[sel])
+        return result
+
+    def _resize(self, capacity, dtype):
+        dim = self._array.shape[1]
+        if self._file is None or dtype != self._array.dtype:
+            new = NumpyMemmapVectorArrayImpl.zeros(0, capacity, dim, dtype, **self._options())
+            for s, sel in self._selectors(None):
+                new._array[s] = self._array[sel]
+            _record_reallocation(self._len * dim * self._array.itemsize)
+            self._array, self._file = new._array, new._file
+        else:
+            self._array.flush()
+            self._file.truncate(max(capacity * dim * self._array.itemsize, 1))
+            self._array = np.memmap(self._file, dtype=dtype, mode='r+', shape=(capacity, dim))
+
+    def shrink_to_fit(self):
+        if len(self._array) > max(self._len, 1) and self._file is not None:
+            self._resize(max(self._len, 1), self._array.dtype)
+
+    def _promote(self, *dtypes):
+        dtype = np.result_type(self._array.dtype, *dtypes)
+        if dtype != self._array.dtype:
+            self._resize(len(self._array), dtype)
+
+    def real(self, ind):
+        return self._map_blocks(np.real, ind, self._array.real.dtype)
+
+    def imag(self, ind):
+        return self._map_blocks(np.imag, ind, self._array.real.dtype)
+
+    def conj(self, ind):
+        return self._map_blocks(np.conj, ind, self._array.dtype)
+
+    def delete(self, ind):
+        if ind is None:
+            self._len = 0
+            return
+        l = self._len
+        if type(ind) is slice:
+            ind = set(range(*ind.indices(l)))
+        elif not hasattr(ind, '__len__'):
+            ind = {ind if 0 <= ind else l + ind}
+        else:
+            ind = {i if 0 <= i else l+i for i in ind}
+        remaining = np.array(sorted(set(range(l)) - ind), dtype=np.intp)
+        # remaining[i] >= i, so no row is overwritten before it has been moved
+        for s, sel in self._selectors(remaining):
+            self._array[s] = self._array[sel]
+        self._len = len(remaining)
+
+    def copy(self, deep, ind):
+        return self._map_blocks(lambda A: A, ind, self._array.dtype)
+
+    def append(self, other, remove_from_other, oind):
+        len_other = other.len_ind(oind)
+        if len_other == 0:
+            return
+
+        other_dtype = other._array.dtype
+        if self._len + len_other > len(self._array):
+            chunk_len = max(1, self._chunk_size // max(self._array.shape[1] * self._array.itemsize, 1))
+            self._resize(-(-(self._len + len_other) // chunk_len) * chunk_len,
+                         np.result_type(self._array.dtype, other_dtype))
+        else:
+            self._promote(other_dtype)
+
+        if isinstance(other, NumpyMemmapVectorArrayImpl):
+            for s, sel in other._selectors(oind):
+                self._array[self._len + s.start:self._len + s.stop] = other._array[sel]
+        else:
+            self._array[self._len:self._len + len_other] = other.to_numpy(False, oind)
+        self._len += len_other
+
+        if remove_from_other:
+            other.delete(oind)
+
+    def scal(self, alpha, ind):
+        alpha_dtype = alpha.dtype if type(alpha) is np.ndarray else type(alpha)
+        self._promote(alpha_dtype)
+        for s, sel in self._selectors(ind):
+            self._array[sel] *= alpha[s, np.newaxis] if type(alpha) is np.ndarray else alpha
+
+    def scal_copy(self, alpha, ind):
+        alpha_dtype = alpha.dtype if type(alpha) is np.ndarray else type(alpha)
+        result = self._new_impl(self.len_ind(ind), np.result_type(self._array.dtype, alpha_dtype))
+        for s, sel in self._selectors(ind):
+            result._array[s] = self._array[sel] * (alpha[s, np.newaxis] if type(alpha) is np.ndarray else alpha)
+        return result
+
+    def _x_blocks(self, x, ind, xind):
+        """Like :meth:`_selectors`, but additionally yield the corresponding vectors `B` of `x`."""
+        length = self.len_ind(ind)
+        if x.len_ind(xind) == 1:
+            B = x.to_numpy(False, xind)
+            for s, sel in self._selectors(ind, length):
+                yield s, sel, B
+        else:
+            x_selection = _normalize_ind(x._len, xind)
+            for s, sel in self._selectors(ind, length):
+                yield s, sel, x._array[_sub_selection(x_selection, s)]
+
+    def axpy(self, alpha, x, ind, xind):
+        alpha_dtype = alpha.dtype if type(alpha) is np.ndarray else type(alpha)
+        self._promote(alpha_dtype, x._array.dtype)
+        for s, sel, B in self._x_blocks(x, ind, xind):
+            self._array[sel] += B * (alpha[s, np.newaxis] if type(alpha) is np.ndarray else alpha)
+
+    def axpy_copy(self, alpha, x, ind, xind):
+        alpha_dtype = alpha.dtype if type(alpha) is np.ndarray else type(alpha)
+        result = self._new_impl(self.len_ind(ind), np.result_type(self._array.dtype, alpha_dtype, x._array.dtype))
+        for s, sel, B in self._x_blocks(x, ind, xind):
+            result._array[s] = self._array[sel] + B * (alpha[s, np.newaxis] if type(alpha) is np.ndarray else alpha)
+        return result
+
+    def inner(self, other, ind, oind):
+        R = np.empty((self.len_ind(ind), other.len_ind(oind)), dtype=np.result_type(self._array, other._array))
+        for s, sel in self._selectors(ind):
+            A = self._array[sel].conj()
+            if isinstance(other, NumpyMemmapVectorArrayImpl):
+                for os, osel in other._selectors(oind):
+                    R[s, os] = A.dot(other._array[osel].T)
+            else:
+                R[s] = A.dot(other.to_numpy(False, oind).T)
+        return R
+
+    def pairwise_inner(self, other, ind, oind):
+        R = np.empty(self.len_ind(ind), dtype=np.result_type(self._array, other._array))
+        for s, sel, B in self._x_blocks(other, ind, oind):
+            R[s] = np.sum(self._array[sel].conj() * B, axis=1)
+        return R
+
+    def lincomb(self, coefficients, ind):
+        result = self._new_impl(len(coefficients), np.result_type(self._array, coefficients))
+        for s, sel in self._selectors(ind):
+            result._array[:len(coefficients)] += coefficients[:, s].dot(self._array[sel])
+        return result
+
+    def norm(self, ind):
+        R = np.empty(self.len_ind(ind))
+        for s, sel in self._selectors(ind):
+            R[s] = np.linalg.norm(self._array[sel], axis=1)
+        return R
+
+    def norm2(self, ind):
+        R = np.empty(self.len_ind(ind))
+        for s, sel in self._selectors(ind):
+            A = self._array[sel]
+            R[s] = np.sum((A * A.conj()).real, axis=1)
+        return R
+
+    def dofs(self, dof_indices, ind):
+        R = np.empty((self.len_ind(ind), len(dof_indices)), dtype=self._array.dtype)
+        for s, sel in self._selectors(ind):
+            R[s] = self._array[sel][:, dof_indices]
+        return R
+
+    def amax(self, ind):
+        max_ind = np.empty(self.len_ind(ind), dtype=np.intp)
+        max_val = np.empty(self.len_ind(ind))
+        for s, sel in self._selectors(ind):
+            A = np.abs(self._array[sel])
+            max_ind[s] = np.argmax(A, axis=1)
+            max_val[s] = A[np.arange(len(A)), max_ind[s]]
+        return max_ind, max_val
+
+
+@defaults('growth_factor')
+def _grown_capacity(required, capacity, growth_factor=1.5):
+    """Return the new capacity of a |NumPy array| which has to hold at least `required` vectors."""
+    assert growth_factor >= 1
+    return max(required, int(capacity * growth_factor))
+
+
+_reallocation_statistics = {'reallocations': 0, 'copied_bytes': 0}
+
+
+def _record_reallocation(copied_bytes):
+    _reallocation_statistics['reallocations'] += 1
+    _reallocation_statistics['copied_bytes'] += copied_bytes
+
+
+def reallocation_statistics(reset=False):
+    """Return statistics on the reallocations of |NumpyVectorArrays|.
+
+    Counts how often the underlying |NumPy arrays| of |NumpyVectorArrays| have been
+    reallocated to make room for appended vectors (or to release unused memory via
+    :meth:`NumpyVectorArray.shrink_to_fit`) and how many bytes have been copied
+    in the process.
+
+    Parameters
+    ----------
+    reset
+        If `True`, reset the counters to zero after returning their values.
+
+    Returns
+    -------
+    A dict with the keys `'reallocations'` and `'copied_bytes'`.
+    """
+    statistics = dict(_reallocation_statistics)
+    if reset:
+        _reallocation_statistics.update(reallocations=0, copied_bytes=0)
+    return statistics
+
+
+def _normalize_ind(length, ind):
+    """Return `ind` as contiguous slice or as array of non-negative indices."""
+    if ind is None:
+        return slice(0, length)
+    if type(ind) is slice:
+        start, stop, step = ind.indices(length)
+        if step == 1:
+            return slice(start, max(start, stop))
+        return np.arange(start, stop, step)
+    if isinstance(ind, Number):
+        return slice(ind, ind + 1) if ind >= 0 else slice(length + ind, length + ind + 1)
+    ind = np.asarray(ind, dtype=np.intp)
+    return np.where(ind < 0, ind + length, ind)
+
+
+def _len_selection(selection):
+    return selection.stop - selection.start if type(selection) is slice else len(selection)
+
+
+def _sub_selection(selection, s):
+    if type(selection) is slice:
+        return slice(selection.start + s.start, selection.start + s.stop)
+    return selection[s]
+
+
+def _is_file_backed(array):
+    base = array
+    while isinstance(base, np.ndarray):
+        base = base.base
+    return isinstance(base, mmap.mmap)
+
+
 class NumpyVectorArray(VectorArray):
     """|VectorArray| implementation via |NumPy arrays|.
 
@@ -188,8 +518,10 @@ class NumpyVectorArray(VectorArray):
     |NumPy array|. Thus, while operations like
     :meth:`~pymor.vectorarrays.interface.VectorArray.axpy` or
     :meth:`~pymor.vectorarrays.interface.VectorArray.inner`
-    will be quite efficient, removing or appending vectors will
-    be costly.
+    will be quite efficient, removing vectors will be costly.
+    When appending vectors, the capacity of the underlying array is
+    increased geometrically, such that the amortized cost of appending
+    a single vector is constant (see :meth:`shrink_to_fit`).
 
     .. warning::
         This class is not intended to be instantiated directly. Use
@@ -198,6 +530,17 @@ class NumpyVectorArray(VectorArray):
 
     impl_type = NumpyVectorArrayImpl
 
+    def shrink_to_fit(self):
+        """Release memory reserved for appending further vectors.
+
+        When vectors are appended, the capacity of the underlying |NumPy array| is
+        increased geometrically to keep the amortized cost of
+        :meth:`~pymor.vectorarrays.interface.VectorArray.append` constant. Calling
+        this method reduces the capacity to the current length of the array.
+        """
+        assert not self.is_view
+        self.impl.shrink_to_fit()
+
     def __str__(self):
         return str(self.to_numpy())
 
@@ -244,6 +587,40 @@ class NumpyVectorSpace(VectorSpace):
         va.impl._array[:count] = _create_random_values((count, self.dim), distribution, **kwargs)
         return va
 
+    def memmap_zeros(self, count=1, reserve=0, dtype=np.float64):
+        """Create a |VectorArray| of null vectors backed by a temporary memory-mapped file.
+
+        The returned array behaves like any other |NumpyVectorArray|, but its data is
+        stored on disk and all operations are performed block-wise (see
+        :class:`NumpyMemmapVectorArrayImpl`). Thus, the array can hold more data than
+        fits into RAM. Existing memory-mapped |NumPy arrays| (e.g. obtained via
+        `numpy.load(..., mmap_mode='r+')`) can be wrapped without copying using
+        :meth:`~pymor.vectorarrays.interface.VectorSpace.from_numpy`.
+
+        Parameters
+        ----------
+        count
+            The number of vectors.
+        reserve
+            Hint for the backend to which length the array will grow.
+        dtype
+            The dtype of the array.
+
+        Returns
+        -------
+        A |NumpyVectorArray| containing `count` vectors with each component zero.
+        """
+        assert count >= 0
+        assert reserve >= 0
+        return NumpyVectorArray(self, NumpyMemmapVectorArrayImpl.zeros(count, reserve, self.dim, dtype))
+
+    def memmap_empty(self, reserve=0, dtype=np.float64):
+        """Create an empty |VectorArray| backed by a temporary memory-mapped file.
+
+        This is a shorthand for `self.memmap_zeros(0, reserve, dtype)`.
+        """
+        return self.memmap_zeros(0, reserve, dtype)
+
     @classinstancemethod
     def make_array(cls, obj, id=None):  # noqa N805
         return cls._array_factory(obj, id=id)
@@ -287,6 +664,11 @@ class NumpyVectorSpace(VectorSpace):
     def _array_factory(cls, array, space=None, id=None):
         if type(array) is np.ndarray:
             pass
+        elif isinstance(array, np.memmap) and _is_file_backed(array):
+            assert array.ndim == 2
+            space = space or cls(array.shape[1], id)
+            assert array.shape[1] == space.dim
+            return NumpyVectorArray(space, NumpyMemmapVectorArrayImpl(array))
         elif issparse(array):
             array = array.toarray()
         else:
@@ -85,6 +85,41 @@ def test_gram_schmidt_with_product_and_R(operator_with_arrays_and_products):
     assert np.all(almost_equal(onb, U))
 
 
+@pyst.given_vector_arrays()
+@settings(deadline=None)
+def test_gram_schmidt_blocked(vector_array):
+    U = vector_array
+    assume(len(U) > 1 or not contains_zero_vector(U))
+
+    V = U.copy()
+    onb, R = gram_schmidt(U, return_R=True, block_size=3, copy=True)
+    assert np.all(almost_equal(U, V))
+    assert np.allclose(onb.inner(onb), np.eye(len(onb)))
+    assert np.all(almost_equal(U, onb.lincomb(onb.inner(U).T), atol=1e-13, rtol=1e-13))
+    assert np.all(almost_equal(V, onb.lincomb(R.T), atol=1e-13, rtol=1e-13))
+
+    onb2, R2 = gram_schmidt(U, return_R=True, block_size=3, copy=False)
+    assert np.all(almost_equal(onb, onb2))
+    assert np.all(R == R2)
+    assert np.all(almost_equal(onb, U))
+
+
+def test_gram_schmidt_blocked_with_offset(operator_with_arrays_and_products):
+    _, _, U, _, p, _ = operator_with_arrays_and_products
+    l = len(U) // 2
+    basis = gram_schmidt(U[:l], product=p)
+
+    A = basis.copy()
+    A.append(U[l:])
+    A.append(U[l:l+1])
+    A.append(A.zeros())
+    onb, R = gram_schmidt(A, product=p, return_R=True, offset=len(basis), block_size=2)
+    assert len(onb) < len(A) - 1 or len(U) == l
+    assert np.all(almost_equal(onb[:len(basis)], basis))
+    assert np.allclose(p.apply2(onb, onb), np.eye(len(onb)))
+    assert np.all(almost_equal(A, onb.lincomb(R.T), atol=1e-13, rtol=1e-13))
+
+
 @settings(deadline=None)
 @pyst.given_vector_arrays(count=2)
 def test_gram_schmidt_biorth(vector_arrays):
@@ -0,0 +1,66 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+
+from pymor.algorithms.hapod import inc_vectorarray_hapod
+from pymor.algorithms.incremental_svd import IncrementalSVD
+from pymor.algorithms.svd_va import qr_svd
+from pymor.reductors.basic import extend_basis
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+
+pytestmark = pytest.mark.builtin
+
+
+def _snapshots(rng, count=60, dim=100, rank=12):
+    return NumpyVectorSpace(dim).from_numpy(
+        (rng.normal(size=(count, rank)) * np.logspace(0, -6, rank)) @ rng.normal(size=(rank, dim))
+    )
+
+
+def test_incremental_svd():
+    rng = np.random.default_rng(0)
+    U = _snapshots(rng)
+    svd = IncrementalSVD(U.space)
+    for i in range(0, len(U), 7):
+        svd.update(U[i:i+7])
+
+    _, s, _ = qr_svd(U, rtol=0.)
+    assert svd.snap_count == len(U)
+    assert np.allclose(svd.svals[:len(s)], s)
+    assert np.allclose(svd.modes.gramian(), np.eye(len(svd.modes)))
+    assert np.all(U.norm() ** 2 - np.sum(U.inner(svd.modes) ** 2, axis=1) < 1e-12 * np.sum(s ** 2))
+
+    truncated = IncrementalSVD(U.space, max_modes=4)
+    for i in range(0, len(U), 7):
+        truncated.update(U[i:i+7])
+    assert len(truncated.modes) == 4
+    assert np.allclose(truncated.svals, s[:4], rtol=1e-4)
+    assert truncated.discarded_energy > 0
+
+
+def test_inc_vectorarray_hapod_with_incremental_svd():
+    rng = np.random.default_rng(0)
+    U = _snapshots(rng)
+    modes, svals, snap_count = inc_vectorarray_hapod(6, U, 1e-4, 0.5)
+    svd = IncrementalSVD(U.space)
+    modes2, svals2, snap_count2 = inc_vectorarray_hapod(6, U, 1e-4, 0.5, svd=svd)
+    assert snap_count == snap_count2 == svd.snap_count == len(U)
+    assert len(svals) == len(svals2)
+    assert np.allclose(svals, svals2)
+    assert np.allclose(np.abs(modes.inner(modes2)), np.eye(len(modes)), atol=1e-6)
+
+
+def test_extend_basis_with_incremental_svd():
+    rng = np.random.default_rng(0)
+    U = _snapshots(rng)
+    basis = U.space.empty()
+    svd = IncrementalSVD(U.space)
+    for i in range(0, len(U), 10):
+        extend_basis(U[i:i+10], basis, method='pod', pod_modes=2, pod_svd=svd)
+    assert len(basis) == 12
+    assert np.allclose(basis.gramian(), np.eye(len(basis)))
+    assert np.all(np.abs(svd.modes.inner(basis)) < 1e-8)
+    assert svd.snap_count == len(U)
@@ -12,7 +12,7 @@ from pymor.algorithms.pod import pod
 from pymor.core.logger import log_levels
 from pymortests.strategies import given_vector_arrays
 
-methods = ['method_of_snapshots', 'qr_svd']
+methods = ['method_of_snapshots', 'qr_svd', 'randomized']
 
 
 @settings(deadline=None, suppress_health_check=[HealthCheck.filter_too_much,
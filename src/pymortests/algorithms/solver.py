@@ -7,7 +7,9 @@ import pytest
 from scipy.sparse import diags
 
 import pymor.algorithms.genericsolvers
+from pymor.bindings.scipy import factorize
 from pymor.bindings.scipy import solver_options as scipy_solver_options
+from pymor.core.defaults import set_defaults
 from pymor.operators.interface import Operator
 from pymor.operators.numpy import NumpyMatrixOperator
 from pymor.vectorarrays.numpy import NumpyVectorSpace
@@ -64,3 +66,42 @@ def test_numpy_sparse_solvers(numpy_sparse_solver):
     rhs = op.range.make_array(np.ones(10))
     solution = op.apply_inverse(rhs)
     assert ((op.apply(solution) - rhs).norm() / rhs.norm())[0] < 1e-8
+
+
+@pytest.mark.parametrize('solver', ['scipy_block_cg', 'scipy_block_gmres', 'scipy_bicgstab_spilu'])
+def test_numpy_sparse_block_solvers(solver):
+    n = 100
+    matrix = diags([-np.ones(n-1), 4 * np.ones(n), -np.ones(n-1)], [-1, 0, 1], format='csc')
+    op = NumpyMatrixOperator(matrix, solver_options={'inverse': solver})
+    rhs = op.range.random(5)
+    rhs.append(rhs[0] * 2)
+    solution = op.apply_inverse(rhs)
+    assert np.all((op.apply(solution) - rhs).norm() / rhs.norm() < 1e-8)
+    # by default, the preconditioner is not stored with the matrix
+    assert not hasattr(matrix, 'preconditioner')
+    assert np.all(op.apply_inverse(rhs).to_numpy() == solution.to_numpy())
+
+    if solver != 'scipy_block_cg':
+        op = op.with_(solver_options={'inverse': {'type': solver, 'keep_preconditioner': True}})
+        assert np.all(op.apply_inverse(rhs).to_numpy() == solution.to_numpy())
+        assert hasattr(matrix, 'preconditioner')
+        ilu = matrix.preconditioner
+        op.apply_inverse(rhs)
+        assert matrix.preconditioner is ilu
+        op.with_(solver_options={'inverse': {'type': solver, 'keep_preconditioner': True,
+                                             'spilu_drop_tol': 1e-6}}).apply_inverse(rhs)
+        assert matrix.preconditioner is not ilu
+
+
+def test_factorize_follows_apply_inverse_default_solver():
+    n = 10
+    key = 'pymor.bindings.scipy.apply_inverse.default_solver'
+    assert factorize(diags([np.arange(1., n + 1)], [0], format='csc'))
+    assert not factorize(diags([np.arange(1., n + 1)], [0], format='csc'), 'scipy_bicgstab')
+    set_defaults({key: 'scipy_bicgstab'})
+    try:
+        matrix = diags([np.arange(1., n + 1)], [0], format='csc')
+        assert not factorize(matrix)
+        assert not hasattr(matrix, 'factorization')
+    finally:
+        set_defaults({key: 'scipy_spsolve'})
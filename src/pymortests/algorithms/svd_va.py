@@ -8,13 +8,19 @@ from hypothesis import HealthCheck, assume, settings
 from hypothesis.strategies import sampled_from
 
 from pymor.algorithms.basic import almost_equal, contains_zero_vector
-from pymor.algorithms.svd_va import method_of_snapshots, qr_svd
+from pymor.algorithms.svd_va import method_of_snapshots, qr_svd, randomized_svd
+from pymor.algorithms.tsqr import tsqr
 from pymor.core.logger import log_levels
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymortests.base import runmodule
 from pymortests.strategies import given_vector_arrays
 
-methods = [method_of_snapshots, qr_svd]
+
+def qr_svd_tsqr(A, **kwargs):
+    return qr_svd(A, qr_method='tsqr', **kwargs)
+
+
+methods = [method_of_snapshots, qr_svd, qr_svd_tsqr, randomized_svd]
 
 
 @given_vector_arrays(method=sampled_from(methods))
@@ -56,6 +62,44 @@ def test_method_of_snapshots_with_product(operator_with_arrays_and_products, met
     assert np.all(almost_equal(A, UsVh, rtol=4e-8))
 
 
+@pytest.mark.builtin
+@pytest.mark.parametrize('single_pass', [False, True])
+def test_randomized_svd_low_rank(single_pass):
+    rng = np.random.default_rng(0)
+    space = NumpyVectorSpace(500)
+    A = space.from_numpy(rng.normal(size=(300, 8)) @ np.diag(np.logspace(0, -3, 8)) @ rng.normal(size=(8, 500)))
+
+    U_ref, s_ref, _ = qr_svd(A, modes=8)
+    with log_levels({'pymor.algorithms': 'ERROR'}):
+        if single_pass:
+            U, s, Vh = randomized_svd((A[i:i+50] for i in range(0, len(A), 50)), modes=8)
+        else:
+            U, s, Vh = randomized_svd(A)
+    assert len(U) == len(s) == Vh.shape[0] == 8
+    assert Vh.shape[1] == len(A)
+    assert np.allclose(s, s_ref)
+    assert np.allclose(np.abs(U.inner(U_ref)), np.eye(8), atol=1e-6)
+    U.scal(s)
+    assert np.all(almost_equal(A, U.lincomb(Vh.T), rtol=1e-8))
+
+
+@given_vector_arrays()
+@settings(deadline=None)
+def test_tsqr(vector_array):
+    A = vector_array
+
+    B = A.copy()
+    with log_levels({'pymor.algorithms': 'ERROR'}):
+        Q, R = tsqr(A)
+    assert np.all(almost_equal(A, B))
+    assert len(Q) == R.shape[0]
+    assert R.shape[1] == len(A)
+    assert np.allclose(Q.gramian(), np.eye(len(Q)))
+    assert np.allclose(np.tril(R, -1), 0)
+    assert np.all(np.diag(R).real >= 0)
+    assert np.all(almost_equal(A, Q.lincomb(R.T), atol=1e-13, rtol=1e-13))
+
+
 @pytest.mark.builtin
 @pytest.mark.parametrize('method', methods)
 def test_not_too_many_modes(method):
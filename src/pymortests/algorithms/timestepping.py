@@ -0,0 +1,65 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+from scipy.sparse import diags
+
+from pymor.algorithms.basic import almost_equal
+from pymor.algorithms.hapod import IncHAPODTrajectorySink, inc_vectorarray_hapod
+from pymor.algorithms.timestepping import (
+    ImplicitEulerTimeStepper,
+    ImplicitMidpointTimeStepper,
+    MemmapTrajectorySink,
+    OutputTrajectorySink,
+)
+from pymor.operators.constructions import LowRankOperator
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parameters.base import Mu
+from pymor.parameters.functionals import ExpressionParameterFunctional
+
+pytestmark = pytest.mark.builtin
+
+
+@pytest.mark.parametrize('time_stepper_type', [ImplicitEulerTimeStepper, ImplicitMidpointTimeStepper])
+def test_low_rank_update(time_stepper_type):
+    n = 50
+    A = NumpyMatrixOperator(diags([-np.ones(n-1), 2 * np.ones(n), -np.ones(n-1)], [-1, 0, 1], format='csc') * n**2)
+    rng = np.random.default_rng(0)
+    L = A.range.from_numpy(rng.random((2, n)))
+    R = A.source.from_numpy(rng.random((2, n)))
+    LR = LowRankOperator(L, np.eye(2), R)
+    op = A + ExpressionParameterFunctional('sin(t[0]) * mu[0]', {'t': 1, 'mu': 1}) * LR
+    U0 = A.source.ones()
+    F = A.range.ones()
+    mu = Mu({'mu': [2.]})
+
+    U = time_stepper_type(20).solve(0, 1, U0, op, rhs=F, mu=mu)
+    U_lr = time_stepper_type(20, low_rank_update=True).solve(0, 1, U0, op, rhs=F, mu=mu)
+    assert len(U) == len(U_lr) == 21
+    assert np.all((U - U_lr).norm() <= 1e-10 * U.norm())
+
+
+def test_trajectory_sinks(tmp_path):
+    n = 50
+    A = NumpyMatrixOperator(diags([-np.ones(n-1), 2 * np.ones(n), -np.ones(n-1)], [-1, 0, 1], format='csc') * n**2)
+    U0 = A.source.from_numpy(np.sin(np.linspace(0, np.pi, n)))
+    F = A.range.ones()
+    C = NumpyMatrixOperator(np.ones((1, n)) / n)
+    time_stepper = ImplicitEulerTimeStepper(40)
+
+    U = time_stepper.solve(0, 1, U0, A, rhs=F)
+    U_memmap = time_stepper.solve(0, 1, U0, A, rhs=F, sink=MemmapTrajectorySink(tmp_path / 'U.npy'))
+    assert np.all(U_memmap == U.to_numpy())
+    assert np.all(np.load(tmp_path / 'U.npy') == U.to_numpy())
+
+    outputs = time_stepper.solve(0, 1, U0, A, rhs=F, sink=OutputTrajectorySink(C))
+    assert np.allclose(outputs, C.apply(U).to_numpy())
+
+    modes, svals, snap_count = time_stepper.solve(0, 1, U0, A, rhs=F,
+                                                  sink=IncHAPODTrajectorySink(10, 1e-6, 0.9))
+    modes_ref, svals_ref, _ = inc_vectorarray_hapod(5, U, 1e-6, 0.9)
+    assert snap_count == len(U)
+    assert np.allclose(svals, svals_ref)
+    assert np.all(almost_equal(modes, modes_ref * np.sign(modes.inner(modes_ref).diagonal()), rtol=1e-8))
@@ -10,10 +10,16 @@ from uuid import uuid4
 
 import numpy as np
 import pytest
+import scipy.sparse as sps
 
+from pymor.analyticalproblems.functions import GenericFunction
 from pymor.core import cache
+from pymor.core.exceptions import CacheKeyGenerationError
 from pymor.models.basic import StationaryModel
 from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parallel.process import ProcessPool
+from pymor.vectorarrays.list import NumpyListVectorSpace
+from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymortests.base import runmodule
 
 pytestmark = pytest.mark.builtin
@@ -64,6 +70,36 @@ class IWillBeCopied(cache.CacheableObject):
         return id(self)
 
 
+class IamContentCached(cache.CacheableObject):
+
+    calls = 0
+
+    def __init__(self, matrix, functional):
+        self.__auto_init(locals())
+
+    @cache.cached
+    def count_call(self, arg):
+        IamContentCached.calls += 1
+        return arg
+
+
+class IamSharedCached(cache.CacheableObject):
+
+    def __init__(self, value):
+        self.__auto_init(locals())
+
+    @cache.cached
+    def pid(self, arg):
+        return os.getpid()
+
+
+def _shared_cached_pid(region, arg):
+    cache.cache_regions['test_shared'] = region
+    obj = IamSharedCached(1.)
+    obj.enable_caching('test_shared')
+    return obj.pid(arg)
+
+
 @pytest.mark.parametrize('class_type', [IamMemoryCached, IamDiskCached])
 def test_runtime(class_type):
     r = class_type()
@@ -96,7 +132,10 @@ def test_region_api():
     with tempfile.TemporaryDirectory() as tmpdir:
         backends = [cache.MemoryRegion(100),
                     cache.DiskRegion(path=os.path.join(tmpdir, str(uuid4())),
-                                     max_size=1024 ** 2, persistent=False)]
+                                     max_size=1024 ** 2, persistent=False),
+                    cache.SharedDiskRegion(path=os.path.join(tmpdir, str(uuid4())), max_size=1024 ** 2),
+                    cache.TieredDiskRegion(path=os.path.join(tmpdir, str(uuid4())),
+                                           max_size=1024 ** 2, persistent=False)]
         for backend in backends:
             with _close_cache(backend):
                 assert backend.get(key) == (False, None)
@@ -125,5 +164,225 @@ def test_memory_region_safety():
     assert len(U) == 1
 
 
+def test_memory_region_max_size():
+    region = cache.MemoryRegion(100, max_size=3000)
+    for i in range(3):
+        region.set(i, np.zeros(100))
+    assert region.size == 2400
+    region.get(0)
+    region.set(3, np.zeros(100))
+    assert region.evictions == 1
+    assert region.get(1) == (False, None)
+    assert region.get(0)[0] and region.get(3)[0]
+    region.set(4, np.zeros(1000))
+    assert region.get(4) == (False, None)
+    assert region.size <= 3000
+
+
+def test_memory_region_complex_size():
+    region = cache.MemoryRegion(100)
+    U = NumpyVectorSpace(10).ones(2)
+    region.set('real', U)
+    region.set('complex', U * 1j)
+    assert region.size == 2 * 10 * 8 + 2 * 10 * 16
+    region.set('list', NumpyListVectorSpace(10).from_numpy(U.to_numpy() * 1j))
+    assert region.size == 2 * 10 * 8 + 4 * 10 * 16
+
+
+def test_memory_region_lfu():
+    region = cache.MemoryRegion(3, eviction_policy='lfu')
+    for i in range(3):
+        region.set(i, i)
+    region.get(0)
+    region.get(0)
+    region.get(2)
+    region.set(3, 3)
+    assert [region.get(i)[0] for i in range(4)] == [True, False, True, True]
+
+
+def test_memory_region_copy_on_write():
+    region = cache.MemoryRegion(100)
+    U = NumpyVectorSpace(3).ones(2)
+    region.set('U', {'solution': U})
+    U.scal(2.)
+    V = region.get('U')[1]['solution']
+    assert np.all(V.to_numpy() == 1.)
+    V.scal(3.)
+    assert np.all(region.get('U')[1]['solution'].to_numpy() == 1.)
+
+
+def test_memory_region_stats():
+    region = cache.MemoryRegion(2)
+    cache.cache_regions['test_stats'] = region
+    try:
+        obj = IamLimitedCached('test_stats')
+        for i in range(3):
+            obj.me_takey_no_time(i)
+        obj.me_takey_no_time(2)
+        region.get(0)
+        stats = region.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 3
+        assert stats['evictions'] == 1
+        assert stats['bytes'] > 0
+    finally:
+        del cache.cache_regions['test_stats']
+
+
+def test_content_hash():
+    matrix = sps.random(100, 100, density=0.1, format='csr', random_state=0)
+    op = NumpyMatrixOperator(matrix)
+    assert cache.content_hash(op) == cache.content_hash(NumpyMatrixOperator(matrix.copy()))
+    assert (cache.content_hash(NumpyMatrixOperator(matrix.tocoo()))
+            == cache.content_hash(NumpyMatrixOperator(matrix.tocoo())))
+    assert cache.content_hash(op) != cache.content_hash(NumpyMatrixOperator(2 * matrix))
+    assert cache.content_hash(op) != cache.content_hash(NumpyMatrixOperator(matrix, name='foo'))
+    dense = np.asfortranarray(matrix.toarray())
+    assert cache.content_hash(NumpyMatrixOperator(dense)) == cache.content_hash(NumpyMatrixOperator(matrix.toarray()))
+    assert (cache.build_cache_key(('apply', op)) ==
+            cache.build_cache_key(('apply', NumpyMatrixOperator(matrix.copy()))))
+    with pytest.raises(CacheKeyGenerationError):
+        cache.content_hash(GenericFunction(lambda x: x[..., 0]))
+
+
+def test_content_hash_containers():
+    mixed = IamSharedCached({1: 2, 'a': {3, 'b'}})
+    assert cache.content_hash(mixed) == cache.content_hash(IamSharedCached({'a': {'b', 3}, 1: 2}))
+    assert cache.content_hash(mixed) != cache.content_hash(IamSharedCached({1: 2, 'a': {4, 'b'}}))
+    assert cache.content_hash(IamSharedCached({1: 2})) != cache.content_hash(IamSharedCached({2: 1}))
+    # the check for missing attributes in ImmutableMeta is skipped with python -O
+    missing = IamSharedCached(1.)
+    del missing.__dict__['value']
+    with pytest.raises(CacheKeyGenerationError):
+        cache.content_hash(missing)
+    with pytest.raises(CacheKeyGenerationError):
+        cache.build_cache_key(('apply', missing))
+
+
+def test_persistent_region_without_cache_id():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        region = cache.DiskRegion(path=os.path.join(tmpdir, str(uuid4())), max_size=1024 ** 2, persistent=True)
+        cache.cache_regions['test_persistent'] = region
+        try:
+            with _close_cache(region):
+                calls = IamContentCached.calls
+                for _ in range(2):
+                    obj = IamContentCached(np.arange(10.), NumpyMatrixOperator(np.ones((1, 10))))
+                    obj.enable_caching('test_persistent')
+                    assert obj.count_call(3) == 3
+                assert IamContentCached.calls == calls + 1
+                obj = IamContentCached(np.arange(10.) + 1, NumpyMatrixOperator(np.ones((1, 10))))
+                obj.enable_caching('test_persistent')
+                obj.count_call(3)
+                assert IamContentCached.calls == calls + 2
+        finally:
+            del cache.cache_regions['test_persistent']
+
+
+def test_shared_disk_region():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        region = cache.SharedDiskRegion(path=os.path.join(tmpdir, str(uuid4())), max_size=1024 ** 2, shards=4)
+        pool = ProcessPool(num_workers=2)
+        try:
+            with _close_cache(region):
+                pid = pool.apply_only(_shared_cached_pid, 0, region, 1)
+                assert pid != os.getpid()
+                assert pool.apply_only(_shared_cached_pid, 1, region, 1) == pid
+                assert _shared_cached_pid(region, 1) == pid
+                assert _shared_cached_pid(region, 2) == os.getpid()
+                assert pool.apply(_shared_cached_pid, region, 2) == [os.getpid()] * 2
+        finally:
+            pool.shutdown()
+            del cache.cache_regions['test_shared']
+
+
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+def test_tiered_disk_region(compression):
+    U = NumpyVectorSpace(100).from_numpy(np.arange(2000.).reshape((20, 100)))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, str(uuid4()))
+        region = cache.TieredDiskRegion(path=path, max_size=1024 ** 2, persistent=True, memory_max_keys=1,
+                                        compression=compression, promotion_threshold=2, demotion='evict')
+        with _close_cache(region):
+            region.set('U', {'solution': U})
+            region.set('a', np.asfortranarray(np.ones((3, 4))))
+            assert 'a' not in region._cache
+            assert list(region.memory_region._cache) == ['a']
+
+            # first cold tier hit
+            V = region.get('U')[1]['solution']
+            assert np.all(V.to_numpy() == U.to_numpy())
+            assert list(region.memory_region._cache) == ['a']
+            V.scal(2.)
+            # second cold tier hit triggers promotion and demotion of 'a'
+            assert np.all(region.get('U')[1]['solution'].to_numpy() == U.to_numpy())
+            assert list(region.memory_region._cache) == ['U']
+            assert 'a' in region._cache
+            region.memory_region.clear()
+            a = region.get('a')[1]
+            assert a.flags.f_contiguous and a.flags.writeable
+            region.flush()
+
+        region = cache.TieredDiskRegion(path=path, max_size=1024 ** 2, persistent=True)
+        with _close_cache(region):
+            assert np.all(region.get('U')[1]['solution'].to_numpy() == U.to_numpy())
+
+
+def test_cache_statistics():
+    region = cache.MemoryRegion(2)
+    cache.cache_regions['test_stats'] = region
+    try:
+        obj = IamLimitedCached('test_stats')
+        obj.me_takey_no_time(0)
+        with cache.cache_statistics() as stats:
+            for i in range(3):
+                obj.me_takey_no_time(i)
+            obj.me_takey_no_time(2)
+        region_stats = stats['test_stats']
+        assert region_stats['hits'] == 2
+        assert region_stats['misses'] == 2
+        assert region_stats['evictions'] == 1
+        assert region_stats['bytes'] > 0
+        assert region_stats['methods']['IamLimitedCached.me_takey_no_time']['misses'] == 2
+        assert all(region_stats[k] >= 0 for k in ('key_time', 'lookup_time', 'insert_time'))
+
+        total_stats = region.stats()
+        assert total_stats['hits'] == 2 and total_stats['misses'] == 3
+        assert total_stats['evictions'] == 1
+        assert 'IamLimitedCached.me_takey_no_time' in cache.format_cache_statistics(stats, width=1000)
+        assert 'test_stats' in cache.format_cache_statistics(width=1000)
+    finally:
+        del cache.cache_regions['test_stats']
+
+
+class _DictRegion(cache.CacheRegion):
+    """Third-party region which does not call CacheRegion.__init__."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def get(self, key):
+        return (True, self._cache[key]) if key in self._cache else (False, None)
+
+    def set(self, key, value):
+        self._cache[key] = value
+
+    def clear(self):
+        self._cache = {}
+
+
+def test_cache_statistics_custom_region():
+    region = _DictRegion()
+    assert region.stats()['hits'] == 0
+    cache.cache_regions['test_custom'] = region
+    try:
+        obj = IamLimitedCached('test_custom')
+        assert obj.me_takey_no_time(1) == obj.me_takey_no_time(1) == 1
+        stats = region.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['evictions'] is None
+    finally:
+        del cache.cache_regions['test_custom']
+
+
 if __name__ == '__main__':
     runmodule(filename=__file__)
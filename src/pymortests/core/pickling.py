@@ -13,6 +13,7 @@ from pymor.core.pickle import PicklingError, dumps, dumps_function, loads
 from pymor.discretizers.builtin.grids.subgrid import SubGrid
 from pymor.operators.numpy import NumpyMatrixBasedOperator
 from pymor.parameters.base import ParametricObject
+from pymor.vectorarrays.numpy import NumpyVectorArrayImpl
 
 is_equal_ignored_attributes = \
     ((SubGrid, {'_uid', '_CacheableObject__cache_region', '_SubGrid__parent_grid'}),
@@ -20,7 +21,16 @@ is_equal_ignored_attributes = \
      (ParametricObject, {'_name', '_uid', '_CacheableObject__cache_region', '_parameters'}),
      (BasicObject, {'_name', '_uid', '_CacheableObject__cache_region'}))
 
-is_equal_dispatch_table = {}
+
+def _assert_NumpyVectorArrayImpl_equal(first, second):
+    # the unused capacity of the array is not pickled
+    if not isinstance(second, NumpyVectorArrayImpl) or first._len != second._len:
+        return False
+    assert_is_equal(first._array[:first._len], second._array[:second._len])
+    return True
+
+
+is_equal_dispatch_table = {NumpyVectorArrayImpl: _assert_NumpyVectorArrayImpl_equal}
 
 if config.HAVE_DUNEGDT:
     from dune.xt.la import IstlVector
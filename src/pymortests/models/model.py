@@ -6,15 +6,25 @@ import numpy as np
 import pytest
 
 from pymor.algorithms.basic import almost_equal
-from pymor.algorithms.timestepping import ExplicitEulerTimeStepper, ImplicitMidpointTimeStepper
+from pymor.algorithms.gram_schmidt import gram_schmidt
+from pymor.algorithms.timestepping import (
+    ExplicitEulerTimeStepper,
+    ImplicitEulerTimeStepper,
+    ImplicitMidpointTimeStepper,
+)
 from pymor.analyticalproblems.functions import ConstantFunction, ExpressionFunction
+from pymor.analyticalproblems.instationary import InstationaryProblem
 from pymor.analyticalproblems.thermalblock import thermal_block_problem
 from pymor.core.pickle import dumps, loads
-from pymor.discretizers.builtin import discretize_stationary_cg
+from pymor.discretizers.builtin import discretize_instationary_cg, discretize_stationary_cg
+from pymor.models.basic import StationaryModel
 from pymor.models.iosys import LTIModel
 from pymor.models.symplectic import QuadraticHamiltonianModel
 from pymor.operators.block import BlockDiagonalOperator
 from pymor.operators.constructions import IdentityOperator
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parameters.functionals import ExpressionParameterFunctional
+from pymor.reductors.basic import InstationaryRBReductor, StationaryRBReductor
 from pymor.vectorarrays.numpy import NumpyVectorSpace
 from pymortests.base import runmodule
 from pymortests.core.pickling import assert_picklable, assert_picklable_without_dumps_function
@@ -59,6 +69,79 @@ def test_StationaryModel_deaffinize():
     assert np.allclose(m.output(mu), m_deaff.output(mu))
 
 
+def test_StationaryModel_solve_batch():
+
+    p = thermal_block_problem((2, 2)).with_(
+        outputs=[('l2', ConstantFunction(1., 2))]
+    )
+    m, _ = discretize_stationary_cg(p, diameter=1/10)
+    m.disable_caching()
+
+    mus = m.parameters.space(0.1, 1).sample_randomly(10)
+    RB = m.solution_space.empty()
+    for mu in mus[:5]:
+        RB.append(m.solve(mu))
+    gram_schmidt(RB, copy=False)
+    rom = StationaryRBReductor(m, RB).reduce()
+
+    for model in (m, rom):
+        U = model.solve_batch(mus)
+        assert len(U) == len(mus)
+        for i, mu in enumerate(mus):
+            assert np.all(almost_equal(U[i], model.solve(mu)))
+        assert np.allclose(model.output_batch(mus), np.vstack([model.output(mu) for mu in mus]))
+
+    assert len(rom.solve_batch([])) == 0
+
+
+class _ScaledSolutionModel(StationaryModel):
+
+    def _compute_solution(self, mu=None, **kwargs):
+        return super()._compute_solution(mu=mu, **kwargs) * 2
+
+
+def test_StationaryModel_solve_batch_overridden_compute_solution():
+    space = NumpyVectorSpace(3)
+    operator = (NumpyMatrixOperator(np.eye(3))
+                + ExpressionParameterFunctional('p[0]', {'p': 1}) * NumpyMatrixOperator(np.diag([1., 2., 3.])))
+    m = _ScaledSolutionModel(operator, space.ones())
+    m.disable_caching()
+
+    mus = [m.parameters.parse(p) for p in (0.5, 1., 2.)]
+    U = m.solve_batch(mus)
+    for i, mu in enumerate(mus):
+        assert np.allclose(U[i].to_numpy(), m.solve(mu).to_numpy())
+        assert np.allclose(U[i].to_numpy(), 2 / (1 + mu['p'][0] * np.array([1., 2., 3.])))
+
+
+@pytest.mark.parametrize('time_stepper', [ImplicitEulerTimeStepper(10), ImplicitMidpointTimeStepper(10)])
+def test_InstationaryModel_solve_batch(time_stepper):
+    p = InstationaryProblem(
+        thermal_block_problem((2, 2)).with_(
+            rhs=ExpressionFunction('x[0]', 2) * ExpressionParameterFunctional('1 + t[0]', {'t': 1}),
+            outputs=[('l2', ConstantFunction(1., 2))]),
+        T=1., initial_data=ExpressionFunction('x[1]', 2))
+    m, _ = discretize_instationary_cg(p, diameter=1/6, time_stepper=time_stepper, num_values=6)
+    m.disable_caching()
+
+    mus = m.parameters.space(0.1, 1).sample_randomly(5)
+    RB = m.solution_space.empty()
+    for mu in mus[:3]:
+        RB.append(m.solve(mu))
+    gram_schmidt(RB, copy=False)
+    rom = InstationaryRBReductor(m, RB).reduce()
+    m_nonparametric = m.with_(operator=m.operator.assemble(mus[0]))
+
+    for model in (m, rom, m_nonparametric):
+        U = model.solve_batch(mus)
+        assert len(U) == 6 * len(mus)
+        for i, mu in enumerate(mus):
+            assert np.all(almost_equal(U[6*i:6*(i+1)], model.solve(mu), rtol=1e-10))
+        assert np.allclose(model.output_batch(mus), np.vstack([model.output(mu) for mu in mus]))
+
+    assert len(rom.solve_batch([])) == 0
+
+
 @pytest.mark.parametrize('block_phase_space', (False, True))
 def test_quadratic_hamiltonian_model(block_phase_space):
     """Check QuadraticHamiltonianModel with implicit midpoint rule."""
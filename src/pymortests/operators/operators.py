@@ -549,6 +549,69 @@ def test_issue_1276():
     B.apply_inverse(v)
 
 
+@pytest.mark.builtin
+@pytest.mark.parametrize('sparse', [False, True])
+def test_lincomb_factorization_cache(sparse):
+    import scipy.sparse as sps
+
+    from pymor.core.defaults import set_defaults
+    from pymor.core.pickle import dumps
+    from pymor.operators.numpy import factorization_cache
+    rng = np.random.default_rng(0)
+    n = 10
+    matrices = [np.eye(n) * 10 + rng.random((n, n)), rng.random((n, n))]
+    if sparse:
+        matrices = [sps.csc_matrix(m) for m in matrices]
+    op = LincombOperator([NumpyMatrixOperator(m) for m in matrices],
+                         [1., ExpressionParameterFunctional('mu[0]', {'mu': 1})])
+    V = op.range.random(2)
+    mus = [op.parameters.parse(mu) for mu in (0.5, 1.5, 2.5)]
+
+    cache = factorization_cache()
+    cache.clear()
+    for mu in mus + mus:
+        assembled_op = op.assemble(mu)
+        assert np.all(almost_equal(op.apply_inverse(V, mu=mu), assembled_op.apply_inverse(V)))
+        assert np.all(almost_equal(op.apply_inverse_adjoint(V, mu=mu), assembled_op.H.apply_inverse(V)))
+    assert cache.misses == 3
+    assert cache.hits == 9
+    assert len(cache) == 3
+    assert cache.size > 0
+    # the cache is not part of the operator's state
+    assert '_factorization_cache' not in op.__dict__
+    dumps(op)
+
+    max_keys, cache.max_keys = cache.max_keys, 1
+    try:
+        op.apply_inverse(V, mu=mus[2])
+        assert len(cache) == 1
+        assert cache.hits == 10
+        op.apply_inverse(V, mu=mus[0])
+        assert len(cache) == 1
+        assert cache.misses == 4
+    finally:
+        cache.max_keys = max_keys
+
+    # time-dependent operators are not cached
+    cache.clear()
+    op = LincombOperator([NumpyMatrixOperator(m) for m in matrices],
+                         [1., ExpressionParameterFunctional('t[0]', {'t': 1})])
+    for t in (0.5, 1.5):
+        op.apply_inverse(V, mu=op.parameters.parse({'t': t}))
+    assert len(cache) == 0
+
+    # caching can be disabled
+    set_defaults({'pymor.operators.numpy.factorization_cache.enabled': False})
+    try:
+        assert factorization_cache() is None
+        op = LincombOperator([NumpyMatrixOperator(m) for m in matrices],
+                             [1., ExpressionParameterFunctional('mu[0]', {'mu': 1})])
+        assert np.all(almost_equal(op.apply_inverse(V, mu=mus[0]), op.assemble(mus[0]).apply_inverse(V)))
+        assert len(cache) == 0
+    finally:
+        set_defaults({'pymor.operators.numpy.factorization_cache.enabled': True})
+
+
 @pytest.mark.builtin
 @pytest.mark.parametrize('iscomplex', [False, True])
 def test_hankel_operator(iscomplex):
@@ -0,0 +1,156 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from pymor.algorithms.greedy import rb_greedy
+from pymor.algorithms.hapod import dist_vectorarray_hapod
+from pymor.analyticalproblems.thermalblock import thermal_block_problem
+from pymor.discretizers.builtin import discretize_stationary_cg
+from pymor.parallel.basic import WorkerPoolBase
+from pymor.parallel.dummy import dummy_pool
+from pymor.parallel.executor import AsyncWorkerPool, WorkerPoolExecutor
+from pymor.parallel.process import ProcessPool
+from pymor.reductors.coercive import CoerciveRBReductor
+from pymor.vectorarrays.numpy import NumpyVectorSpace
+from pymortests.base import runmodule
+
+pytestmark = pytest.mark.builtin
+
+
+@pytest.fixture(scope='module', params=['dummy', 'process'])
+def pool(request):
+    if request.param == 'dummy':
+        yield dummy_pool
+    else:
+        pool = ProcessPool(num_workers=2)
+        yield pool
+        pool.shutdown()
+
+
+def _len(U=None):
+    return len(U)
+
+
+def _sum(l=None):
+    return sum(l)
+
+
+def _scale(U=None, factor=None):
+    U.scal(factor)
+    return U.to_numpy()
+
+
+def _add(x, y, offset=None):
+    return x + y + offset
+
+
+def test_push_apply(pool):
+    with pool.push([1, 2, 3]) as l:
+        assert pool.apply(_sum, l=l) == [6] * len(pool)
+        assert pool.apply_only(_sum, len(pool) - 1, l=l) == 6
+
+
+def test_scatter_array(pool):
+    U = NumpyVectorSpace(4).from_numpy(np.arange(20.).reshape((5, 4)))
+    remote_U = pool.scatter_array(U)
+    assert len(U) == 5
+    assert sum(pool.apply(_len, U=remote_U)) == 5
+    assert np.all(np.vstack(pool.apply(_scale, U=remote_U, factor=2.)) == 2 * U.to_numpy())
+    remote_U.remove()
+
+    V = U.copy()
+    remote_V = pool.scatter_array(V, copy=False)
+    assert np.all(np.vstack(pool.apply(_scale, U=remote_V, factor=1.)) == U.to_numpy())
+
+
+def test_scatter_list(pool):
+    remote_l = pool.scatter_list(list(range(10)))
+    assert sum(pool.apply(_sum, l=remote_l)) == 45
+
+
+def test_map(pool):
+    assert pool.map(_add, list(range(7)), list(range(7)), offset=1) == [2 * i + 1 for i in range(7)]
+
+
+@pytest.mark.parametrize('chunksize', [None, 1, 3])
+def test_map_dynamic(pool, chunksize):
+    assert (pool.map(_add, list(range(11)), list(range(11)), offset=1, chunksize=chunksize, schedule='dynamic')
+            == [2 * i + 1 for i in range(11)])
+    if pool is not dummy_pool:
+        stats = pool.map_statistics
+        assert np.sum(stats['chunks']) == (4 if chunksize == 3 else 11)
+        assert np.all(stats['chunks'] > 0)
+        assert np.all(stats['busy_time'] <= stats['wall_time'])
+    assert pool.map(_add, [], [], offset=1, chunksize=chunksize, schedule='dynamic') == []
+
+
+class _RoundsProcessPool(ProcessPool):
+    _map_dynamic = WorkerPoolBase._map_dynamic
+
+
+def test_map_dynamic_default_implementation():
+    pool = _RoundsProcessPool(num_workers=2)
+    try:
+        assert (pool.map(_add, list(range(11)), list(range(11)), offset=1, chunksize=2, schedule='dynamic')
+                == [2 * i + 1 for i in range(11)])
+        assert list(pool.map_statistics['chunks']) == [3, 3]
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.parametrize('schedule', ['static', 'dynamic'])
+def test_async(pool, schedule):
+    with pool.push([1, 2, 3]) as l:
+        apply_future = pool.apply_async(_sum, l=l)
+        apply_only_future = pool.apply_only_async(_sum, len(pool) - 1, l=l)
+        map_future = pool.map_async(_add, list(range(7)), list(range(7)), offset=1, schedule=schedule)
+        assert map_future.result() == [2 * i + 1 for i in range(7)]
+        assert apply_future.result() == [6] * len(pool)
+        assert apply_only_future.result() == 6
+
+        async def main():
+            async_pool = AsyncWorkerPool(pool)
+            return await asyncio.gather(async_pool.apply(_sum, l=l),
+                                        async_pool.map(_add, [1, 2], [3, 4], offset=0, schedule=schedule))
+
+        assert asyncio.run(main()) == [[6] * len(pool), [4, 6]]
+
+
+def test_hapod_with_pool_executor(pool):
+    U = NumpyVectorSpace(20).from_numpy(np.random.default_rng(0).normal(size=(40, 20)))
+    modes, svals, _ = dist_vectorarray_hapod(4, U, 1e-6, 0.5)
+    modes2, svals2, _ = dist_vectorarray_hapod(4, U, 1e-6, 0.5, executor=WorkerPoolExecutor(pool))
+    assert np.allclose(svals, svals2)
+
+
+def test_rb_greedy(pool):
+    fom, _ = discretize_stationary_cg(thermal_block_problem((2, 2)), diameter=1/10)
+    training_set = fom.parameters.space(0.1, 1).sample_uniformly(2)
+    results = [rb_greedy(fom, CoerciveRBReductor(fom), training_set, max_extensions=3, pool=p)
+               for p in (dummy_pool, pool)]
+    assert results[0]['max_errs'] == pytest.approx(results[1]['max_errs'])
+    assert results[0]['extensions'] == results[1]['extensions'] == 3
+
+
+@pytest.mark.parametrize('use_error_estimator', [True, False])
+def test_rb_greedy_batch(pool, use_error_estimator):
+    fom, _ = discretize_stationary_cg(thermal_block_problem((2, 2)), diameter=1/10)
+    training_set = fom.parameters.space(0.1, 1).sample_uniformly(2)
+    reductor = CoerciveRBReductor(fom)
+    result = rb_greedy(fom, reductor, training_set, use_error_estimator=use_error_estimator,
+                       max_extensions=2, pool=pool, batch_size=3)
+    assert result['extensions'] == 2
+    assert result['basis_sizes'] == [3, 6]
+    rom = result['rom']
+    for mu in result['max_err_mus']:
+        U = fom.solve(mu)
+        assert (U - reductor.reconstruct(rom.solve(mu))).norm() < 1e-8 * U.norm()
+
+
+if __name__ == '__main__':
+    runmodule(filename=__file__)
@@ -2,10 +2,20 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 
+import numpy as np
 import pytest
 
 from pymor.basic import Mu
-from pymor.parameters.functionals import ExpressionParameterFunctional, ProjectionParameterFunctional
+from pymor.operators.constructions import LincombOperator
+from pymor.operators.numpy import NumpyMatrixOperator
+from pymor.parameters.functionals import (
+    ConjugateParameterFunctional,
+    ExpressionParameterFunctional,
+    GenericParameterFunctional,
+    MaxThetaParameterFunctional,
+    MinThetaParameterFunctional,
+    ProjectionParameterFunctional,
+)
 
 pytestmark = pytest.mark.builtin
 
@@ -57,3 +67,33 @@ def test_LincombParameterFunctional():
     assert len(three_pf_named.coefficients) != len(three_pf_.coefficients)
     assert pf_times_pf_squared_named(mu) == pf_times_pf_squared(mu)
     assert len(pf_times_pf_squared_named.factors) != len(pf_times_pf_squared.factors)
+
+
+def test_evaluate_many():
+    parameters = {'mu': 2, 'nu': 1}
+    epf = ExpressionParameterFunctional('100 * mu[0]**2 + 2 * mu[1] * mu[0] + sin(nu[0])', parameters)
+    pf = ProjectionParameterFunctional('mu', 2, 1)
+    gpf = GenericParameterFunctional(lambda mu: mu['nu'][0] ** 2, {'nu': 1})
+    functionals = [
+        epf, pf, gpf,
+        ExpressionParameterFunctional('2.', parameters),
+        ExpressionParameterFunctional('[nu[0]]', parameters),
+        epf * pf * 3,
+        2 * epf - pf + gpf + 1,
+        ConjugateParameterFunctional(pf * 1j),
+        MinThetaParameterFunctional([pf, gpf + 1], Mu({'mu': [1, 1], 'nu': [1]})),
+        MaxThetaParameterFunctional([pf, epf, 2.], Mu({'mu': [1, 1], 'nu': [1]})),
+    ]
+
+    space = ExpressionParameterFunctional('1.', parameters).parameters.space(0.1, 1)
+    mus = space.sample_randomly(7)
+    for f in functionals:
+        stacked = np.array([np.hstack([mu[k] for k in f.parameters]) for mu in mus])
+        values = f.evaluate_many(mus)
+        assert values.shape == (len(mus),)
+        assert np.allclose(values, [f(mu) for mu in mus])
+        assert np.allclose(f.evaluate_many(stacked), values)
+        assert f.evaluate_many([]).shape == (0,)
+
+    op = LincombOperator([NumpyMatrixOperator(np.eye(2))] * len(functionals), functionals)
+    assert np.allclose(op.evaluate_coefficients_many(mus), [op.evaluate_coefficients(mu) for mu in mus])
@@ -0,0 +1,32 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import numpy as np
+import pytest
+
+from pymor.analyticalproblems.thermalblock import thermal_block_problem
+from pymor.discretizers.builtin import discretize_stationary_cg
+from pymor.parameters.functionals import ExpressionParameterFunctional
+from pymor.reductors.coercive import CoerciveRBReductor, SimpleCoerciveRBReductor
+
+pytestmark = pytest.mark.builtin
+
+
+@pytest.mark.parametrize('reductor_type', [CoerciveRBReductor, SimpleCoerciveRBReductor])
+def test_estimate_error_batch(reductor_type):
+    fom, _ = discretize_stationary_cg(thermal_block_problem((2, 2)), diameter=1/10)
+    fom.disable_caching()
+    coercivity_estimator = ExpressionParameterFunctional('min(diffusion)', fom.parameters)
+    reductor = reductor_type(fom, product=fom.h1_0_semi_product, coercivity_estimator=coercivity_estimator)
+
+    mus = fom.parameters.space(0.1, 1).sample_randomly(10)
+    for mu in mus[:3]:
+        reductor.extend_basis(fom.solve(mu))
+    rom = reductor.reduce()
+
+    U = rom.solve_batch(mus)
+    estimates = rom.error_estimator.estimate_error_batch(U, mus, rom)
+    assert estimates.shape == (len(mus),)
+    assert np.allclose(estimates, np.hstack([rom.estimate_error(mu) for mu in mus]))
+    assert np.allclose(rom.estimate_error_batch(mus), estimates)
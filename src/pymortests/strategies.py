@@ -2,6 +2,7 @@
 # Copyright pyMOR developers and contributors. All rights reserved.
 # License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
 import functools
+import tempfile
 
 import numpy as np
 from hypothesis import assume, given
@@ -81,6 +82,17 @@ def _numpy_vector_spaces(draw, np_data_list, compatible, count, dims):
     return [(NumpyVectorSpace(d), ar) for d, ar in zip(dims, np_data_list)]
 
 
+def _numpy_memmap_vector_spaces(draw, np_data_list, compatible, count, dims):
+    ret = []
+    for d, ar in zip(dims, np_data_list):
+        file = tempfile.TemporaryFile()
+        file.truncate(max(ar.nbytes, 1))
+        mm = np.memmap(file, dtype=ar.dtype, mode='r+', shape=(max(len(ar), 1), d))[:len(ar)]
+        mm[:] = ar
+        ret.append((NumpyVectorSpace(d), mm))
+    return ret
+
+
 def _numpy_list_vector_spaces(draw, np_data_list, compatible, count, dims):
     return [(NumpyListVectorSpace(d), ar) for d, ar in zip(dims, np_data_list)]
 
@@ -155,7 +167,7 @@ if config.HAVE_DUNEGDT:
     _other_vector_space_types.append('dunegdt')
 
 
-_picklable_vector_space_types = [] if BUILTIN_DISABLED else ['numpy', 'numpy_list', 'block']
+_picklable_vector_space_types = [] if BUILTIN_DISABLED else ['numpy', 'numpy_memmap', 'numpy_list', 'block']
 
 
 @hyst.composite
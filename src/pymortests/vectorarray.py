@@ -14,7 +14,13 @@ from pymor.algorithms.basic import almost_equal
 from pymor.core.config import config
 from pymor.tools.floatcmp import bounded, float_cmp
 from pymor.vectorarrays.interface import VectorSpace
-from pymor.vectorarrays.numpy import NumpyVectorSpace
+from pymor.vectorarrays.list import NumpyListVectorSpace, NumpyVector
+from pymor.vectorarrays.numpy import (
+    NumpyMemmapVectorArrayImpl,
+    NumpyVectorArray,
+    NumpyVectorSpace,
+    reallocation_statistics,
+)
 from pymortests.core.pickling import assert_picklable_without_dumps_function
 
 MAX_RNG_REALIZATIONS = 30
@@ -1041,6 +1047,109 @@ def test_pickle(vector_array):
     assert_picklable_without_dumps_function(vector_array)
 
 
+def test_numpy_memmap_blocked_operations():
+    rng = np.random.default_rng(0)
+    space = NumpyVectorSpace(7)
+    data = rng.random((23, 7))
+    V = space.from_numpy(data.copy())
+    U = NumpyVectorArray(space, NumpyMemmapVectorArrayImpl.zeros(0, 0, 7, chunk_size=5*7*8, block_size=3*7*8,
+                                                                  max_in_memory_size=0))
+    for i in range(0, 23, 4):
+        U.append(V[i:i+4])
+    assert isinstance(U.impl, NumpyMemmapVectorArrayImpl)
+    assert len(U.impl._array) == 25
+    assert np.all(U.to_numpy() == data)
+
+    ind = [3, 0, 22, 5, 5]
+    assert np.allclose(U[ind].inner(U), V[ind].inner(V))
+    assert np.allclose(V[ind].inner(U), V[ind].inner(V))
+    assert np.allclose(U[:0:-2].pairwise_inner(V[1::2]), V[:0:-2].pairwise_inner(V[1::2]))
+    assert np.allclose(U.norm(), V.norm())
+    assert np.allclose(U[1:20:3].norm2(), V[1:20:3].norm2())
+    assert np.all(U.dofs([6, 0]) == V.dofs([6, 0]))
+    assert np.all(np.array(U[ind].amax()) == np.array(V[ind].amax()))
+    coefficients = rng.random((2, 23))
+    W = U.lincomb(coefficients)
+    assert isinstance(W.impl, NumpyMemmapVectorArrayImpl)
+    assert np.allclose(W.to_numpy(), V.lincomb(coefficients).to_numpy())
+
+    U.axpy(2., V[0])
+    V.axpy(2., V[0].copy())
+    U[ind[:3]].scal(np.arange(3.))
+    V[ind[:3]].scal(np.arange(3.))
+    U.scal(1j)
+    V.scal(1j)
+    assert U.impl._array.dtype == np.complex128
+    assert np.allclose(U.to_numpy(), V.to_numpy())
+    del U[::3]
+    del V[::3]
+    assert np.allclose(U.to_numpy(), V.to_numpy())
+    assert np.allclose(U.conj().to_numpy(), V.conj().to_numpy())
+
+
+def test_numpy_append_amortized_growth():
+    space = NumpyVectorSpace(10)
+    U = space.empty()
+    reallocation_statistics(reset=True)
+    for i in range(1000):
+        U.append(space.full(i))
+    statistics = reallocation_statistics()
+    assert statistics['reallocations'] < 25
+    assert statistics['copied_bytes'] < 4 * 1000 * 10 * 8
+    assert np.all(U.to_numpy() == np.arange(1000)[:, np.newaxis])
+
+    U.shrink_to_fit()
+    assert len(U.impl._array) == 1000
+    assert reallocation_statistics(reset=True)['reallocations'] == statistics['reallocations'] + 1
+    assert reallocation_statistics()['reallocations'] == 0
+
+
+def test_numpy_axpy_does_not_copy_when_dtype_unchanged():
+    space = NumpyVectorSpace(5)
+    U = space.from_numpy(np.ones((100, 5)) + 1j)
+    V = space.ones()
+    array = U.impl._array
+    U[3].axpy(-1., V)
+    U[4].axpy(2, V)
+    assert U.impl._array is array
+    assert np.all(U.to_numpy()[3] == 1j)
+    assert np.all(U.to_numpy()[4] == 3 + 1j)
+    U[5].axpy(1j, V)
+    assert U.impl._array is array
+
+
+class _OpaqueNumpyVector(NumpyVector):
+
+    def buffer(self):
+        return None
+
+
+def test_list_vectorarray_packed_operations():
+    rng = np.random.default_rng(0)
+    space = NumpyListVectorSpace(9)
+    U = space.from_numpy(rng.random((6, 9)))
+    V = space.from_numpy(rng.random((4, 9)) + 1j * rng.random((4, 9)))
+    W = U.copy()
+    W.append(V)
+    O = space.make_array([_OpaqueNumpyVector(v.to_numpy()) for v in W.vectors])
+    A = W.to_numpy()
+
+    assert U.impl._packed(None, allow_copy=False) is not None
+    assert U[::2].impl._packed([0, 2, 4], allow_copy=False) is not None
+    assert W.impl._packed(None, allow_copy=False) is None
+    assert O.impl._packed(None) is None
+
+    coefficients = rng.random((3, 10))
+    for X in (W, O):
+        assert np.allclose(X.inner(U[::-1]), A.conj() @ A[5::-1].T)
+        assert np.allclose(X[1:].pairwise_inner(W[:-1]), np.sum(A[1:].conj() * A[:-1], axis=1))
+        assert np.allclose(X.gramian(), A.conj() @ A.T)
+        assert np.allclose(X.norm(), np.linalg.norm(A, axis=1))
+        assert np.allclose(X.norm2(), np.linalg.norm(A, axis=1)**2)
+        assert np.all(X.dofs([8, 1]) == A[:, [8, 1]])
+        assert np.allclose(X.lincomb(coefficients).to_numpy(), coefficients @ A)
+
+
 def test_numpyvectorspace_dim_must_be_int():
     with pytest.raises(AssertionError):
         _ = NumpyVectorSpace(5.)